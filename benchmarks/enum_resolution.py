@@ -0,0 +1,100 @@
+"""Measures how long it takes to turn the API's strings into enum members.
+
+Compares the library's resolvers with the way they used to work, which rebuilt their lookup
+dictionary on every call, for the strings found in leaderboard score parts and user saves.
+
+Usage: python benchmarks/enum_resolution.py [calls]
+"""
+import sys
+import timeit
+from bloonspy.model.btd6 import ScoreType, Gamemode, Difficulty, Mode, Power
+
+
+def legacy_score_type(value: str) -> ScoreType:
+    score_type_switch = {
+        "GameTime": ScoreType.GAME_TIME,
+        "CashSpent": ScoreType.LEAST_CASH,
+        "Tiers": ScoreType.LEAST_TIERS,
+        "Time after event start": ScoreType.TIME_AFTER_EVENT_START,
+        "LeastCash": ScoreType.LEAST_CASH,
+        "LeastTiers": ScoreType.LEAST_TIERS,
+    }
+    if value in score_type_switch:
+        return score_type_switch[value]
+    value = value.replace(" ", "")
+    if value in score_type_switch:
+        return score_type_switch[value]
+    return None
+
+
+def legacy_gamemode(difficulty: str, mode: str) -> Gamemode:
+    difficulty_switch = {
+        "Easy": Difficulty.EASY,
+        "Medium": Difficulty.MEDIUM,
+        "Hard": Difficulty.HARD,
+    }
+    mode_switch = {
+        "Standard": Mode.STANDARD,
+        "PrimaryOnly": Mode.PRIMARY_ONLY,
+        "Deflation": Mode.DEFLATION,
+        "MilitaryOnly": Mode.MILITARY_ONLY,
+        "Reverse": Mode.REVERSE,
+        "Apopalypse": Mode.APOPALYPSE,
+        "MagicOnly": Mode.MAGIC_ONLY,
+        "DoubleMoabHealth": Mode.DOUBLE_HP_MOABS,
+        "HalfCash": Mode.HALF_CASH,
+        "AlternateBloonsRounds": Mode.ALTERNATE_BLOONS_ROUNDS,
+        "Impoppable": Mode.IMPOPPABLE,
+        "Clicks": Mode.CHIMPS,
+    }
+    found_difficulty = difficulty_switch[difficulty] if difficulty in difficulty_switch else None
+    found_mode = mode_switch[mode] if mode in mode_switch else None
+    return Gamemode(found_difficulty, found_mode) if found_mode and found_difficulty else None
+
+
+def legacy_power(power: str) -> Power:
+    power_switch = {
+        "SuperMonkeyStorm": Power.SMS,
+        "MonkeyBoost": Power.MONKEY_BOOST,
+        "Thrive": Power.THRIVE,
+        "DartTime": Power.TIME_STOP,
+        "CashDrop": Power.PONTOON,
+        "BananaFarmer": Power.BANANA_FARMER,
+        "Pontoon": Power.CASH_DROP,
+        "RoadSpikes": Power.ROAD_SPIKES,
+        "GlueTrap": Power.GLUE_TRAP,
+        "MoabMine": Power.MOAB_MINE,
+        "CamoTrap": Power.CAMO_TRAP,
+        "PortableLake": Power.PORTABLE_LAKE,
+        "TechBot": Power.TECH_BOT,
+        "EnergisingTotem": Power.ENERGISING_TOTEM,
+    }
+    return power_switch[power] if power in power_switch else None
+
+
+SCORE_PARTS = ["Game Time", "Least Cash", "Least Tiers", "Time after event start", "Unknown Score"]
+GAMEMODES = [("Easy", "Standard"), ("Medium", "MilitaryOnly"), ("Hard", "Clicks"), ("Hard", "Impoppable")]
+POWERS = ["SuperMonkeyStorm", "CashDrop", "MonkeyBoost", "Unknown"]
+
+
+def measure(resolve: callable, values: list, calls: int) -> float:
+    rounds = calls // len(values)
+    seconds = min(timeit.repeat(lambda: [resolve(*value) for value in values], number=rounds, repeat=3))
+    return seconds / (rounds * len(values)) * 1e9
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    benchmarks = [
+        ("ScoreType.from_string", [(v,) for v in SCORE_PARTS], legacy_score_type, ScoreType.from_string),
+        ("Gamemode.from_strings", GAMEMODES, legacy_gamemode, Gamemode.from_strings),
+        ("Power.from_string", [(v,) for v in POWERS], legacy_power, Power.from_string),
+    ]
+    print(f"{calls:,} calls each")
+    for name, values, legacy, current in benchmarks:
+        before, after = measure(legacy, values, calls), measure(current, values, calls)
+        print(f"  {name:<24} {before:>7.1f} ns -> {after:>7.1f} ns per call ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
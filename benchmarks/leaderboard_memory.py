@@ -0,0 +1,69 @@
+"""Measures how much memory leaderboard entries take up.
+
+Builds the entries of a large leaderboard from fake API rows and reports the memory allocated
+per entry, both for the library's entry classes and for subclasses of them that eagerly set up
+their loaded data, like entries used to.
+
+Usage: python benchmarks/leaderboard_memory.py [rows]
+"""
+import gc
+import sys
+import tracemalloc
+from bloonspy.model.btd6 import RacePlayer, BossPlayer, CtPlayer
+from bloonspy.utils.api import Transport
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "displayName": f"player{i}",
+            "score": 100_000 + i,
+            "submissionTime": 1_700_000_000_000 + i,
+            "profile": f"https://data.ninjakiwi.com/btd6/users/{i:032x}",
+            "scoreParts": [{"score": 100_000 + i, "type": "time", "name": "Game Time"}],
+        }
+        for i in range(count)
+    ]
+
+
+def with_eager_data(cls: type) -> type:
+    class Legacy(cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._data  # Sets up the loaded data right away
+    Legacy.__name__ = f"{cls.__name__} (eager data)"
+    return Legacy
+
+
+def measure(build: callable, rows: list[dict]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = [build(row) for row in rows]
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entries
+    return allocated / len(rows)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+    transport = Transport()
+
+    def timed_entry(cls: type) -> callable:
+        return lambda row: cls(row["profile"].split("/")[-1], row["displayName"], row["score"],
+                               row["scoreParts"], row["submissionTime"], transport=transport)
+
+    def ct_entry(cls: type) -> callable:
+        return lambda row: cls(row["profile"].split("/")[-1], row["displayName"], row["score"], transport=transport)
+
+    print(f"{count:,} entries")
+    for cls, entry in [(RacePlayer, timed_entry), (BossPlayer, timed_entry), (CtPlayer, ct_entry)]:
+        for variant in [cls, with_eager_data(cls)]:
+            print(f"  {variant.__name__:<30} {measure(entry(variant), rows):>8.1f} bytes/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Measures how long it takes to parse a user's save.
+
+Compares reading a few fields of a save, which only parses the sections they're in, with
+reading every field, which parses the whole save like it used to be parsed when fetched.
+
+The save can be a body returned by /btd6/save/{oak}, recorded to a JSON file. If none is given,
+a save with every map, gamemode, tower and insta monkey is made up.
+
+Usage: python benchmarks/usersave_parsing.py [save.json]
+"""
+import json
+import sys
+import timeit
+from collections import defaultdict
+from bloonspy.model.btd6 import UserSave, Tower, Upgrade, MonkeyKnowledge, HeroSkin, Map, Achievement
+
+
+POWERS = [
+    "SuperMonkeyStorm", "MonkeyBoost", "Thrive", "DartTime", "CashDrop", "BananaFarmer", "Pontoon",
+    "RoadSpikes", "GlueTrap", "MoabMine", "CamoTrap", "PortableLake", "TechBot", "EnergisingTotem",
+]
+
+
+def make_save() -> dict:
+    modes = {
+        "Easy": ["Standard", "PrimaryOnly", "Deflation"],
+        "Medium": ["Standard", "MilitaryOnly", "Reverse", "Apopalypse"],
+        "Hard": ["Standard", "MagicOnly", "DoubleMoabHealth", "HalfCash", "AlternateBloonsRounds", "Impoppable", "Clicks"],
+    }
+    completion = {"completed": True, "completedWithoutLoadingSave": True, "bestRound": 100, "timesCompleted": 3}
+    map_progress = {
+        game_map.value.replace(" ", "").replace("'", ""): {
+            "complete": True,
+            "difficulty": {
+                diff: {
+                    "single": {mode: dict(completion) for mode in diff_modes},
+                    "coop": {mode: dict(completion) for mode in diff_modes},
+                }
+                for diff, diff_modes in modes.items()
+            },
+        }
+        for game_map in Map
+    }
+    tower_names = [tower.name.title().replace("_", "") for tower in Tower]
+    insta_paths = [f"{t}{m}{b}" for t in range(6) for m in range(6) for b in range(6)
+                   if min(t, m, b) == 0 and sum(p >= 3 for p in (t, m, b)) <= 1]
+    trophy_store = defaultdict(bool, {f"GameUIProfileAvatar{i}": True for i in range(100)})
+    trophy_store.update({f"GameUIProfileBanner{i}": True for i in range(100)})
+    return {
+        "latestGameVersion": "44.2",
+        "towerXP": {name: 1_000_000 for name in tower_names},
+        "acquiredUpgrades": {upgrade.value: True for upgrade in Upgrade if upgrade.value},
+        "acquiredKnowledge": {mk.value.replace(" ", ""): True for mk in MonkeyKnowledge},
+        "unlockedTowers": {name: True for name in tower_names},
+        "unlockedHeros": {name: True for name in tower_names[:14]},
+        "unlockedSkins": {skin.value.replace(" ", ""): True for skin in HeroSkin},
+        "gamesPlayed": 3000,
+        "powers": {power: {"quantity": 5, "isNew": False} for power in POWERS},
+        "instaTowers": {name: {path: 1 for path in insta_paths} for name in tower_names},
+        "monkeyMoney": 1000, "xp": 180_000_000, "rank": 155, "veteranXp": 161_489_560, "veteranRank": 9,
+        "trophies": 100, "lifetimeTrophies": 3000, "lifetimeTeamTrophies": 500, "knowledgePoints": 0,
+        "primaryHero": "Quincy",
+        "achievementsClaimed": [achievement.value for achievement in Achievement],
+        "highestSeenRound": 275, "dailyRewardCount": 420, "totalDailyChallengesCompleted": 198,
+        "consecutiveDailyChallengesCompleted": 3, "totalRacesEntered": 1200, "challengesPlayed": 300,
+        "challengesShared": 6, "totalCompletedOdysseys": 26,
+        "unlockedBigBloons": True, "bigBloonsActive": False, "unlockedSmallBloons": True, "smallBloonsActive": False,
+        "seenBigTowers": True, "bigTowersActive": False, "unlockedSmallTowers": True, "smallTowersActive": False,
+        "namedMonkeys": {"DartMonkey": "Dart"},
+        "collectionEventCratesOpened": 290, "continuesUsed": 160,
+        "trophyStoreItems": trophy_store,
+        "mapProgress": map_progress,
+    }
+
+
+def read_few(data: dict) -> None:
+    save = UserSave._parse_json(data)
+    save.monkey_money, save.rank, save.get_map_progress(Map.MONKEY_MEADOW)
+
+
+def read_all(data: dict) -> None:
+    save = UserSave._parse_json(data)
+    for name in dir(UserSave):
+        if isinstance(getattr(UserSave, name), property):
+            getattr(save, name)
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as save_file:
+            data = json.load(save_file)
+            data = data.get("body", data)
+    else:
+        data = make_save()
+
+    for name, parse in [("monkey_money, rank, one map", read_few), ("every field", read_all)]:
+        number, seconds = timeit.Timer(lambda: parse(data)).autorange()
+        print(f"  {name:<28} {seconds / number * 1e6:>10.1f} us per save")
+
+
+if __name__ == "__main__":
+    main()
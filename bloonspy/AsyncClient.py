@@ -1,6 +1,13 @@
 import asyncio
+import inspect
 import aiohttp
-from .utils.asyncapi import aget
+from typing import Iterable, Any
+from .utils.asyncapi import AsyncTransport
+from .utils.RateLimiter import RateLimiter
+from .utils.cache import ResponseCache
+from .utils.IdentityMap import IdentityMap
+from .model.Loadable import Loadable, group_duplicates
+from .exceptions import BloonsException
 from .model.btd6 import \
     OdysseyEvent, \
     BossEvent, \
@@ -24,33 +31,91 @@ class AsyncClient:
        properties do not have to be awaited. Only methods do.
        **If you have to use parenthesis, you should await.**
 
-    :param aiohttp_client: An aiohttp Client.
-    :type aiohttp_client: aiohttp.ClientSession
+    :param aiohttp_client: An aiohttp Client. *Changed in 0.12.0:* Optional. If `None`, the client creates its own
+        session tuned for the API, with :func:`~bloonspy.utils.asyncapi.create_session`, and closes it when
+        :func:`~bloonspy.AsyncClient.close` is called or when leaving ``async with AsyncClient() as client:``.
+        Sessions passed to the client aren't closed by it.
+    :type aiohttp_client: aiohttp.ClientSession | None
     :param open_access_key: Your OAK for the Ninja Kiwi Open Data API.
     :type open_access_key: str
+    :param rate_limiter: *New in 0.12.0*. Limits the requests made by this client, in total and per endpoint
+        family. It can be shared with other clients. If `None`, the client uses a rate limiter shared by the async
+        clients running on the same event loop, so clients on other loops or threads don't compete with it.
+        To keep several clients on one loop from starving each other, give each its own.
+    :type rate_limiter: ~bloonspy.utils.RateLimiter
+    :param cache: *New in 0.12.0*. Where to cache API responses. If `None`, responses aren't cached.
+        It can be shared with other clients.
+    :type cache: ~bloonspy.utils.cache.ResponseCache
+    :param identity_map: *New in 0.12.0*. If `True`, all objects the client creates for the same user, team,
+        challenge, or custom map share their loaded data, so each one only has to be loaded once.
+        See :class:`~bloonspy.utils.IdentityMap`.
+    :type identity_map: bool
+    :param pool_size: *New in 0.12.0*. Maximum number of connections to the API the client's own session keeps
+        open at the same time. Defaults to the rate limiter's `max_concurrent`. Ignored if `aiohttp_client` is given.
+    :type pool_size: int
+    :param timeout: *New in 0.12.0*. How long a request made through the client's own session can take,
+        in seconds. Ignored if `aiohttp_client` is given.
+    :type timeout: float
+    :param transport: *New in 0.12.0*. The transport to make requests with. If `None`, the client creates
+        its own. A transport passed to the client isn't closed by :func:`~bloonspy.AsyncClient.close`.
+    :type transport: ~bloonspy.utils.asyncapi.AsyncTransport
     """
 
-    def __init__(self, aiohttp_client: aiohttp.ClientSession, open_access_key: str = None):
+    def __init__(
+            self,
+            aiohttp_client: aiohttp.ClientSession | None = None,
+            open_access_key: str = None,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            identity_map: bool = False,
+            pool_size: int = None,
+            timeout: float = 30,
+            transport: AsyncTransport = None,
+    ):
         self.__oak = open_access_key
-        self._async_client = aiohttp_client
-        # if self._async_client is None:
-        #     asyncio.create_task(self._create_async_client())
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = AsyncTransport(aiohttp_client, rate_limiter=rate_limiter, cache=cache,
+                                       identity_map=IdentityMap() if identity_map else None,
+                                       pool_size=pool_size, timeout=timeout)
+        self._transport = transport
+        # The transport only holds a weak reference to sessions passed to it
+        self._aiohttp_client = aiohttp_client
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        *New in 0.12.0*
+
+        The aiohttp session the client makes requests with.
+        """
+        return self._transport.client
 
-    # async def _create_async_client(self):
-    #     async with aiohttp.ClientSession() as aclient:
-    #         self._async_client = aclient
-    #         while True:
-    #             await asyncio.sleep(60)
+    async def close(self) -> None:
+        """
+        *New in 0.12.0*
+
+        Close the client's session, if it created it.
+        """
+        if self._owns_transport:
+            await self._transport.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
 
     async def odysseys(self) -> list[OdysseyEvent]:
         """Get a list of Odyssey events."""
-        odysseys_data = await aget(self._async_client, "/btd6/odyssey")
+        odysseys_data = await self._transport.get_events("/btd6/odyssey")
         odyssey_list = []
         for odyssey in odysseys_data:
             odyssey_list.append(OdysseyEvent(
                 odyssey["id"],
                 event_json=odyssey,
-                async_client=self._async_client,
+                async_client=self.session,
+                transport=self._transport,
             ))
         return odyssey_list
 
@@ -73,20 +138,21 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no odyssey with that ID is found.
         """
-        odyssey = OdysseyEvent(odyssey_id, async_client=self._async_client)
+        odyssey = OdysseyEvent(odyssey_id, async_client=self.session, transport=self._transport)
         if eager:
             await odyssey.load_event()
         return odyssey
 
     async def contested_territories(self) -> list[ContestedTerritoryEvent]:
         """Get a list of Contested Territory events."""
-        ct_data = await aget(self._async_client, "/btd6/ct")
+        ct_data = await self._transport.get_events("/btd6/ct")
         ct_list = []
         for ct in ct_data:
             ct_list.append(ContestedTerritoryEvent(
                 ct["id"],
                 event_json=ct,
-                async_client=self._async_client,
+                async_client=self.session,
+                transport=self._transport,
             ))
         return ct_list
 
@@ -109,7 +175,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no CT with that ID is found.
         """
-        ct = ContestedTerritoryEvent(ct_id, async_client=self._async_client)
+        ct = ContestedTerritoryEvent(ct_id, async_client=self.session, transport=self._transport)
         if eager:
             await ct.load_event()
         return ct
@@ -125,7 +191,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no team with that ID is found.
         """
-        tm = Team(team_id, async_client=self._async_client)
+        tm = Team(team_id, async_client=self.session, transport=self._transport)
         await tm.load_resource()
         return tm
 
@@ -138,13 +204,14 @@ class AsyncClient:
            :attr:`~bloonspy.model.btd6.Race.start`, :attr:`~bloonspy.model.btd6.Race.end`, and
            :attr:`~bloonspy.model.btd6.Race.total_scores` loaded.
         """
-        races_data = await aget(self._async_client, "/btd6/races")
+        races_data = await self._transport.get_events("/btd6/races")
         race_list = []
         for race in races_data:
             race_list.append(Race(
                 race["id"],
                 race_json=race,
-                async_client=self._async_client,
+                async_client=self.session,
+                transport=self._transport,
             ))
         return race_list
 
@@ -167,20 +234,21 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no race with that ID is found.
         """
-        race = Race(race_id, async_client=self._async_client)
+        race = Race(race_id, async_client=self.session, transport=self._transport)
         if eager:
             await race.load_resource()
         return race
 
     async def bosses(self) -> list[BossEvent]:
         """Get a list of Boss events."""
-        bosses_data = await aget(self._async_client, "/btd6/bosses")
+        bosses_data = await self._transport.get_events("/btd6/bosses")
         boss_list = []
         for boss in bosses_data:
             boss_list.append(BossEvent(
                 boss["id"],
                 event_json=boss,
-                async_client=self._async_client,
+                async_client=self.session,
+                transport=self._transport,
             ))
         return boss_list
 
@@ -203,7 +271,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no boss event with that ID is found.
         """
-        boss = BossEvent(boss_id, async_client=self._async_client)
+        boss = BossEvent(boss_id, async_client=self.session, transport=self._transport)
         if eager:
             await boss.load_event()
         return boss
@@ -212,8 +280,9 @@ class AsyncClient:
             self,
             challenge_filter: ChallengeFilter,
             pages: int = 1,
-            start_from_page: int = 1
-    ) -> list[Challenge]:
+            start_from_page: int = 1,
+            raw: bool = False,
+    ) -> list[Challenge] | list[dict[str, Any]]:
         """Get a list of challenges given a specific filter.
 
         .. note::
@@ -227,41 +296,32 @@ class AsyncClient:
         :type pages: int
         :param start_from_page: The page to start fetching from.
         :type start_from_page: int
+        :param raw: *New in 0.12.0*. If `True`, returns the challenges exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of challenges (lazy loaded).
-        :rtype: list[:class:`bloonspy.model.btd6.Challenge`]
+        :rtype: list[:class:`bloonspy.model.btd6.Challenge`] | list[dict]
         """
 
         challenge_list = []
-        challenge_pages = []
-
-        async def get_page(page_num: int) -> None:
-            nonlocal challenge_pages
-            challenge_pages.append(
-                await aget(
-                    self._async_client,
-                    f"/btd6/challenges/filter/{challenge_filter.value}",
-                    {"page": page_num}
-                )
-            )
-
-        await asyncio.gather(*[
-            get_page(page_num) for page_num in range(start_from_page, start_from_page + pages)
+        challenge_pages = await asyncio.gather(*[
+            self._transport.get(f"/btd6/challenges/filter/{challenge_filter.value}", {"page": page_num})
+            for page_num in range(start_from_page, start_from_page + pages)
         ])
 
+        if raw:
+            return [chlg for page in challenge_pages for chlg in page]
         for page in challenge_pages:
             for chlg in page:
-                challenge_list.append(Challenge(chlg["id"], name=chlg["name"], created_at=chlg["createdAt"],
-                                                creator_id=chlg["creator"].split("/")[-1]))
-
-        # Make async
-        # if eager:
-        #     with ThreadPoolExecutor(max_workers=10) as executor:
-        #         futures = []
-        #         for challenge in challenge_list:
-        #             futures.append(executor.submit(challenge.load_resource))
-        #         concurrent.futures.wait(futures)
-
+                challenge_list.append(Challenge(
+                    chlg["id"],
+                    name=chlg["name"],
+                    created_at=chlg["createdAt"],
+                    creator_id=chlg["creator"].split("/")[-1],
+                    async_client=self.session,
+                    transport=self._transport,
+                ))
         return challenge_list
 
     async def get_challenge(self, challenge_id: str) -> Challenge:
@@ -275,7 +335,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no challenge with the given ID is found.
         """
-        chal = Challenge(challenge_id, async_client=self._async_client)
+        chal = Challenge(challenge_id, async_client=self.session, transport=self._transport)
         await chal.load_resource()
         return chal
 
@@ -290,7 +350,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no user with the given ID/OAK is found.
         """
-        usr = User(identifier, async_client=self._async_client)
+        usr = User(identifier, async_client=self.session, transport=self._transport)
         await usr.load_resource()
         return usr
 
@@ -305,7 +365,7 @@ class AsyncClient:
 
         :raise ~bloonspy.exceptions.NotFound: If no custom map with the given ID is found.
         """
-        cmap = CustomMap(map_id, async_client=self._async_client)
+        cmap = CustomMap(map_id, async_client=self.session, transport=self._transport)
         await cmap.load_resource()
         return cmap
 
@@ -313,8 +373,9 @@ class AsyncClient:
             self,
             custom_map_fliter: CustomMapFilter,
             pages: int = 1,
-            start_from_page: int = 1
-    ) -> list[CustomMap]:
+            start_from_page: int = 1,
+            raw: bool = False,
+    ) -> list[CustomMap] | list[dict[str, Any]]:
         """Get a list of challenges given a specific filter.
 
         .. note::
@@ -328,28 +389,22 @@ class AsyncClient:
         :type pages: int
         :param start_from_page: The page to start fetching from.
         :type start_from_page: int
+        :param raw: *New in 0.12.0*. If `True`, returns the custom maps exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of custom maps (lazy loaded).
-        :rtype: list[:class:`bloonspy.model.btd6.CustomMap`]
+        :rtype: list[:class:`bloonspy.model.btd6.CustomMap`] | list[dict]
         """
 
         custom_map_list = []
-        custom_map_pages = []
-
-        async def get_page(page_num: int) -> None:
-            nonlocal custom_map_pages
-            custom_map_pages.append(
-                await aget(
-                    self._async_client,
-                    f"/btd6/maps/filter/{custom_map_fliter.value}",
-                    {"page": page_num}
-                )
-            )
-
-        await asyncio.gather(*[
-            get_page(page_num) for page_num in range(start_from_page, start_from_page + pages)
+        custom_map_pages = await asyncio.gather(*[
+            self._transport.get(f"/btd6/maps/filter/{custom_map_fliter.value}", {"page": page_num})
+            for page_num in range(start_from_page, start_from_page + pages)
         ])
 
+        if raw:
+            return [cmap for page in custom_map_pages for cmap in page]
         for page in custom_map_pages:
             for cmap in page:
                 custom_map_list.append(CustomMap(
@@ -357,7 +412,55 @@ class AsyncClient:
                     name=cmap["name"],
                     created_at=cmap["createdAt"],
                     creator_id=cmap["creator"].split("/")[-1],
-                    async_client=self._async_client,
+                    async_client=self.session,
+                    transport=self._transport,
                 ))
 
         return custom_map_list
+
+    async def load_many(
+            self,
+            resources: Iterable[Loadable],
+            only_if_unloaded: bool = True,
+            max_concurrent: int = None,
+    ) -> list[Loadable | Exception]:
+        """
+        *New in 0.12.0*
+
+        Load many resources at once, such as the players of a leaderboard or the results of
+        :func:`~bloonspy.AsyncClient.challenges`. Resources are loaded in place. ::
+
+           players = await race.leaderboard(pages=2)
+           await client.load_many(players)
+
+        If several objects represent the same resource, it's only loaded once. If a resource
+        fails to load, the others still are.
+
+        :param resources: The resources to load.
+        :type resources: Iterable[~bloonspy.model.Loadable]
+        :param only_if_unloaded: Only make API calls for resources that are unloaded.
+        :type only_if_unloaded: bool
+        :param max_concurrent: How many resources can be loading at the same time. Defaults to
+            the rate limiter's `max_concurrent`.
+        :type max_concurrent: int
+
+        :return: Each resource, without duplicates and in the order given, or the exception
+            raised while loading it if it failed to load.
+        :rtype: list[~bloonspy.model.Loadable | Exception]
+        """
+        if max_concurrent is None:
+            max_concurrent = self._transport.rate_limiter.max_concurrent
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def load(group: list[Loadable]) -> Loadable:
+            async with semaphore:
+                loading = group[0].load_resource(only_if_unloaded)
+                if inspect.isawaitable(loading):
+                    await loading
+                if not group[0].loaded:
+                    raise BloonsException(f"Couldn't load {group[0]._resource_key()}")
+            for duplicate in group[1:]:
+                group[0]._share_loaded_data(duplicate)
+            return group[0]
+
+        return await asyncio.gather(*[load(group) for group in group_duplicates(resources)], return_exceptions=True)
@@ -1,7 +1,12 @@
 import concurrent.futures
-from typing import List
-from concurrent.futures import ThreadPoolExecutor
-from .utils.api import get
+from typing import List, Iterable, Dict, Any
+from .utils.api import Transport, default_transport
+from .utils.RateLimiter import RateLimiter
+from .utils.cache import ResponseCache
+from .utils.IdentityMap import IdentityMap
+from .utils.decorators import client_method
+from .model.Loadable import Loadable, group_duplicates
+from .exceptions import BloonsException
 from .model.btd6 import \
     OdysseyEvent, \
     BossEvent, \
@@ -15,23 +20,86 @@ from .model.btd6 import \
 class Client:
     """Client for all API calls.
 
+    All methods can also be called on the class itself, in which case a default client
+    shared by the whole library is used.
+
     :param open_access_key: Your OAK for the Ninja Kiwi Open Data API.
     :type open_access_key: str
+    :param pool_size: *New in 0.12.0*. Maximum number of connections to the API kept open at the same time.
+    :type pool_size: int
+    :param rate_limiter: *New in 0.12.0*. Limits the requests made by this client. It can be shared with
+        other clients, including an :class:`~bloonspy.AsyncClient`. If `None`, the rate limiter shared by
+        the whole library is used.
+    :type rate_limiter: ~bloonspy.utils.RateLimiter
+    :param cache: *New in 0.12.0*. Where to cache API responses. If `None`, responses aren't cached.
+    :type cache: ~bloonspy.utils.cache.ResponseCache
+    :param transport: *New in 0.12.0*. The transport to make requests with. If `None`, the client creates
+        its own and closes it when :func:`~bloonspy.Client.close` is called.
+    :type transport: ~bloonspy.utils.api.Transport
+    :param max_workers: *New in 0.12.0*. How many threads the client uses to fetch several pages at the
+        same time. The threads are kept around between calls. Defaults to `pool_size`.
+    :type max_workers: int
+    :param identity_map: *New in 0.12.0*. If `True`, all objects the client creates for the same user, team,
+        challenge, or custom map share their loaded data, so each one only has to be loaded once.
+        See :class:`~bloonspy.utils.IdentityMap`.
+    :type identity_map: bool
     """
-    def __init__(self, open_access_key: str):
+    _default_client = None
+
+    def __init__(
+            self,
+            open_access_key: str = None,
+            pool_size: int = 10,
+            rate_limiter: RateLimiter = None,
+            cache: ResponseCache = None,
+            transport: Transport = None,
+            max_workers: int = None,
+            identity_map: bool = False,
+    ):
         self.__oak = open_access_key
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = Transport(pool_size=pool_size, rate_limiter=rate_limiter, cache=cache,
+                                  max_workers=max_workers, identity_map=IdentityMap() if identity_map else None)
+        self._transport = transport
+
+    @classmethod
+    def default(cls) -> "Client":
+        """
+        *New in 0.12.0*
+
+        The client used when calling methods on the class itself.
+        """
+        if cls._default_client is None:
+            cls._default_client = cls(transport=default_transport())
+        return cls._default_client
+
+    def close(self) -> None:
+        """
+        *New in 0.12.0*
 
-    @staticmethod
-    def odysseys() -> List[OdysseyEvent]:
+        Shut down the client's threads and close all connections it kept open.
+        """
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @client_method
+    def odysseys(self) -> List[OdysseyEvent]:
         """Get a list of Odyssey events."""
-        odysseys_data = get("/btd6/odyssey")
+        odysseys_data = self._transport.get_events("/btd6/odyssey")
         odyssey_list = []
         for odyssey in odysseys_data:
-            odyssey_list.append(OdysseyEvent(odyssey["id"], event_json=odyssey))
+            odyssey_list.append(OdysseyEvent(odyssey["id"], event_json=odyssey, transport=self._transport))
         return odyssey_list
 
-    @staticmethod
-    def get_odyssey(odyssey_id: str, eager: bool = False) -> OdysseyEvent:
+    @client_method
+    def get_odyssey(self, odyssey_id: str, eager: bool = False) -> OdysseyEvent:
         """Fetch a specific Odyssey by its ID.
 
         .. note::
@@ -50,19 +118,19 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no odyssey with that ID is found.
         """
-        return OdysseyEvent(odyssey_id, eager=eager)
+        return OdysseyEvent(odyssey_id, eager=eager, transport=self._transport)
 
-    @staticmethod
-    def contested_territories() -> List[ContestedTerritoryEvent]:
+    @client_method
+    def contested_territories(self) -> List[ContestedTerritoryEvent]:
         """Get a list of Contested Territory events."""
-        ct_data = get("/btd6/ct")
+        ct_data = self._transport.get_events("/btd6/ct")
         ct_list = []
         for ct in ct_data:
-            ct_list.append(ContestedTerritoryEvent(ct["id"], event_json=ct))
+            ct_list.append(ContestedTerritoryEvent(ct["id"], event_json=ct, transport=self._transport))
         return ct_list
 
-    @staticmethod
-    def get_contested_territory(ct_id: str, eager: bool = False) -> ContestedTerritoryEvent:
+    @client_method
+    def get_contested_territory(self, ct_id: str, eager: bool = False) -> ContestedTerritoryEvent:
         """Fetch a specific Contested Territory event by its ID.
 
         .. note::
@@ -81,10 +149,10 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no CT with that ID is found.
         """
-        return ContestedTerritoryEvent(ct_id, eager=eager)
+        return ContestedTerritoryEvent(ct_id, eager=eager, transport=self._transport)
 
-    @staticmethod
-    def get_team(team_id: str) -> Team:
+    @client_method
+    def get_team(self, team_id: str) -> Team:
         """Fetch a specific team by its ID.
 
         :param team_id: The ID of the team.
@@ -95,10 +163,10 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no team with that ID is found.
         """
-        return Team(team_id, eager=True)
+        return Team(team_id, eager=True, transport=self._transport)
 
-    @staticmethod
-    def races() -> List[Race]:
+    @client_method
+    def races(self) -> List[Race]:
         """Get a list of Race events.
 
         .. note::
@@ -107,14 +175,14 @@ class Client:
            :attr:`~bloonspy.model.btd6.Race.start`, :attr:`~bloonspy.model.btd6.Race.end`, and
            :attr:`~bloonspy.model.btd6.Race.total_scores` loaded.
         """
-        races_data = get("/btd6/races")
+        races_data = self._transport.get_events("/btd6/races")
         race_list = []
         for race in races_data:
-            race_list.append(Race(race["id"], race_json=race))
+            race_list.append(Race(race["id"], race_json=race, transport=self._transport))
         return race_list
 
-    @staticmethod
-    def get_race(race_id: str, eager: bool = False) -> Race:
+    @client_method
+    def get_race(self, race_id: str, eager: bool = False) -> Race:
         """Fetch a specific Race by its ID.
 
         .. note::
@@ -133,19 +201,19 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no race with that ID is found.
         """
-        return Race(race_id, eager=eager)
+        return Race(race_id, eager=eager, transport=self._transport)
 
-    @staticmethod
-    def bosses() -> List[BossEvent]:
+    @client_method
+    def bosses(self) -> List[BossEvent]:
         """Get a list of Boss events."""
-        bosses_data = get("/btd6/bosses")
+        bosses_data = self._transport.get_events("/btd6/bosses")
         boss_list = []
         for boss in bosses_data:
-            boss_list.append(BossEvent(boss["id"], event_json=boss))
+            boss_list.append(BossEvent(boss["id"], event_json=boss, transport=self._transport))
         return boss_list
 
-    @staticmethod
-    def get_boss(boss_id: str, eager: bool = False) -> BossEvent:
+    @client_method
+    def get_boss(self, boss_id: str, eager: bool = False) -> BossEvent:
         """Fetch a specific Boss event by its ID.
 
         .. note::
@@ -164,16 +232,23 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no boss event with that ID is found.
         """
-        return BossEvent(boss_id, eager=eager)
-
-    @staticmethod
-    def challenges(challenge_filter: ChallengeFilter, pages: int = 1, start_from_page: int = 1) -> List[Challenge]:
+        return BossEvent(boss_id, eager=eager, transport=self._transport)
+
+    @client_method
+    def challenges(
+            self,
+            challenge_filter: ChallengeFilter,
+            pages: int = 1,
+            start_from_page: int = 1,
+            raw: bool = False,
+    ) -> List[Challenge] | List[Dict[str, Any]]:
         """Get a list of challenges given a specific filter.
         
         .. note::
            The returned :class:`~bloonspy.model.btd6.Challenge` objects will only
            have the properties :attr:`~bloonspy.model.Loadable.id`, :attr:`~bloonspy.model.btd6.Challenge.name`,
            :attr:`~bloonspy.model.Challenge.created_at`, and :attr:`~bloonspy.model.Challenge.creator_id` loaded.
+           To load them all at once, use :func:`~bloonspy.Client.load_many`.
 
         :param challenge_filter: Which type of challenges you'd like to see.
         :type challenge_filter: ~bloonspy.model.btd6.ChallengeFilter
@@ -181,33 +256,31 @@ class Client:
         :type pages: int
         :param start_from_page: The page to start fetching from.
         :type start_from_page: int
+        :param raw: *New in 0.12.0*. If `True`, returns the challenges exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of challenges (lazy loaded).
-        :rtype: List[:class:`bloonspy.model.btd6.Challenge`]
+        :rtype: List[:class:`bloonspy.model.btd6.Challenge`] | List[dict]
         """
 
         challenge_list = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            challenge_pages = []
-            for page_num in range(start_from_page, start_from_page+pages):
-                challenge_pages.append(executor.submit(
-                    get, f"/btd6/challenges/filter/{challenge_filter.value}", {"page": page_num}
-                ))
-            for page in challenge_pages:
-                for chlg in page.result():
-                    challenge_list.append(Challenge(chlg["id"], name=chlg["name"], created_at=chlg["createdAt"],
-                                                    creator_id=chlg["creator"].split("/")[-1]))
-        # if eager:
-        #     with ThreadPoolExecutor(max_workers=10) as executor:
-        #         futures = []
-        #         for challenge in challenge_list:
-        #             futures.append(executor.submit(challenge.load_resource))
-        #         concurrent.futures.wait(futures)
-
+        challenge_pages = []
+        for page_num in range(start_from_page, start_from_page+pages):
+            challenge_pages.append(self._transport.executor.submit(
+                self._transport.get, f"/btd6/challenges/filter/{challenge_filter.value}", {"page": page_num}
+            ))
+        if raw:
+            return [chlg for page in challenge_pages for chlg in page.result()]
+        for page in challenge_pages:
+            for chlg in page.result():
+                challenge_list.append(Challenge(chlg["id"], name=chlg["name"], created_at=chlg["createdAt"],
+                                                creator_id=chlg["creator"].split("/")[-1],
+                                                transport=self._transport))
         return challenge_list
 
-    @staticmethod
-    def get_challenge(challenge_id: str) -> Challenge:
+    @client_method
+    def get_challenge(self, challenge_id: str) -> Challenge:
         """Fetch a specific challenge by its ID.
 
         :param challenge_id: The challenge ID.
@@ -218,10 +291,10 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no challenge with the given ID is found.
         """
-        return Challenge(challenge_id, eager=True)
+        return Challenge(challenge_id, eager=True, transport=self._transport)
 
-    @staticmethod
-    def get_user(identifier: str) -> User:
+    @client_method
+    def get_user(self, identifier: str) -> User:
         """Fetch a specific user by an identifier.
 
         :param identifier: The user ID, or its OAK.
@@ -232,10 +305,10 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no user with the given ID/OAK is found.
         """
-        return User(identifier, eager=True)
+        return User(identifier, eager=True, transport=self._transport)
 
-    @staticmethod
-    def get_custom_map(map_id: str) -> CustomMap:
+    @client_method
+    def get_custom_map(self, map_id: str) -> CustomMap:
         """Fetch a specific custom map by its ID.
 
         :param map_id: The map code.
@@ -246,10 +319,16 @@ class Client:
 
         :raise ~bloonspy.exceptions.NotFound: If no custom map with the given ID is found.
         """
-        return CustomMap(map_id, eager=True)
-
-    @staticmethod
-    def custom_maps(custom_map_fliter: CustomMapFilter, pages: int = 1, start_from_page: int = 1) -> List[CustomMap]:
+        return CustomMap(map_id, eager=True, transport=self._transport)
+
+    @client_method
+    def custom_maps(
+            self,
+            custom_map_fliter: CustomMapFilter,
+            pages: int = 1,
+            start_from_page: int = 1,
+            raw: bool = False,
+    ) -> List[CustomMap] | List[Dict[str, Any]]:
         """Get a list of challenges given a specific filter.
 
         .. note::
@@ -263,21 +342,79 @@ class Client:
         :type pages: int
         :param start_from_page: The page to start fetching from.
         :type start_from_page: int
+        :param raw: *New in 0.12.0*. If `True`, returns the custom maps exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of custom maps (lazy loaded).
-        :rtype: List[:class:`bloonspy.model.btd6.CustomMap`]
+        :rtype: List[:class:`bloonspy.model.btd6.CustomMap`] | List[dict]
         """
 
         custom_map_list = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            custom_map_pages = []
-            for page_num in range(start_from_page, start_from_page + pages):
-                custom_map_pages.append(executor.submit(
-                    get, f"/btd6/maps/filter/{custom_map_fliter.value}", {"page": page_num}
-                ))
-            for page in custom_map_pages:
-                for map in page.result():
-                    custom_map_list.append(CustomMap(map["id"], name=map["name"], created_at=map["createdAt"],
-                                                     creator_id=map["creator"].split("/")[-1]))
+        custom_map_pages = []
+        for page_num in range(start_from_page, start_from_page + pages):
+            custom_map_pages.append(self._transport.executor.submit(
+                self._transport.get, f"/btd6/maps/filter/{custom_map_fliter.value}", {"page": page_num}
+            ))
+        if raw:
+            return [map for page in custom_map_pages for map in page.result()]
+        for page in custom_map_pages:
+            for map in page.result():
+                custom_map_list.append(CustomMap(map["id"], name=map["name"], created_at=map["createdAt"],
+                                                 creator_id=map["creator"].split("/")[-1],
+                                                 transport=self._transport))
 
         return custom_map_list
+
+    @client_method
+    def load_many(
+            self,
+            resources: Iterable[Loadable],
+            only_if_unloaded: bool = True,
+            max_concurrent: int = None,
+    ) -> List[Loadable | Exception]:
+        """
+        *New in 0.12.0*
+
+        Load many resources at once, such as the players of a leaderboard or the results of
+        :func:`~bloonspy.Client.challenges`. Resources are loaded in place. ::
+
+           players = race.leaderboard(pages=2)
+           client.load_many(players)
+
+        If several objects represent the same resource, it's only loaded once. If a resource
+        fails to load, the others still are.
+
+        :param resources: The resources to load.
+        :type resources: Iterable[~bloonspy.model.Loadable]
+        :param only_if_unloaded: Only make API calls for resources that are unloaded.
+        :type only_if_unloaded: bool
+        :param max_concurrent: How many resources can be loading at the same time.
+            Defaults to the client's `max_workers`.
+        :type max_concurrent: int
+
+        :return: Each resource, without duplicates and in the order given, or the exception
+            raised while loading it if it failed to load.
+        :rtype: List[~bloonspy.model.Loadable | Exception]
+        """
+        def load(group: List[Loadable]) -> None:
+            group[0].load_resource(only_if_unloaded)
+            if not group[0].loaded:
+                raise BloonsException(f"Couldn't load {group[0]._resource_key()}")
+            for duplicate in group[1:]:
+                group[0]._share_loaded_data(duplicate)
+
+        groups = group_duplicates(resources)
+        executor = self._transport.executor
+        if max_concurrent is None:
+            max_concurrent = self._transport.max_workers
+
+        futures = []
+        running = set()
+        for group in groups:
+            if len(running) >= max_concurrent:
+                _, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            futures.append(executor.submit(load, group))
+            running.add(futures[-1])
+
+        return [future.exception() or group[0] for group, future in zip(groups, futures)]
@@ -1,8 +1,12 @@
 from dataclasses import dataclass
+from ..utils.Interner import Interner
 
 
-@dataclass
+@dataclass(frozen=True)
 class Asset:
     """A game asset."""
     name: str  #: The name of the asset.
     url: str  #: The URL of the asset.
+
+
+asset_interner = Interner(Asset)
@@ -1,10 +1,12 @@
+import threading
 from typing import Dict, Any, List
 from datetime import datetime
 import aiohttp
 from ..utils.dictionaries import has_all_keys
 from ..utils.decorators import fetch_property, exception_handler
-from ..utils.api import get
-from ..utils.asyncapi import aget
+from ..utils.api import Transport, default_transport
+from ..utils.asyncapi import AsyncTransport, session_transport
+from ..utils.SharedLoad import SharedLoad
 from ..exceptions import NotFound
 from typing import Awaitable
 
@@ -22,24 +24,43 @@ class Event:
     event_endpoint: str = "/..."
     event_dict_keys: List[str] = ["name", "start", "end"]
     event_name: str = "event"
+    # Attributes tied to the process the object was made in, left out when pickled
+    _unpickled_attrs: tuple[str, ...] = ("_async_client", "_transport", "_load_lock", "_shared_load")
 
     def __init__(
             self,
             event_id: str,
             eager: bool = False,
             event_json: Dict[str, Any] = None,
-            async_client: aiohttp.ClientSession | None = None
+            async_client: aiohttp.ClientSession | None = None,
+            transport: Transport | AsyncTransport | None = None,
     ):
         self._id = event_id
         self._data = {}
         self._event_loaded = False
+        self._load_lock = threading.RLock()
+        self._shared_load = SharedLoad()
         self._async_client = async_client
+        if transport is None:
+            transport = session_transport(async_client) if async_client else default_transport()
+        self._transport = transport
 
         if event_json and has_all_keys(event_json, self.event_dict_keys):
             self._parse_event(event_json)
         if eager and not self._event_loaded and self._async_client is None:
             self.load_event()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # An unpickled event makes its requests through the default transport
+        return {name: value for name, value in self.__dict__.items() if name not in self._unpickled_attrs}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._async_client = None
+        self._transport = default_transport()
+        self._load_lock = threading.RLock()
+        self._shared_load = SharedLoad()
+
     def handle_exceptions(self, exception: Exception) -> None:
         return self._handle_exceptions(exception)
 
@@ -59,25 +80,30 @@ class Event:
 
         :raises bloonspy.exceptions.NotFound: If the resource is not found.
         """
-        if self._event_loaded and only_if_unloaded:
-            return
+        def on_data_fetched(event: dict | None) -> None:
+            if event is None:
+                raise NotFound(f"No {self.event_name} with that ID exists")
+            self._parse_event(event)
 
-        self._event_loaded = False
-
-        def on_data_fetched(event_list: list[dict]) -> None:
-            for event in event_list:
-                if event["id"] == self._id:
-                    self._parse_event(event)
-                    return
-            raise NotFound(f"No {self.event_name} with that ID exists")
+        async def async_fetch_event() -> None:
+            event = await self._transport.get_event(self.event_endpoint, self._id, refresh=not only_if_unloaded)
+            on_data_fetched(event)
 
-        async def async_load_event():
-            event_list = await aget(self._async_client, self.event_endpoint)
-            on_data_fetched(event_list)
+        async def async_load_event() -> None:
+            if self._event_loaded and only_if_unloaded:
+                return
+            await self._shared_load.run(async_fetch_event)
 
         if self._async_client:
             return async_load_event()
-        on_data_fetched(get(self.event_endpoint))
+        if self._event_loaded and only_if_unloaded:
+            return
+        with self._load_lock:
+            # Another thread might have loaded it while this one was waiting
+            if self._event_loaded and only_if_unloaded:
+                return
+            self._event_loaded = False
+            on_data_fetched(self._transport.get_event(self.event_endpoint, self._id, refresh=not only_if_unloaded))
 
     def _parse_event(self, data: Dict[str, Any]) -> None:
         self._data["name"] = data["name"]
@@ -1,14 +1,19 @@
 from dataclasses import dataclass
 from typing import Union
+from ..utils.Interner import Interner
 
 
-@dataclass
+@dataclass(frozen=True)
 class GameVersion:
     major: int  #: The major version of the game.
     minor: int  #: The minor version of the game.
 
     @staticmethod
     def from_string(version: Union[str, int]) -> "GameVersion":
+        return version_interner(version)
+
+    @staticmethod
+    def _parse(version: Union[str, int]) -> "GameVersion":
         if version == 0:
             return GameVersion(0, 0)
 
@@ -26,3 +31,6 @@ class GameVersion:
 
     def __repr__(self) -> str:
         return str(self)
+
+
+version_interner = Interner(GameVersion._parse)
@@ -1,8 +1,9 @@
-from typing import Awaitable, Any
+from typing import Awaitable, Any, Iterable
 import aiohttp
-from ..utils.api import get
-from ..utils.asyncapi import aget
+from ..utils.api import Transport, default_transport
+from ..utils.asyncapi import AsyncTransport, session_transport
 from ..utils.decorators import exception_handler
+from ..utils.IdentityMap import ResourceState
 from ..exceptions import NotLoaded
 
 
@@ -15,21 +16,73 @@ class Loadable:
 
           Checks if the Event is equal to another Event.
     """
+    __slots__ = ("_id", "_data", "_state", "_async_client", "_transport", "__weakref__")
     endpoint = "{}"
+    _identity_mapped: bool = False
+    # Attributes tied to the process the object was made in, left out when pickled
+    _unpickled_attrs: tuple[str, ...] = ("_data", "_state", "_async_client", "_transport", "__weakref__", "__dict__")
 
     def __init__(
             self,
             resource_id: str,
             eager: bool = False,
             async_client: aiohttp.ClientSession | None = None,
+            transport: Transport | AsyncTransport | None = None,
     ):
         self._id = resource_id
-        self._data = {}
-        self._loaded = False
         self._async_client = async_client
+        if transport is None:
+            transport = session_transport(async_client) if async_client else default_transport()
+        self._transport = transport
         if eager and self._async_client is None:
             self.load_resource()
 
+    def __getattr__(self, name: str) -> Any:
+        # The loaded data is only set up when it's first needed, since
+        # most leaderboard entries are never loaded.
+        if name == "_state" or name == "_data":
+            if self._identity_mapped and self._transport.identity_map is not None:
+                self._state = self._transport.identity_map.state(self._resource_key())
+            else:
+                self._state = ResourceState()
+            self._data = self._state.data
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Only the resource's data is kept. An unpickled resource makes its requests
+        # through the default transport.
+        state = {
+            name: value for name, value in getattr(self, "__dict__", {}).items()
+            if name not in self._unpickled_attrs
+        }
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name in self._unpickled_attrs:
+                    continue
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        try:
+            resource_state = Loadable._state.__get__(self)
+        except AttributeError:
+            pass
+        else:
+            state["_state"] = (dict(resource_state.data), resource_state.loaded)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state = dict(state)
+        loaded_state = state.pop("_state", None)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._async_client = None
+        self._transport = default_transport()
+        if loaded_state is not None:
+            self._data.update(loaded_state[0])
+            self._loaded = loaded_state[1]
+
     def handle_exceptions(self, exception: Exception) -> None:
         return self._handle_exceptions(exception)
 
@@ -46,19 +99,27 @@ class Loadable:
 
         :raises bloonspy.exceptions.NotFound: If the resource is not found.
         """
-        if self._loaded and only_if_unloaded:
-            return
-
         def on_data_load(data) -> None:
             self._parse_json(data)
 
-        async def async_load() -> None:
-            data = await aget(self._async_client, self.endpoint.format(self._id))
+        async def async_fetch() -> None:
+            data = await self._transport.get(self.endpoint.format(self._id))
             on_data_load(data)
 
+        async def async_load() -> None:
+            if self._loaded and only_if_unloaded:
+                return
+            await self._state.shared_load.run(async_fetch)
+
         if self._async_client:
             return async_load()
-        on_data_load(get(self.endpoint.format(self._id)))
+        if self._loaded and only_if_unloaded:
+            return
+        with self._state.lock:
+            # Another thread might have loaded it while this one was waiting
+            if self._loaded and only_if_unloaded:
+                return
+            on_data_load(self._transport.get(self.endpoint.format(self._id)))
 
     @staticmethod
     def _should_load_property(key_name: str) -> callable:
@@ -69,6 +130,22 @@ class Loadable:
     def _parse_json(self, raw_user: dict[str, Any]) -> None:
         self._loaded = True
 
+    def _resource_key(self) -> str:
+        return self.endpoint.format(self._id)
+
+    def _share_loaded_data(self, other: "Loadable") -> None:
+        """Give another object representing the same resource the data loaded by this one."""
+        other._data.update(self._data)
+        other._loaded = self._loaded
+
+    @property
+    def _loaded(self) -> bool:
+        return self._state.loaded
+
+    @_loaded.setter
+    def _loaded(self, value: bool) -> None:
+        self._state.loaded = value
+
     @property
     def id(self) -> str:
         """The unique ID of the resource."""
@@ -81,3 +158,11 @@ class Loadable:
 
     def __eq__(self, other):
         return isinstance(other, type(self)) and other.id == self.id
+
+
+def group_duplicates(resources: Iterable[Loadable]) -> list[list[Loadable]]:
+    """Group objects representing the same resource, in the order they first appear."""
+    groups = {}
+    for resource in resources:
+        groups.setdefault(resource._resource_key(), []).append(resource)
+    return list(groups.values())
@@ -1,17 +1,15 @@
-import asyncio
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Awaitable
+from typing import Any, Awaitable, Iterator, AsyncIterator
 from ...exceptions import BadTeamSize
 from ...utils.decorators import fetch_property, exception_handler
-from ...utils.api import get_lb_page
-from ...utils.asyncapi import aget_lb_page
+from ...utils.EnumResolver import EnumResolver
 from ..Loadable import Loadable
 from ..Event import Event
 from .Challenge import Challenge
 from .User import User
 from .Score import Score, ScoreType
+from .Leaderboard import Leaderboard
 
 
 class BossBloon(Enum):
@@ -26,22 +24,17 @@ class BossBloon(Enum):
 
     @staticmethod
     def from_string(boss: str) -> "BossBloon":
-        boss_switch = {
-            "vortex": BossBloon.VORTEX,
-            "bloonarius": BossBloon.BLOONARIUS,
-            "lych": BossBloon.LYCH,
-            "dreadbloon": BossBloon.DREADBLOON,
-            "phayze": BossBloon.PHAYZE,
-            "blastapopoulos": BossBloon.BLASTAPOPOULOS,
-            "diamondback": BossBloon.DIAMONDBACK,
-        }
-        return boss_switch.get(boss, None)
+        return boss_resolver(boss)
+
+
+boss_resolver = EnumResolver(BossBloon, key=lambda value: value)
 
 
 class BossPlayer(User):
     """An user who played the boss event and submitted a ranked score.
     Inherits from :class:`~bloonspy.model.btd6.User`.
     """
+    __slots__ = ("_name", "_score", "_score_parts", "_submission_time")
     def __init__(self,
                  user_id: str,
                  name: str,
@@ -162,7 +155,11 @@ class Boss(Challenge):
             pages: int = 1,
             start_from_page: int = 1,
             team_size: int = 1,
-    ) -> Awaitable[list[BossPlayer] | list[BossPlayerTeam]] | list[BossPlayer] | list[BossPlayerTeam]:
+            all_pages: bool = False,
+            columnar: bool = False,
+            raw: bool = False,
+    ) -> Awaitable[list[BossPlayer] | list[BossPlayerTeam] | Leaderboard | list[dict[str, Any]]] | \
+            list[BossPlayer] | list[BossPlayerTeam] | Leaderboard | list[dict[str, Any]]:
         """Get a page of the leaderboard for this boss.
 
         .. note::
@@ -177,9 +174,21 @@ class Boss(Challenge):
         :type start_from_page: int
         :param team_size: The team size to get the leaderboard for.
         :type team_size: int
+        :param all_pages: *New in 0.12.0*. If `True`, ignores `pages` and fetches every page from
+            `start_from_page` to the end of the leaderboard, working out how many there are from
+            :attr:`~bloonspy.model.btd6.Boss.total_scores`.
+        :type all_pages: bool
+        :param columnar: *New in 0.12.0*. If `True`, returns a :class:`~bloonspy.model.btd6.Leaderboard`,
+            which stores the leaderboard by column and only creates players when indexed.
+            Its entries are always players, even if `team_size` is more than 1.
+        :type columnar: bool
+        :param raw: *New in 0.12.0*. If `True`, returns the entries exactly as the API sent them,
+            without creating any objects or grouping players into teams.
+        :type raw: bool
 
         :return: A list of players in the leaderboard.
         :rtype: list[:class:`~bloonspy.model.btd6.BossPlayer`] | list[:class:`~bloonspy.model.btd6.BossPlayerTeam`]
+            | ~bloonspy.model.btd6.Leaderboard | list[dict]
 
         :raise ~bloonspy.exceptions.NotFound: If the boss doesn't exist or is expired.
         :raise BadTeamSize: If `team_size` is less than 1 or more than 4.
@@ -187,71 +196,161 @@ class Boss(Challenge):
         if team_size not in range(1, 5):
             raise BadTeamSize("team_size must be between 1 and 4")
 
-        def on_data_fetched(results) -> list[BossPlayer] | list[BossPlayerTeam]:
-            boss_players = []
-            for page in results:
-                for player in page:
-                    boss_players.append(BossPlayer(
-                        player["profile"].split("/")[-1],
-                        player["displayName"],
-                        player["score"],
-                        player["scoreParts"],
-                        player["submissionTime"],
-                        async_client=self._async_client,
-                    ))
-
+        def on_data_fetched(results) -> list[BossPlayer] | list[BossPlayerTeam] | Leaderboard | list[dict[str, Any]]:
+            if raw:
+                return [player for page in results for player in page]
+            if columnar:
+                return self._columnar_leaderboard(results, start_from_page)
+            boss_players = [self._parse_lb_player(player) for page in results for player in page]
             if team_size == 1:
                 return boss_players
 
-            boss_teams = []
-            current_score = None
-            current_score_parts = []
-            current_sub_time = None
-            current_team_players = []
-            for player in boss_players:
-                if player.score != current_score or \
-                        not self._score_parts_eq(player.score_parts, current_score_parts):
-                    if current_score is not None:
-                        boss_teams.append(
-                            BossPlayerTeam(
-                                current_team_players,
-                                current_score,
-                                current_score_parts,
-                                current_sub_time,
-                            )
-                        )
-                    current_score = player.score
-                    current_score_parts = player.score_parts
-                    current_sub_time = player.submission_time
-                    current_team_players = []
-
-                current_team_players.append(player)
-
-            if len(current_team_players) > 0:
-                boss_teams.append(
-                    BossPlayerTeam(current_team_players,
-                                   current_score,
-                                   current_score_parts,
-                                   current_sub_time,
-                                   len(current_team_players) == team_size)
-                )
+            teams = _BossTeamBuilder(team_size)
+            boss_teams = [team for player in boss_players if (team := teams.add(player)) is not None]
+            if (team := teams.finish()) is not None:
+                boss_teams.append(team)
             return boss_teams
 
         async def async_leaderboard():
-            results = await asyncio.gather(*[
-                aget_lb_page(self._async_client, self.lb_endpoint.format(self._id, team_size), page_num)
-                for page_num in range(start_from_page, start_from_page + pages)
-            ])
+            if all_pages:
+                return on_data_fetched(await self._transport.get_all_lb_pages(
+                    self.lb_endpoint.format(self._id, team_size), self._total_scores, start_from_page
+                ))
+            results = await self._transport.get_lb_pages(
+                self.lb_endpoint.format(self._id, team_size), range(start_from_page, start_from_page + pages)
+            )
             return on_data_fetched(results)
 
         if self._async_client:
             return async_leaderboard()
 
-        futures = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for page_num in range(start_from_page, start_from_page + pages):
-                futures.append(executor.submit(get_lb_page, self.lb_endpoint.format(self._id, team_size), page_num))
-        return on_data_fetched([page.result() for page in futures])
+        if all_pages:
+            return on_data_fetched(self._transport.get_all_lb_pages(
+                self.lb_endpoint.format(self._id, team_size), self._total_scores, start_from_page
+            ))
+
+        return on_data_fetched(self._transport.get_lb_pages(
+            self.lb_endpoint.format(self._id, team_size), range(start_from_page, start_from_page + pages)
+        ))
+
+    def iter_leaderboard(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            team_size: int = 1,
+            read_ahead: int = 4,
+    ) -> Iterator[BossPlayer] | Iterator[BossPlayerTeam]:
+        """
+        *New in 0.12.0*
+
+        Iterate over the leaderboard for this boss in rank order, fetching pages as they're needed.
+        Up to `read_ahead` pages are fetched in advance, so you can stop iterating at any
+        point without fetching the rest of the leaderboard. ::
+
+           for player in boss.iter_leaderboard():
+               if player.score > cutoff:
+                   break
+
+        For asynchronous environments, use :func:`~bloonspy.model.btd6.Boss.aiter_leaderboard` instead.
+
+        :param pages: Maximum number of pages to fetch. If `None`, goes until the end of the leaderboard.
+        :type pages: int
+        :param start_from_page: The first page to fetch.
+        :type start_from_page: int
+        :param team_size: The team size to get the leaderboard for.
+        :type team_size: int
+        :param read_ahead: How many pages can be fetched at the same time.
+        :type read_ahead: int
+
+        :return: The players, or teams if `team_size` is more than 1, in the leaderboard.
+        :rtype: Iterator[:class:`~bloonspy.model.btd6.BossPlayer`] | Iterator[:class:`~bloonspy.model.btd6.BossPlayerTeam`]
+
+        :raise ~bloonspy.exceptions.NotFound: If the boss doesn't exist or is expired.
+        :raise BadTeamSize: If `team_size` is less than 1 or more than 4.
+        """
+        if team_size not in range(1, 5):
+            raise BadTeamSize("team_size must be between 1 and 4")
+
+        teams = _BossTeamBuilder(team_size)
+        lb_pages = self._transport.iter_lb_pages(
+            self.lb_endpoint.format(self._id, team_size), start_from_page, pages, read_ahead
+        )
+        try:
+            for page in lb_pages:
+                for player in page:
+                    player = self._parse_lb_player(player)
+                    if team_size == 1:
+                        yield player
+                    elif (team := teams.add(player)) is not None:
+                        yield team
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            lb_pages.close()
+        if (team := teams.finish()) is not None:
+            yield team
+
+    async def aiter_leaderboard(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            team_size: int = 1,
+            read_ahead: int = 4,
+    ) -> AsyncIterator[BossPlayer] | AsyncIterator[BossPlayerTeam]:
+        """
+        *New in 0.12.0*
+
+        Asynchronous version of :func:`~bloonspy.model.btd6.Boss.iter_leaderboard`. ::
+
+           async for player in boss.aiter_leaderboard():
+               if player.score > cutoff:
+                   break
+
+        :raise ~bloonspy.exceptions.NotFound: If the boss doesn't exist or is expired.
+        :raise BadTeamSize: If `team_size` is less than 1 or more than 4.
+        """
+        if team_size not in range(1, 5):
+            raise BadTeamSize("team_size must be between 1 and 4")
+
+        teams = _BossTeamBuilder(team_size)
+        lb_pages = self._transport.aiter_lb_pages(
+            self.lb_endpoint.format(self._id, team_size), start_from_page, pages, read_ahead
+        )
+        try:
+            async for page in lb_pages:
+                for player in page:
+                    player = self._parse_lb_player(player)
+                    if team_size == 1:
+                        yield player
+                    elif (team := teams.add(player)) is not None:
+                        yield team
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            await lb_pages.aclose()
+        if (team := teams.finish()) is not None:
+            yield team
+
+    def _columnar_leaderboard(self, pages: list[list[dict[str, Any]]], start_from_page: int) -> Leaderboard:
+        leaderboard = Leaderboard(
+            lambda *entry: BossPlayer(*entry, async_client=self._async_client, transport=self._transport)
+        )
+        for page_num, page in enumerate(pages, start_from_page):
+            leaderboard.append_page(page, page_num)
+        return leaderboard
+
+    def _parse_lb_player(self, player: dict[str, Any]) -> BossPlayer:
+        return BossPlayer(
+            player["profile"].split("/")[-1],
+            player["displayName"],
+            player["score"],
+            player["scoreParts"],
+            player["submissionTime"],
+            async_client=self._async_client,
+            transport=self._transport,
+        )
 
     @staticmethod
     def _score_parts_eq(sp1: list[Score], sp2: list[Score]) -> bool:
@@ -263,6 +362,39 @@ class Boss(Challenge):
         return True
 
 
+class _BossTeamBuilder:
+    """Groups consecutive players of a co-op leaderboard with the same score into teams."""
+    def __init__(self, team_size: int):
+        self._team_size = team_size
+        self._score = None
+        self._score_parts = []
+        self._submission_time = None
+        self._players = []
+
+    def add(self, player: BossPlayer) -> BossPlayerTeam | None:
+        """Add the next player in the leaderboard.
+
+        :return: The previous team, if the player isn't part of it.
+        """
+        team = None
+        if player.score != self._score or not Boss._score_parts_eq(player.score_parts, self._score_parts):
+            if self._score is not None:
+                team = BossPlayerTeam(self._players, self._score, self._score_parts, self._submission_time)
+            self._score = player.score
+            self._score_parts = player.score_parts
+            self._submission_time = player.submission_time
+            self._players = []
+        self._players.append(player)
+        return team
+
+    def finish(self) -> BossPlayerTeam | None:
+        """The last team, which might not have all of its members if the leaderboard was cut short."""
+        if len(self._players) == 0:
+            return None
+        return BossPlayerTeam(self._players, self._score, self._score_parts, self._submission_time,
+                              len(self._players) == self._team_size)
+
+
 class BossEvent(Event):
     """A boss event. Inherits from :class:`~bloonspy.model.Event`."""
     event_endpoint = "/btd6/bosses"
@@ -356,10 +488,11 @@ class BossEvent(Event):
             self.id,
             self.name,
             self.boss_bloon,
-            self.total_scores_elite,
+            self.total_scores_elite if is_elite else self.total_scores_standard,
             is_elite,
             eager=eager,
             async_client=self._async_client,
+            transport=self._transport,
         )
         if self._async_client:
             return load(boss)
@@ -3,11 +3,12 @@ from enum import Enum
 from datetime import datetime
 from typing import Awaitable, Any
 from ...utils.decorators import fetch_property
+from ...utils.dictionaries import compile_key_paths
 from ...exceptions import NotFound
 from ..GameVersion import GameVersion
 from bloonspy.utils.Infinity import Infinity
 from ..Loadable import Loadable
-from ..Asset import Asset
+from ..Asset import Asset, asset_interner
 from .Restriction import Restriction, TowerRestriction
 from .Gamemode import Gamemode
 from .Power import Power
@@ -38,10 +39,28 @@ class ChallengeModifier:
     all_camo: bool = field(default=False)  #: If `True`, all bloons will be camo.
 
 
+# Maps the API's keys to the fields of ChallengeModifier
+MODIFIER_KEYS = [
+    ("abilityCooldownReductionMultiplier", "ability_cooldown_reduction"),
+    ("removeableCostMultiplier", "removable_cost"),
+    ("_bloonModifiers.speedMultiplier", "bloon_speed"),
+    ("_bloonModifiers.moabSpeedMultiplier", "moab_speed"),
+    ("_bloonModifiers.bossSpeedMultiplier", "boss_speed"),
+    ("_bloonModifiers.healthMultipliers.bloons", "ceramic_health"),
+    ("_bloonModifiers.healthMultipliers.moabs", "moab_health"),
+    ("_bloonModifiers.healthMultipliers.boss", "boss_health"),
+    ("_bloonModifiers.regrowRateMultiplier", "regrow_rate"),
+    ("_bloonModifiers.allRegen", "all_regrow"),
+    ("_bloonModifiers.allCamo", "all_camo"),
+]
+extract_modifiers = compile_key_paths(MODIFIER_KEYS)
+
+
 class Challenge(Loadable):
     """A BTD6 Challenge. It extends :class:`~bloonspy.model.Loadable`."""
 
     endpoint = "/btd6/challenges/challenge/{}"
+    _identity_mapped = True
 
     def __init__(
             self,
@@ -85,7 +104,7 @@ class Challenge(Loadable):
         self._data["leastTiers"] = Infinity() if raw_challenge["leastTiersUsed"] == -1 else raw_challenge["leastTiersUsed"]
         self._data["createdAt"] = datetime.fromtimestamp(int(raw_challenge["createdAt"]/1000))
         self._data["gameVersion"] = GameVersion.from_string(raw_challenge["gameVersion"])
-        self._data["map"] = Asset(raw_challenge["map"], raw_challenge["mapURL"])
+        self._data["map"] = asset_interner(raw_challenge["map"], raw_challenge["mapURL"])
         self._data["gamemode"] = Gamemode.from_strings(raw_challenge["difficulty"], raw_challenge["mode"])
         self._data["creatorId"] = None
         if raw_challenge["creator"]:
@@ -99,35 +118,7 @@ class Challenge(Loadable):
             amount = Infinity() if power["max"] == -1 else power["max"]
             self._data["powers"][Power.from_string(power["power"])] = amount
 
-        # Renames the keys so they can be fed into the dataclass
-        modifiers = {}
-        rename_keys = [
-            ("abilityCooldownReductionMultiplier", "ability_cooldown_reduction"),
-            ("removeableCostMultiplier", "removable_cost"),
-            ("_bloonModifiers.speedMultiplier", "bloon_speed"),
-            ("_bloonModifiers.moabSpeedMultiplier", "moab_speed"),
-            ("_bloonModifiers.bossSpeedMultiplier", "boss_speed"),
-            ("_bloonModifiers.healthMultipliers.bloons", "ceramic_health"),
-            ("_bloonModifiers.healthMultipliers.moabs", "moab_health"),
-            ("_bloonModifiers.healthMultipliers.boss", "boss_health"),
-            ("_bloonModifiers.regrowRateMultiplier", "regrow_rate"),
-            ("_bloonModifiers.allRegen", "all_regrow"),
-            ("_bloonModifiers.allCamo", "all_camo"),
-        ]
-        for old_key, new_key in rename_keys:
-            old_keys = old_key.split(".")
-            item = raw_challenge
-            while len(old_keys) > 0:
-                if old_keys[0] not in item:
-                    item = None
-                    break
-                item = item[old_keys[0]]
-                old_keys.pop(0)
-
-            if item is None:
-                continue
-            modifiers[new_key] = item
-        self._data["modifiers"] = ChallengeModifier(**modifiers)
+        self._data["modifiers"] = ChallengeModifier(**extract_modifiers(raw_challenge))
 
         self._data["towers"] = {}
         if raw_challenge["_towers"] is not None:  # Is null in Odysseys
@@ -192,7 +183,7 @@ class Challenge(Loadable):
         async def async_creator() -> User | None:
             if self.creator_id is None:
                 return None
-            usr = User(self.creator_id, async_client=self._async_client)
+            usr = User(self.creator_id, async_client=self._async_client, transport=self._transport)
             await usr.load_resource()
             return usr
 
@@ -201,7 +192,7 @@ class Challenge(Loadable):
 
         if self.creator_id is None:
             return None
-        return User(self.creator_id, eager=True, async_client=self._async_client)
+        return User(self.creator_id, eager=True, async_client=self._async_client, transport=self._transport)
 
     @property
     @fetch_property(Loadable.load_resource)
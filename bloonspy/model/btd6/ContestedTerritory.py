@@ -1,12 +1,9 @@
-import asyncio
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Awaitable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Iterator, AsyncIterator
 from ...utils.decorators import fetch_property, exception_handler
-from ...utils.api import get, get_lb_page
-from ...utils.asyncapi import aget, aget_lb_page
+from ...utils.EnumResolver import EnumResolver
 from ..Event import Event
 from .User import User
 from .Team import Team
@@ -16,6 +13,7 @@ class CtPlayer(User):
     """A player who has played a CT event and is on the leaderboard.
     Inherits from :class:`~bloonspy.model.btd6.User`.
     """
+    __slots__ = ("_name", "_score")
     def __init__(self, user_id: str, name: str, score: int, **kwargs):
         super().__init__(user_id, **kwargs)
         self._name = name
@@ -35,12 +33,27 @@ class CtPlayer(User):
 class CtTeam(Team):
     """A team who participated in Contested Territory and is on the leaderboards.
     Inherits from :class:`~bloonspy.model.btd6.Team`."""
+    __slots__ = ("_full_name", "_name", "_score")
     def __init__(self, team_id: str, name: str, score: int, **kwargs):
         super().__init__(team_id, **kwargs)
-        self._data["full_name"] = name
-        self._data["name"] = self.parse_team_name(name)
+        self._full_name = name
+        self._name = self.parse_team_name(name)
         self._score = score
 
+    @property
+    def full_name(self) -> str:
+        """
+        The complete name of the team.
+        It may not be exactly what you see in game, in some cases it has
+        the team code appended at the end, among other things.
+        """
+        return self._full_name
+
+    @property
+    def name(self) -> str:
+        """The name of the team, as seen in-game."""
+        return self._name
+
     @property
     def score(self) -> int:
         """The current total CT points of the team."""
@@ -60,13 +73,15 @@ class CtTileType(Enum):
 
     @staticmethod
     def from_string(value: str) -> "CtTileType":
-        value = value.replace(" ", "")
-        return tt_switch[value] if value in tt_switch else None
+        return tt_resolver(value)
 
 
-tt_switch = {"TeamFirstCapture": CtTileType.REGULAR}
-for tt in CtTileType:
-    tt_switch[tt.value.replace(" ", "")] = tt
+tt_resolver = EnumResolver(
+    CtTileType,
+    key=lambda value: value.replace(" ", ""),
+    aliases={"TeamFirstCapture": CtTileType.REGULAR},
+    normalize=lambda value: value.replace(" ", ""),
+)
 
 
 class GameType(Enum):
@@ -82,13 +97,14 @@ class GameType(Enum):
 
     @staticmethod
     def from_string(value: str) -> "GameType":
-        value = value.replace(" ", "")
-        return gt_switch[value] if value in gt_switch else None
+        return gt_resolver(value)
 
 
-gt_switch = {}
-for gt in GameType:
-    gt_switch[gt.value.replace(" ", "")] = gt
+gt_resolver = EnumResolver(
+    GameType,
+    key=lambda value: value.replace(" ", ""),
+    normalize=lambda value: value.replace(" ", ""),
+)
 
 
 class Relic(Enum):
@@ -145,13 +161,15 @@ class Relic(Enum):
 
     @staticmethod
     def from_string(value: str) -> "Relic":
-        value = value.replace(" ", "")
-        return rel_switch[value] if value in rel_switch else None
+        return rel_resolver(value)
 
 
-rel_switch = {"MoabMine": Relic.MOAB_MINE, "MoabClash": Relic.MOAB_CLASH}
-for rel in Relic:
-    rel_switch[rel.value.replace(" ", "")] = rel
+rel_resolver = EnumResolver(
+    Relic,
+    key=lambda value: value.replace(" ", ""),
+    aliases={"MoabMine": Relic.MOAB_MINE, "MoabClash": Relic.MOAB_CLASH},
+    normalize=lambda value: value.replace(" ", ""),
+)
 
 
 @dataclass
@@ -217,7 +235,13 @@ class ContestedTerritoryEvent(Event):
         return self._data["totalScores_team"]
 
     @exception_handler(Event.handle_exceptions)
-    def leaderboard_player(self, pages: int = 1, start_from_page: int = 1) -> list[CtPlayer] | Awaitable[list[CtPlayer]]:
+    def leaderboard_player(
+            self,
+            pages: int = 1,
+            start_from_page: int = 1,
+            all_pages: bool = False,
+            raw: bool = False,
+    ) -> list[CtPlayer] | list[dict[str, Any]] | Awaitable[list[CtPlayer] | list[dict[str, Any]]]:
         """Get a page of the player leaderboard.
 
         .. note::
@@ -229,42 +253,56 @@ class ContestedTerritoryEvent(Event):
         :type pages: int
         :param start_from_page: The first page to fetch.
         :type start_from_page: int
+        :param all_pages: *New in 0.12.0*. If `True`, ignores `pages` and fetches every page from
+            `start_from_page` to the end of the leaderboard, working out how many there are from
+            :attr:`~bloonspy.model.btd6.ContestedTerritoryEvent.total_scores_player`.
+        :type all_pages: bool
+        :param raw: *New in 0.12.0*. If `True`, returns the entries exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of players in the leaderboard.
-        :rtype: list[:class:`~bloonspy.model.btd6.CtPlayer`]
+        :rtype: list[:class:`~bloonspy.model.btd6.CtPlayer`] | list[dict]
 
         :raise ~bloonspy.exceptions.NotFound: If the boss doesn't exist or is expired.
         """
-        def on_pages_fetched(responses) -> list[CtPlayer]:
-            players = []
-            for page in responses:
-                for player in page:
-                    players.append(CtPlayer(
-                        player["profile"].split("/")[-1],
-                        player["displayName"],
-                        player["score"],
-                        async_client=self._async_client,
-                    ))
-            return players
+        def on_pages_fetched(responses) -> list[CtPlayer] | list[dict[str, Any]]:
+            if raw:
+                return [player for page in responses for player in page]
+            return [self._parse_lb_player(player) for page in responses for player in page]
 
         async def async_get_leaderboard() -> list[CtPlayer]:
-            results = await asyncio.gather(*[
-                aget_lb_page(self._async_client, self.lb_endpoint_player.format(self._id), page_num)
-                for page_num in range(start_from_page, start_from_page + pages)
-            ])
+            if all_pages:
+                if not self._event_loaded:
+                    await self.load_event()
+                return on_pages_fetched(await self._transport.get_all_lb_pages(
+                    self.lb_endpoint_player.format(self._id), self._data["totalScores_player"], start_from_page
+                ))
+            results = await self._transport.get_lb_pages(
+                self.lb_endpoint_player.format(self._id), range(start_from_page, start_from_page + pages)
+            )
             return on_pages_fetched(results)
 
         if self._async_client:
             return async_get_leaderboard()
 
-        futures = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for page_num in range(start_from_page, start_from_page + pages):
-                futures.append(executor.submit(get_lb_page, self.lb_endpoint_player.format(self._id), page_num))
-        return on_pages_fetched([page.result() for page in futures])
+        if all_pages:
+            return on_pages_fetched(self._transport.get_all_lb_pages(
+                self.lb_endpoint_player.format(self._id), self.total_scores_player, start_from_page
+            ))
+
+        return on_pages_fetched(self._transport.get_lb_pages(
+            self.lb_endpoint_player.format(self._id), range(start_from_page, start_from_page + pages)
+        ))
 
     @exception_handler(Event.handle_exceptions)
-    def leaderboard_team(self, pages: int = 1, start_from_page: int = 1) -> list[CtTeam] | Awaitable[list[CtTeam]]:
+    def leaderboard_team(
+            self,
+            pages: int = 1,
+            start_from_page: int = 1,
+            all_pages: bool = False,
+            raw: bool = False,
+    ) -> list[CtTeam] | list[dict[str, Any]] | Awaitable[list[CtTeam] | list[dict[str, Any]]]:
         """Get a page of the team leaderboard.
 
         .. note::
@@ -276,39 +314,178 @@ class ContestedTerritoryEvent(Event):
         :type pages: int
         :param start_from_page: The first page to fetch.
         :type start_from_page: int
+        :param all_pages: *New in 0.12.0*. If `True`, ignores `pages` and fetches every page from
+            `start_from_page` to the end of the leaderboard, working out how many there are from
+            :attr:`~bloonspy.model.btd6.ContestedTerritoryEvent.total_scores_team`.
+        :type all_pages: bool
+        :param raw: *New in 0.12.0*. If `True`, returns the entries exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of teams in the leaderboard.
-        :rtype: list[:class:`~bloonspy.model.btd6.CtTeam`]
+        :rtype: list[:class:`~bloonspy.model.btd6.CtTeam`] | list[dict]
 
         :raise ~bloonspy.exceptions.NotFound: If the boss doesn't exist or is expired.
         """
-        def on_pages_fetched(responses) -> list[CtTeam]:
-            teams = []
-            for page in responses:
-                for team in page:
-                    teams.append(CtTeam(
-                        team["profile"].split("/")[-1],
-                        team["displayName"],
-                        team["score"],
-                        async_client=self._async_client,
-                    ))
-            return teams
+        def on_pages_fetched(responses) -> list[CtTeam] | list[dict[str, Any]]:
+            if raw:
+                return [team for page in responses for team in page]
+            return [self._parse_lb_team(team) for page in responses for team in page]
 
         async def async_get_leaderboard() -> list[CtTeam]:
-            results = await asyncio.gather(*[
-                aget_lb_page(self._async_client, self.lb_endpoint_team.format(self._id), page_num)
-                for page_num in range(start_from_page, start_from_page + pages)
-            ])
+            if all_pages:
+                if not self._event_loaded:
+                    await self.load_event()
+                return on_pages_fetched(await self._transport.get_all_lb_pages(
+                    self.lb_endpoint_team.format(self._id), self._data["totalScores_team"], start_from_page
+                ))
+            results = await self._transport.get_lb_pages(
+                self.lb_endpoint_team.format(self._id), range(start_from_page, start_from_page + pages)
+            )
             return on_pages_fetched(results)
 
         if self._async_client:
             return async_get_leaderboard()
 
-        futures = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for page_num in range(start_from_page, start_from_page + pages):
-                futures.append(executor.submit(get_lb_page, self.lb_endpoint_team.format(self._id), page_num))
-        return on_pages_fetched([page.result() for page in futures])
+        if all_pages:
+            return on_pages_fetched(self._transport.get_all_lb_pages(
+                self.lb_endpoint_team.format(self._id), self.total_scores_team, start_from_page
+            ))
+
+        return on_pages_fetched(self._transport.get_lb_pages(
+            self.lb_endpoint_team.format(self._id), range(start_from_page, start_from_page + pages)
+        ))
+
+    def iter_leaderboard_player(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> Iterator[CtPlayer]:
+        """
+        *New in 0.12.0*
+
+        Iterate over the player leaderboard in rank order, fetching pages as they're needed.
+        Up to `read_ahead` pages are fetched in advance, so you can stop iterating at any
+        point without fetching the rest of the leaderboard.
+
+        For asynchronous environments, use
+        :func:`~bloonspy.model.btd6.ContestedTerritoryEvent.aiter_leaderboard_player` instead.
+
+        :param pages: Maximum number of pages to fetch. If `None`, goes until the end of the leaderboard.
+        :type pages: int
+        :param start_from_page: The first page to fetch.
+        :type start_from_page: int
+        :param read_ahead: How many pages can be fetched at the same time.
+        :type read_ahead: int
+
+        :return: The players in the leaderboard.
+        :rtype: Iterator[:class:`~bloonspy.model.btd6.CtPlayer`]
+        """
+        return self._iter_leaderboard(self.lb_endpoint_player, self._parse_lb_player,
+                                      pages, start_from_page, read_ahead)
+
+    def iter_leaderboard_team(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> Iterator[CtTeam]:
+        """
+        *New in 0.12.0*
+
+        Iterate over the team leaderboard in rank order, fetching pages as they're needed.
+        Works like :func:`~bloonspy.model.btd6.ContestedTerritoryEvent.iter_leaderboard_player`.
+
+        :return: The teams in the leaderboard.
+        :rtype: Iterator[:class:`~bloonspy.model.btd6.CtTeam`]
+        """
+        return self._iter_leaderboard(self.lb_endpoint_team, self._parse_lb_team,
+                                      pages, start_from_page, read_ahead)
+
+    def aiter_leaderboard_player(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> AsyncIterator[CtPlayer]:
+        """
+        *New in 0.12.0*
+
+        Asynchronous version of :func:`~bloonspy.model.btd6.ContestedTerritoryEvent.iter_leaderboard_player`.
+        """
+        return self._aiter_leaderboard(self.lb_endpoint_player, self._parse_lb_player,
+                                       pages, start_from_page, read_ahead)
+
+    def aiter_leaderboard_team(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> AsyncIterator[CtTeam]:
+        """
+        *New in 0.12.0*
+
+        Asynchronous version of :func:`~bloonspy.model.btd6.ContestedTerritoryEvent.iter_leaderboard_team`.
+        """
+        return self._aiter_leaderboard(self.lb_endpoint_team, self._parse_lb_team,
+                                       pages, start_from_page, read_ahead)
+
+    def _iter_leaderboard(
+            self,
+            lb_endpoint: str,
+            parse_entry: callable,
+            pages: int | None,
+            start_from_page: int,
+            read_ahead: int,
+    ) -> Iterator[CtPlayer] | Iterator[CtTeam]:
+        lb_pages = self._transport.iter_lb_pages(lb_endpoint.format(self._id), start_from_page, pages, read_ahead)
+        try:
+            for page in lb_pages:
+                for entry in page:
+                    yield parse_entry(entry)
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            lb_pages.close()
+
+    async def _aiter_leaderboard(
+            self,
+            lb_endpoint: str,
+            parse_entry: callable,
+            pages: int | None,
+            start_from_page: int,
+            read_ahead: int,
+    ) -> AsyncIterator[CtPlayer] | AsyncIterator[CtTeam]:
+        lb_pages = self._transport.aiter_lb_pages(lb_endpoint.format(self._id), start_from_page, pages, read_ahead)
+        try:
+            async for page in lb_pages:
+                for entry in page:
+                    yield parse_entry(entry)
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            await lb_pages.aclose()
+
+    def _parse_lb_player(self, player: dict[str, Any]) -> CtPlayer:
+        return CtPlayer(
+            player["profile"].split("/")[-1],
+            player["displayName"],
+            player["score"],
+            async_client=self._async_client,
+            transport=self._transport,
+        )
+
+    def _parse_lb_team(self, team: dict[str, Any]) -> CtTeam:
+        return CtTeam(
+            team["profile"].split("/")[-1],
+            team["displayName"],
+            team["score"],
+            async_client=self._async_client,
+            transport=self._transport,
+        )
 
     @exception_handler(Event.handle_exceptions)
     def tiles(self) -> list[CtTile] | Awaitable[list[CtTile]]:
@@ -328,9 +505,9 @@ class ContestedTerritoryEvent(Event):
             return tiles
 
         async def async_tiles():
-            resp = await aget(self._async_client, f"/btd6/ct/{self.id}/tiles")
+            resp = await self._transport.get(f"/btd6/ct/{self.id}/tiles")
             return on_data_fetched(resp["tiles"])
 
         if self._async_client:
             return async_tiles()
-        return on_data_fetched(get(f"/btd6/ct/{self.id}/tiles")["tiles"])
+        return on_data_fetched(self._transport.get(f"/btd6/ct/{self.id}/tiles")["tiles"])
@@ -15,6 +15,7 @@ class CustomMap(Loadable):
     """
 
     endpoint = "/btd6/maps/map/{}"
+    _identity_mapped = True
 
     def __init__(
             self,
@@ -84,7 +85,9 @@ class CustomMap(Loadable):
         """
         if self._data["creatorId"] is None:
             return None
-        return User(self._data["creatorId"], eager=True)
+        # Always loaded synchronously, so it can't use an asynchronous transport
+        transport = None if self._async_client else self._transport
+        return User(self._data["creatorId"], eager=True, transport=transport)
 
     @property
     @fetch_property(Loadable.load_resource)
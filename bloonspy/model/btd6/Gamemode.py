@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from ...utils.EnumResolver import EnumResolver
 
 
 class Difficulty(Enum):
@@ -29,7 +30,28 @@ class Mode(Enum):
     CHIMPS = "CHIMPS"
 
 
-@dataclass
+difficulty_resolver = EnumResolver(Difficulty, aliases={
+    "Easy": Difficulty.EASY,
+    "Medium": Difficulty.MEDIUM,
+    "Hard": Difficulty.HARD,
+})
+mode_resolver = EnumResolver(Mode, aliases={
+    "Standard": Mode.STANDARD,
+    "PrimaryOnly": Mode.PRIMARY_ONLY,
+    "Deflation": Mode.DEFLATION,
+    "MilitaryOnly": Mode.MILITARY_ONLY,
+    "Reverse": Mode.REVERSE,
+    "Apopalypse": Mode.APOPALYPSE,
+    "MagicOnly": Mode.MAGIC_ONLY,
+    "DoubleMoabHealth": Mode.DOUBLE_HP_MOABS,
+    "HalfCash": Mode.HALF_CASH,
+    "AlternateBloonsRounds": Mode.ALTERNATE_BLOONS_ROUNDS,
+    "Impoppable": Mode.IMPOPPABLE,
+    "Clicks": Mode.CHIMPS,
+})
+
+
+@dataclass(frozen=True)
 class Gamemode:
     """
     Difficulty and mode for a game.
@@ -43,35 +65,19 @@ class Gamemode:
         military_only = btd6.Gamemode(btd6.Difficulty.MEDIUM, btd6.Mode.MILITARY_ONLY)
         some_custom_mode = btd6.Gamemode(btd6.Difficulty.EASY, btd6.Mode.DOUBLE_HP_MOABS)
 
+    *Changed in 0.12.0:* Gamemodes are immutable. The ones returned by the library are shared,
+    one for each combination of difficulty and mode.
     """
     difficulty: Difficulty  #: The game's difficulty.
     mode: Mode  #: The game's mode.
 
+    def __post_init__(self):
+        # Gamemodes are dictionary keys all over a user's save, hashing them needs to be fast
+        object.__setattr__(self, "_hash", hash((self.mode, self.difficulty)))
+
     @staticmethod
     def from_strings(difficulty, mode) -> "Gamemode":
-        difficulty_switch = {
-            "Easy": Difficulty.EASY,
-            "Medium": Difficulty.MEDIUM,
-            "Hard": Difficulty.HARD,
-        }
-        mode_switch = {
-            "Standard": Mode.STANDARD,
-            "PrimaryOnly": Mode.PRIMARY_ONLY,
-            "Deflation": Mode.DEFLATION,
-            "MilitaryOnly": Mode.MILITARY_ONLY,
-            "Reverse": Mode.REVERSE,
-            "Apopalypse": Mode.APOPALYPSE,
-            "MagicOnly": Mode.MAGIC_ONLY,
-            "DoubleMoabHealth": Mode.DOUBLE_HP_MOABS,
-            "HalfCash": Mode.HALF_CASH,
-            "AlternateBloonsRounds": Mode.ALTERNATE_BLOONS_ROUNDS,
-            "Impoppable": Mode.IMPOPPABLE,
-            "Clicks": Mode.CHIMPS,
-        }
-
-        found_difficulty = difficulty_switch[difficulty] if difficulty in difficulty_switch else None
-        found_mode = mode_switch[mode] if mode in mode_switch else None
-        return Gamemode(found_difficulty, found_mode) if found_mode and found_difficulty else None
+        return gamemode_table.get((difficulty_resolver(difficulty), mode_resolver(mode)))
 
     def __str__(self) -> str:
         return f"{self.difficulty.value} - {self.mode.value}"
@@ -80,13 +86,19 @@ class Gamemode:
         return str(self)
 
     def __eq__(self, other: "Gamemode") -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Gamemode):
             return False
         return self.mode == other.mode and \
             self.difficulty == other.difficulty
 
     def __hash__(self) -> int:
-        return hash(f"{self.mode}{self.difficulty}")
+        return self._hash
+
+    def __reduce__(self):
+        # Hashes change between processes, so it's worked out again when unpickled
+        return Gamemode, (self.difficulty, self.mode)
 
     @staticmethod
     def easy_modes() -> list["Gamemode"]:
@@ -97,9 +109,9 @@ class Gamemode:
         :rtype: list[~bloonspy.model.btd6.Gamemode]
         """
         return [
-            Gamemode(Difficulty.EASY, Mode.STANDARD),
-            Gamemode(Difficulty.EASY, Mode.PRIMARY_ONLY),
-            Gamemode(Difficulty.EASY, Mode.DEFLATION),
+            gamemode_table[Difficulty.EASY, Mode.STANDARD],
+            gamemode_table[Difficulty.EASY, Mode.PRIMARY_ONLY],
+            gamemode_table[Difficulty.EASY, Mode.DEFLATION],
         ]
 
     @staticmethod
@@ -111,10 +123,10 @@ class Gamemode:
         :rtype: list[~bloonspy.model.btd6.Gamemode]
         """
         return [
-            Gamemode(Difficulty.MEDIUM, Mode.STANDARD),
-            Gamemode(Difficulty.MEDIUM, Mode.MILITARY_ONLY),
-            Gamemode(Difficulty.MEDIUM, Mode.REVERSE),
-            Gamemode(Difficulty.MEDIUM, Mode.APOPALYPSE),
+            gamemode_table[Difficulty.MEDIUM, Mode.STANDARD],
+            gamemode_table[Difficulty.MEDIUM, Mode.MILITARY_ONLY],
+            gamemode_table[Difficulty.MEDIUM, Mode.REVERSE],
+            gamemode_table[Difficulty.MEDIUM, Mode.APOPALYPSE],
         ]
 
     @staticmethod
@@ -126,11 +138,17 @@ class Gamemode:
         :rtype: list[~bloonspy.model.btd6.Gamemode]
         """
         return [
-            Gamemode(Difficulty.HARD, Mode.STANDARD),
-            Gamemode(Difficulty.HARD, Mode.MAGIC_ONLY),
-            Gamemode(Difficulty.HARD, Mode.DOUBLE_HP_MOABS),
-            Gamemode(Difficulty.HARD, Mode.HALF_CASH),
-            Gamemode(Difficulty.HARD, Mode.ALTERNATE_BLOONS_ROUNDS),
-            Gamemode(Difficulty.HARD, Mode.IMPOPPABLE),
-            Gamemode(Difficulty.HARD, Mode.CHIMPS),
+            gamemode_table[Difficulty.HARD, Mode.STANDARD],
+            gamemode_table[Difficulty.HARD, Mode.MAGIC_ONLY],
+            gamemode_table[Difficulty.HARD, Mode.DOUBLE_HP_MOABS],
+            gamemode_table[Difficulty.HARD, Mode.HALF_CASH],
+            gamemode_table[Difficulty.HARD, Mode.ALTERNATE_BLOONS_ROUNDS],
+            gamemode_table[Difficulty.HARD, Mode.IMPOPPABLE],
+            gamemode_table[Difficulty.HARD, Mode.CHIMPS],
         ]
+
+
+gamemode_table = {
+    (difficulty, mode): Gamemode(difficulty, mode)
+    for difficulty in Difficulty for mode in Mode
+}
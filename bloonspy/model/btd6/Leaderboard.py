@@ -0,0 +1,214 @@
+from array import array
+from typing import Any, Callable, Iterator
+from ...utils.api import LB_PAGE_SIZE
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Leaderboard:
+    """
+    *New in 0.12.0*
+
+    The entries of a Race or Boss leaderboard, stored by column instead of one object per entry.
+    Ranks, scores and submission times are kept in typed arrays, and an entry object is only
+    created when the leaderboard is indexed. ::
+
+       leaderboard = race.leaderboard(all_pages=True, columnar=True)
+       leaderboard.percentile(90)  # Score in milliseconds
+       top = leaderboard[:100]     # Another Leaderboard
+       player = leaderboard[0]     # A RacePlayer
+
+    If NumPy is installed, :attr:`ranks`, :attr:`scores` and :attr:`submission_times` are returned as
+    NumPy arrays. Otherwise, they're :class:`array.array` objects. Either way, they're copies.
+
+    .. container:: operations
+
+       .. describe:: len(x)
+
+          The number of entries.
+
+       .. describe:: x[i]
+
+          The entry at index `i`, built when requested.
+
+       .. describe:: x[i:j]
+
+          A new Leaderboard with the entries in the slice.
+    """
+    def __init__(self, make_entry: Callable[[str, str, int, list[dict[str, Any]], int], Any]):
+        self._make_entry = make_entry
+        self._ranks = array("q")
+        self._user_ids = []
+        self._names = []
+        self._scores = array("q")
+        self._submission_times = array("q")
+        self._part_offsets = array("q", [0])
+        self._part_scores = array("q")
+        self._part_kinds = array("H")
+        self._kinds = []
+        self._kind_ids = {}
+
+    def _empty(self) -> "Leaderboard":
+        leaderboard = Leaderboard(self._make_entry)
+        leaderboard._kinds = self._kinds
+        leaderboard._kind_ids = self._kind_ids
+        return leaderboard
+
+    def append_page(self, page: list[dict[str, Any]], page_num: int) -> None:
+        """Add the rows of a leaderboard page, as returned by the API, to the end of the leaderboard.
+
+        :param page: The rows of the page.
+        :type page: list[dict]
+        :param page_num: The number of the page, used to work out the ranks.
+        :type page_num: int
+        """
+        first_rank = (page_num - 1) * LB_PAGE_SIZE + 1
+        self._ranks.extend(range(first_rank, first_rank + len(page)))
+        self._user_ids.extend(row["profile"].rsplit("/", 1)[-1] for row in page)
+        self._names.extend(row["displayName"] for row in page)
+        self._scores.extend(row["score"] for row in page)
+        self._submission_times.extend(row["submissionTime"] for row in page)
+        for row in page:
+            for part in row["scoreParts"]:
+                kind = (part["type"], part["name"])
+                if kind not in self._kind_ids:
+                    self._kind_ids[kind] = len(self._kinds)
+                    self._kinds.append(kind)
+                self._part_kinds.append(self._kind_ids[kind])
+                self._part_scores.append(part["score"])
+            self._part_offsets.append(len(self._part_scores))
+
+    @staticmethod
+    def _column(column: array) -> array:
+        if numpy is None:
+            return array(column.typecode, column)
+        return numpy.array(column, dtype=numpy.int64)
+
+    @property
+    def ranks(self) -> array:
+        """The rank of each entry."""
+        return self._column(self._ranks)
+
+    @property
+    def user_ids(self) -> list[str]:
+        """The user ID of each entry."""
+        return self._user_ids
+
+    @property
+    def names(self) -> list[str]:
+        """The display name of each entry."""
+        return self._names
+
+    @property
+    def scores(self) -> array:
+        """The score of each entry. For time-based leaderboards, it's in milliseconds."""
+        return self._column(self._scores)
+
+    @property
+    def submission_times(self) -> array:
+        """When each entry's score was submitted, in milliseconds since the epoch."""
+        return self._column(self._submission_times)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._entry(i)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self._take(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Leaderboard index out of range")
+        return self._entry(index)
+
+    def _score_parts(self, index: int) -> list[dict[str, Any]]:
+        score_parts = []
+        for part in range(self._part_offsets[index], self._part_offsets[index+1]):
+            score_type, name = self._kinds[self._part_kinds[part]]
+            score_parts.append({"score": self._part_scores[part], "type": score_type, "name": name})
+        return score_parts
+
+    def _entry(self, index: int) -> Any:
+        return self._make_entry(
+            self._user_ids[index],
+            self._names[index],
+            self._scores[index],
+            self._score_parts(index),
+            self._submission_times[index],
+        )
+
+    def _take(self, indexes: range | list[int]) -> "Leaderboard":
+        leaderboard = self._empty()
+        if isinstance(indexes, range) and indexes.step == 1:
+            columns = ["_ranks", "_user_ids", "_names", "_scores", "_submission_times"]
+            for column in columns:
+                setattr(leaderboard, column, getattr(self, column)[indexes.start:indexes.stop])
+            first_part, last_part = self._part_offsets[indexes.start], self._part_offsets[indexes.stop]
+            leaderboard._part_scores = self._part_scores[first_part:last_part]
+            leaderboard._part_kinds = self._part_kinds[first_part:last_part]
+            leaderboard._part_offsets = array(
+                "q", (offset - first_part for offset in self._part_offsets[indexes.start:indexes.stop+1])
+            )
+            return leaderboard
+
+        leaderboard._ranks = array("q", (self._ranks[i] for i in indexes))
+        leaderboard._user_ids = [self._user_ids[i] for i in indexes]
+        leaderboard._names = [self._names[i] for i in indexes]
+        leaderboard._scores = array("q", (self._scores[i] for i in indexes))
+        leaderboard._submission_times = array("q", (self._submission_times[i] for i in indexes))
+        for i in indexes:
+            first_part, last_part = self._part_offsets[i], self._part_offsets[i+1]
+            leaderboard._part_scores.extend(self._part_scores[first_part:last_part])
+            leaderboard._part_kinds.extend(self._part_kinds[first_part:last_part])
+            leaderboard._part_offsets.append(len(leaderboard._part_scores))
+        return leaderboard
+
+    def sort(self, by: str = "score", reverse: bool = False) -> "Leaderboard":
+        """Get the entries sorted by a column. Entries with the same value keep their order.
+
+        :param by: The column to sort by: ``"rank"``, ``"score"``, or ``"submission_time"``.
+        :type by: str
+        :param reverse: If `True`, sorts from the highest value to the lowest.
+        :type reverse: bool
+
+        :return: A new Leaderboard with the sorted entries.
+        :rtype: ~bloonspy.model.btd6.Leaderboard
+        """
+        columns = {"rank": self._ranks, "score": self._scores, "submission_time": self._submission_times}
+        if by not in columns:
+            raise ValueError(f"Can't sort by {by}")
+        column = columns[by]
+        if numpy is not None:
+            values = self._column(column)
+            order = numpy.argsort(-values if reverse else values, kind="stable").tolist()
+        else:
+            order = sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+        return self._take(order)
+
+    def percentile(self, q: float) -> float:
+        """The score below which a percentage of the entries' scores fall, interpolating between
+        the two closest scores like :func:`numpy.percentile` does.
+
+        :param q: The percentile, between 0 and 100.
+        :type q: float
+
+        :return: The score at that percentile.
+        :rtype: float
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        if len(self) == 0:
+            raise ValueError("Can't get a percentile of an empty leaderboard")
+        if numpy is not None:
+            return float(numpy.percentile(self._column(self._scores), q))
+        scores = sorted(self._scores)
+        position = (len(scores) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(scores) - 1)
+        return scores[lower] + (scores[upper] - scores[lower]) * (position - lower)
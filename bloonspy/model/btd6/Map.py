@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from .Gamemode import Gamemode, Difficulty, Mode
+from .Gamemode import Gamemode, Difficulty, Mode, gamemode_table
 from enum import Enum
 import re
+from ...utils.EnumResolver import EnumResolver
 
 
 @dataclass
@@ -59,7 +60,7 @@ class MapProgress:
                 hard_modes = Gamemode.hard_modes()
                 if MapProgress.__completed_all(hard_modes, completion_data):
                     border = MapBorder.GOLD
-                    chimps = Gamemode(Difficulty.HARD, Mode.CHIMPS)
+                    chimps = gamemode_table[Difficulty.HARD, Mode.CHIMPS]
                     if completion_data[chimps].completed_without_loading_save:
                         border = MapBorder.BLACK
 
@@ -152,15 +153,13 @@ class Map(Enum):
 
     @staticmethod
     def from_string(value: str) -> "Map":
-        quirky_names = {
-            "Tutorial": Map.MONKEY_MEADOW,
-        }
-        if value in quirky_names.keys():
-            return quirky_names[value]
+        return map_resolver(value)
 
-        return map_switch[value] if value in map_switch else None
 
-
-map_switch = {}
-for game_map in Map:
-    map_switch[re.sub(r"[' ]", "", game_map.value)] = game_map
+map_resolver = EnumResolver(
+    Map,
+    key=lambda value: re.sub(r"[' ]", "", value),
+    aliases={
+        "Tutorial": Map.MONKEY_MEADOW,
+    },
+)
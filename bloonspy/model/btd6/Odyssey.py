@@ -2,12 +2,10 @@ from enum import Enum
 from typing import Any, Awaitable
 from ...utils.decorators import fetch_property, exception_handler
 from ...utils.Infinity import Infinity
-from ...utils.api import get
-from ...utils.asyncapi import aget
 from ..Event import Event
 from ..Loadable import Loadable
 from .Restriction import Restriction, TowerRestriction
-from .Rewards import InstaMonkey, Reward
+from .Rewards import InstaMonkey, Reward, insta_monkey_interner
 from .Challenge import Challenge
 from .Power import Power
 from .Tower import Tower
@@ -55,7 +53,7 @@ class Odyssey(Loadable):
             if reward_type == "InstaMonkey":
                 tower, path = reward.split(",")
                 path = int(path)
-                self._data["rewards"].append(InstaMonkey(
+                self._data["rewards"].append(insta_monkey_interner(
                     Tower.from_string(tower), int(path/100), int(path/10) % 10, path % 10
                 ))
             elif reward_type == "Power":
@@ -176,17 +174,18 @@ class Odyssey(Loadable):
                     island["id"],
                     raw_challenge=island,
                     async_client=self._async_client,
+                    transport=self._transport,
                 ))
             return islands
 
         async def async_maps() -> list[Challenge]:
             return on_data_load(
-                await aget(self._async_client, self.map_endpoint.format(self._id))
+                await self._transport.get(self.map_endpoint.format(self._id))
             )
 
         if self._async_client:
             return async_maps()
-        return on_data_load(get(self.map_endpoint.format(self._id)))
+        return on_data_load(self._transport.get(self.map_endpoint.format(self._id)))
 
 
 class OdysseyEvent(Event):
@@ -270,6 +269,7 @@ class OdysseyEvent(Event):
             difficulty,
             eager=eager,
             async_client=self._async_client,
+            transport=self._transport,
         )
         if self._async_client:
             return async_load(ody)
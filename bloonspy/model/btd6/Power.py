@@ -1,5 +1,7 @@
 from enum import Enum
 from dataclasses import dataclass
+from ...utils.EnumResolver import EnumResolver
+from ...utils.Interner import Interner
 
 
 @dataclass(frozen=True, eq=True)
@@ -32,21 +34,25 @@ class Power(Enum):
 
     @staticmethod
     def from_string(power: str) -> "Power":
-        power_switch = {
-            "SuperMonkeyStorm": Power.SMS,
-            "MonkeyBoost": Power.MONKEY_BOOST,
-            "Thrive": Power.THRIVE,
-            "DartTime": Power.TIME_STOP,
-            "CashDrop": Power.PONTOON,
-            "BananaFarmer": Power.BANANA_FARMER,
-            "Pontoon": Power.CASH_DROP,
-            "RoadSpikes": Power.ROAD_SPIKES,
-            "GlueTrap": Power.GLUE_TRAP,
-            "MoabMine": Power.MOAB_MINE,
-            "CamoTrap": Power.CAMO_TRAP,
-            "PortableLake": Power.PORTABLE_LAKE,
-            "TechBot": Power.TECH_BOT,
-            "EnergisingTotem": Power.ENERGISING_TOTEM,
-        }
-        power = power_switch[power] if power in power_switch else None
-        return power
+        return power_resolver(power)
+
+
+power_resolver = EnumResolver(Power, aliases={
+    "SuperMonkeyStorm": Power.SMS,
+    "MonkeyBoost": Power.MONKEY_BOOST,
+    "Thrive": Power.THRIVE,
+    "DartTime": Power.TIME_STOP,
+    "CashDrop": Power.PONTOON,
+    "BananaFarmer": Power.BANANA_FARMER,
+    "Pontoon": Power.CASH_DROP,
+    "RoadSpikes": Power.ROAD_SPIKES,
+    "GlueTrap": Power.GLUE_TRAP,
+    "MoabMine": Power.MOAB_MINE,
+    "CamoTrap": Power.CAMO_TRAP,
+    "PortableLake": Power.PORTABLE_LAKE,
+    "TechBot": Power.TECH_BOT,
+    "EnergisingTotem": Power.ENERGISING_TOTEM,
+})
+
+
+power_amount_interner = Interner(PowerAmount)
@@ -1,4 +1,5 @@
 from enum import Enum
+from ...utils.EnumResolver import EnumResolver
 
 
 class MonkeyKnowledge(Enum):
@@ -139,13 +140,14 @@ class MonkeyKnowledge(Enum):
 
     @staticmethod
     def from_string(value: str) -> "MonkeyKnowledge":
-        value = value.replace(" ", "")
-        return mk_switch[value] if value in mk_switch else None
+        return mk_resolver(value)
 
 
-mk_switch = {}
-for mk in MonkeyKnowledge:
-    mk_switch[mk.value.replace(" ", "")] = mk
+mk_resolver = EnumResolver(
+    MonkeyKnowledge,
+    key=lambda value: value.replace(" ", ""),
+    normalize=lambda value: value.replace(" ", ""),
+)
 
 
 class Upgrade(Enum):
@@ -547,35 +549,32 @@ class Upgrade(Enum):
 
     @staticmethod
     def from_string(value: str) -> "Upgrade":
-        quirky_names = {
-            "Mortar Faster Reload": Upgrade.MORTAR_MID_1,
-            "Bionc Boomerang": Upgrade.BOOMERANG_MID_3,  # Pro typo
-            "Metal Freeze": Upgrade.ICE_TOP_2,
-            "Mortar Rapid Reload": Upgrade.MORTAR_MID_2,
-            "Alchemist Faster Throwing": Upgrade.ALCHEMIST_BTM_1,
-            "Directed Spikes": Upgrade.SPIKE_BTM_2,
-            "Soulbind": Upgrade.WIZARD_BTM_5,
-            "Sentry Paragon": Upgrade.ENGINEER_TOP_5,
-            # TODO theres a better way to do this dynamically
-            "MonkeyBuccaneer Paragon": Upgrade.BUCCANEER_PARAGON,
-            "DartMonkey Paragon": Upgrade.DART_PARAGON,
-            "NinjaMonkey Paragon": Upgrade.NINJA_PARAGON,
-            "BoomerangMonkey Paragon": Upgrade.BOOMERANG_PARAGON,
-            "EngineerMonkey Paragon": Upgrade.ENGINEER_PARAGON,
-            "MonkeyAce Paragon": Upgrade.ACE_PARAGON,
-            "WizardMonkey Paragon": Upgrade.WIZARD_PARAGON,
-        }
-        if value in quirky_names.keys():
-            return quirky_names[value]
-
-        if value.startswith("Buccaneer-"):
-            value = value[len("Buccaneer-"):]
-        return upgrade_switch[value] if value in upgrade_switch else None
-
-
-upgrade_switch = {}
-for upgrade in Upgrade:
-    upgrade_switch[upgrade.value] = upgrade
+        return upgrade_resolver(value)
+
+
+upgrade_resolver = EnumResolver(
+    Upgrade,
+    key=lambda value: value,
+    aliases={
+        "Mortar Faster Reload": Upgrade.MORTAR_MID_1,
+        "Bionc Boomerang": Upgrade.BOOMERANG_MID_3,  # Pro typo
+        "Metal Freeze": Upgrade.ICE_TOP_2,
+        "Mortar Rapid Reload": Upgrade.MORTAR_MID_2,
+        "Alchemist Faster Throwing": Upgrade.ALCHEMIST_BTM_1,
+        "Directed Spikes": Upgrade.SPIKE_BTM_2,
+        "Soulbind": Upgrade.WIZARD_BTM_5,
+        "Sentry Paragon": Upgrade.ENGINEER_TOP_5,
+        # TODO theres a better way to do this dynamically
+        "MonkeyBuccaneer Paragon": Upgrade.BUCCANEER_PARAGON,
+        "DartMonkey Paragon": Upgrade.DART_PARAGON,
+        "NinjaMonkey Paragon": Upgrade.NINJA_PARAGON,
+        "BoomerangMonkey Paragon": Upgrade.BOOMERANG_PARAGON,
+        "EngineerMonkey Paragon": Upgrade.ENGINEER_PARAGON,
+        "MonkeyAce Paragon": Upgrade.ACE_PARAGON,
+        "WizardMonkey Paragon": Upgrade.WIZARD_PARAGON,
+    },
+    normalize=lambda value: value[len("Buccaneer-"):] if value.startswith("Buccaneer-") else value,
+)
 
 
 class Achievement(Enum):
@@ -714,12 +713,11 @@ class Achievement(Enum):
 
     @staticmethod
     def from_string(value: str) -> "Achievement":
-        value = value.replace(" ", "")
-        if value in achievement_switch:
-            return achievement_switch[value]
-        return None
+        return achievement_resolver(value)
 
 
-achievement_switch = {}
-for achievement in Achievement:
-    achievement_switch[achievement.value.replace(" ", "")] = achievement
+achievement_resolver = EnumResolver(
+    Achievement,
+    key=lambda value: value.replace(" ", ""),
+    normalize=lambda value: value.replace(" ", ""),
+)
@@ -1,14 +1,14 @@
 import asyncio
+import threading
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Awaitable
+from typing import Any, Awaitable, Iterator, AsyncIterator
 from ...utils.decorators import fetch_property, exception_handler
 from ...utils.dictionaries import has_all_keys
-from ...utils.api import get, get_lb_page
-from ...utils.asyncapi import aget, aget_lb_page
+from ...utils.SharedLoad import SharedLoad
 from ...exceptions import NotFound
 from .Challenge import Challenge
 from .Score import Score
+from .Leaderboard import Leaderboard
 from .User import User
 
 
@@ -16,6 +16,7 @@ class RacePlayer(User):
     """An user who played a race and is now on the leaderboard.
     Inherits from :class:`~bloonspy.model.btd6.User`.
     """
+    __slots__ = ("_name", "_score", "_score_parts", "_submission_time")
     def __init__(self,
                  user_id: str,
                  name: str,
@@ -56,6 +57,7 @@ class Race(Challenge):
     endpoint = "/btd6/races/{}/metadata"
     event_endpoint = "/btd6/races"
     lb_endpoint = "/btd6/races/{}/leaderboard"
+    _unpickled_attrs = Challenge._unpickled_attrs + ("_race_lock", "_race_shared_load")
 
     def __init__(
             self,
@@ -64,24 +66,32 @@ class Race(Challenge):
             race_json: dict[str, Any] = None,
             **kwargs,
     ):
-        super().__init__(race_id, eager=eager, **kwargs)
         self._start = datetime.fromtimestamp(0)
         self._end = datetime.fromtimestamp(0)
         self._total_scores = 0
-        self._race_loaded = eager
+        self._race_loaded = False
+        self._race_lock = threading.RLock()
+        self._race_shared_load = SharedLoad()
+        super().__init__(race_id, eager=eager, **kwargs)
         if race_json and has_all_keys(race_json, ["name", "start", "end", "totalScores"]):
             self._parse_race(race_json)
         if eager and not self._race_loaded and self._async_client is None:
             self._load_race()
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._race_lock = threading.RLock()
+        self._race_shared_load = SharedLoad()
+
     def load_resource(self, only_if_unloaded: bool = True) -> Awaitable[None] | None:
-        async def async_load():
-            await super().load_resource(only_if_unloaded)
-            await self._load_race(only_if_unloaded)
+        resource_load = super().load_resource(only_if_unloaded)
+
+        async def async_load() -> None:
+            # The race's metadata and its entry in the event list are fetched concurrently
+            await asyncio.gather(resource_load, self._load_race(only_if_unloaded))
 
         if self._async_client:
             return async_load()
-        super().load_resource(only_if_unloaded)
         self._load_race(only_if_unloaded)
 
     def _handle_exceptions(self, exception: Exception) -> None:
@@ -91,24 +101,30 @@ class Race(Challenge):
 
     @exception_handler(Challenge.handle_exceptions)
     def _load_race(self, only_if_unloaded: bool = True) -> Awaitable[None] | None:
-        if self._race_loaded and only_if_unloaded:
-            return
+        def on_data_load(race: dict | None) -> None:
+            if race is None:
+                raise NotFound("No Race with that ID exists")
+            self._parse_race(race)
 
-        def on_data_load(data) -> None:
-            for race in data:
-                if race["id"] == self._id:
-                    self._parse_race(race)
-                    return
-            raise NotFound("No Race with that ID exists")
+        async def async_fetch() -> None:
+            race = await self._transport.get_event(self.event_endpoint, self._id, refresh=not only_if_unloaded)
+            on_data_load(race)
 
         async def async_load() -> None:
-            data = await aget(self._async_client, self.event_endpoint)
-            on_data_load(data)
+            if self._race_loaded and only_if_unloaded:
+                return
+            await self._race_shared_load.run(async_fetch)
 
-        self._race_loaded = False
         if self._async_client:
             return async_load()
-        on_data_load(get(self.event_endpoint))
+        if self._race_loaded and only_if_unloaded:
+            return
+        with self._race_lock:
+            # Another thread might have loaded it while this one was waiting
+            if self._race_loaded and only_if_unloaded:
+                return
+            self._race_loaded = False
+            on_data_load(self._transport.get_event(self.event_endpoint, self._id, refresh=not only_if_unloaded))
 
     def _parse_race(self, data: dict[str, Any]) -> None:
         self._data["name"] = data["name"]
@@ -142,7 +158,15 @@ class Race(Challenge):
         return self._total_scores
 
     @exception_handler(Challenge.handle_exceptions)
-    def leaderboard(self, pages: int = 1, start_from_page: int = 1) -> list[RacePlayer] | Awaitable[list[RacePlayer]]:
+    def leaderboard(
+            self,
+            pages: int = 1,
+            start_from_page: int = 1,
+            all_pages: bool = False,
+            columnar: bool = False,
+            raw: bool = False,
+    ) -> list[RacePlayer] | Leaderboard | list[dict[str, Any]] | \
+            Awaitable[list[RacePlayer] | Leaderboard | list[dict[str, Any]]]:
         """Get a page of the leaderboard for this event.
 
         .. note::
@@ -154,39 +178,138 @@ class Race(Challenge):
         :type pages: int
         :param start_from_page: The first page to fetch.
         :type start_from_page: int
+        :param all_pages: *New in 0.12.0*. If `True`, ignores `pages` and fetches every page from
+            `start_from_page` to the end of the leaderboard, working out how many there are from
+            :attr:`~bloonspy.model.btd6.Race.total_scores`.
+        :type all_pages: bool
+        :param columnar: *New in 0.12.0*. If `True`, returns a :class:`~bloonspy.model.btd6.Leaderboard`,
+            which stores the leaderboard by column and only creates players when indexed.
+        :type columnar: bool
+        :param raw: *New in 0.12.0*. If `True`, returns the entries exactly as the API sent them,
+            without creating any objects.
+        :type raw: bool
 
         :return: A list of players in the leaderboard.
-        :rtype: list[:class:`~bloonspy.model.btd6.RacePlayer`]
+        :rtype: list[:class:`~bloonspy.model.btd6.RacePlayer`] | ~bloonspy.model.btd6.Leaderboard | list[dict]
 
         :raise ~bloonspy.exceptions.NotFound: If the race doesn't exist or is expired.
         """
-        def on_pages_fetched(responses) -> list[RacePlayer]:
-            race_players = []
-            for page in responses:
-                for player in page:
-                    race_players.append(RacePlayer(
-                        player["profile"].split("/")[-1],
-                        player["displayName"],
-                        player["score"],
-                        player["scoreParts"],
-                        player["submissionTime"],
-                        async_client=self._async_client,
-                    ))
-            return race_players
+        def on_pages_fetched(responses) -> list[RacePlayer] | Leaderboard | list[dict[str, Any]]:
+            if raw:
+                return [player for page in responses for player in page]
+            if columnar:
+                return self._columnar_leaderboard(responses, start_from_page)
+            return [self._parse_lb_player(player) for page in responses for player in page]
 
         async def async_get_leaderboard() -> list[RacePlayer]:
-            results = await asyncio.gather(*[
-                aget_lb_page(self._async_client, self.lb_endpoint.format(self._id), page_num)
-                for page_num in range(start_from_page, start_from_page + pages)
-            ])
+            if all_pages:
+                if not self._race_loaded:
+                    await self._load_race()
+                return on_pages_fetched(await self._transport.get_all_lb_pages(
+                    self.lb_endpoint.format(self._id), self._total_scores, start_from_page
+                ))
+            results = await self._transport.get_lb_pages(
+                self.lb_endpoint.format(self._id), range(start_from_page, start_from_page + pages)
+            )
             return on_pages_fetched(results)
 
         if self._async_client:
             return async_get_leaderboard()
 
-        futures = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for page_num in range(start_from_page, start_from_page + pages):
-                futures.append(executor.submit(get_lb_page, self.lb_endpoint.format(self._id), page_num))
-        return on_pages_fetched([page.result() for page in futures])
+        if all_pages:
+            return on_pages_fetched(self._transport.get_all_lb_pages(
+                self.lb_endpoint.format(self._id), self.total_scores, start_from_page
+            ))
+
+        return on_pages_fetched(self._transport.get_lb_pages(
+            self.lb_endpoint.format(self._id), range(start_from_page, start_from_page + pages)
+        ))
+
+    def iter_leaderboard(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> Iterator[RacePlayer]:
+        """
+        *New in 0.12.0*
+
+        Iterate over the leaderboard for this event in rank order, fetching pages as they're needed.
+        Up to `read_ahead` pages are fetched in advance, so you can stop iterating at any
+        point without fetching the rest of the leaderboard. ::
+
+           for player in race.iter_leaderboard():
+               if player.score > cutoff:
+                   break
+
+        For asynchronous environments, use :func:`~bloonspy.model.btd6.Race.aiter_leaderboard` instead.
+
+        :param pages: Maximum number of pages to fetch. If `None`, goes until the end of the leaderboard.
+        :type pages: int
+        :param start_from_page: The first page to fetch.
+        :type start_from_page: int
+        :param read_ahead: How many pages can be fetched at the same time.
+        :type read_ahead: int
+
+        :return: The players in the leaderboard.
+        :rtype: Iterator[:class:`~bloonspy.model.btd6.RacePlayer`]
+
+        :raise ~bloonspy.exceptions.NotFound: If the race doesn't exist or is expired.
+        """
+        lb_pages = self._transport.iter_lb_pages(self.lb_endpoint.format(self._id), start_from_page, pages, read_ahead)
+        try:
+            for page in lb_pages:
+                for player in page:
+                    yield self._parse_lb_player(player)
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            lb_pages.close()
+
+    async def aiter_leaderboard(
+            self,
+            pages: int | None = None,
+            start_from_page: int = 1,
+            read_ahead: int = 4,
+    ) -> AsyncIterator[RacePlayer]:
+        """
+        *New in 0.12.0*
+
+        Asynchronous version of :func:`~bloonspy.model.btd6.Race.iter_leaderboard`. ::
+
+           async for player in race.aiter_leaderboard():
+               if player.score > cutoff:
+                   break
+
+        :raise ~bloonspy.exceptions.NotFound: If the race doesn't exist or is expired.
+        """
+        lb_pages = self._transport.aiter_lb_pages(self.lb_endpoint.format(self._id), start_from_page, pages, read_ahead)
+        try:
+            async for page in lb_pages:
+                for player in page:
+                    yield self._parse_lb_player(player)
+        except Exception as exc:
+            self.handle_exceptions(exc)
+            raise
+        finally:
+            await lb_pages.aclose()
+
+    def _columnar_leaderboard(self, pages: list[list[dict[str, Any]]], start_from_page: int) -> Leaderboard:
+        leaderboard = Leaderboard(
+            lambda *entry: RacePlayer(*entry, async_client=self._async_client, transport=self._transport)
+        )
+        for page_num, page in enumerate(pages, start_from_page):
+            leaderboard.append_page(page, page_num)
+        return leaderboard
 
+    def _parse_lb_player(self, player: dict[str, Any]) -> RacePlayer:
+        return RacePlayer(
+            player["profile"].split("/")[-1],
+            player["displayName"],
+            player["score"],
+            player["scoreParts"],
+            player["submissionTime"],
+            async_client=self._async_client,
+            transport=self._transport,
+        )
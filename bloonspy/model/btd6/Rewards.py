@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from .Tower import Tower
 from typing import Literal
 from ...exceptions import InvalidTowerPath
+from ...utils.Interner import Interner
 
 
-@dataclass
+@dataclass(frozen=True)
 class InstaMonkey:
     """
     An Insta Monkey.
@@ -20,6 +21,7 @@ class InstaMonkey:
         except exceptions.InvalidTowerPath:
             print("3-3-3 is not a valid path!")
 
+    *Changed in 0.12.0:* Insta Monkeys are immutable.
     """
     tower: Tower  #: The tower this Insta Monkey is for.
     top_path: int  #: Top path upgrades.
@@ -41,6 +43,7 @@ class InstaMonkey:
 
         if is_invalid:
             raise InvalidTowerPath(self.top_path, self.middle_path, self.bottom_path)
+        object.__setattr__(self, "_hash", hash((self.tower, self.top_path, self.middle_path, self.bottom_path)))
 
     @property
     def tier(self) -> int:
@@ -56,7 +59,11 @@ class InstaMonkey:
             self.bottom_path == other.bottom_path
 
     def __hash__(self) -> int:
-        return hash(f"{self.tower.value}{self.top_path}{self.middle_path}{self.bottom_path}")
+        return self._hash
+
+    def __reduce__(self):
+        # Hashes change between processes, so it's worked out again when unpickled
+        return InstaMonkey, (self.tower, self.top_path, self.middle_path, self.bottom_path)
 
     def __str__(self) -> str:
         return f"{self.tower.value} - {self.top_path}{self.middle_path}{self.bottom_path}"
@@ -65,6 +72,9 @@ class InstaMonkey:
         return str(self)
 
 
+insta_monkey_interner = Interner(InstaMonkey)
+
+
 @dataclass
 class Reward:
     """A generic reward."""
@@ -3,6 +3,8 @@ import warnings
 from datetime import timedelta
 from enum import Enum
 from typing import Dict, Any
+from ...utils.EnumResolver import EnumResolver
+from ...utils.Interner import Interner
 
 
 class ScoreType(Enum):
@@ -26,23 +28,24 @@ class ScoreType(Enum):
 
     @staticmethod
     def from_string(value: str) -> "ScoreType":
-        score_type_switch = {
-            "GameTime": ScoreType.GAME_TIME,
-            "CashSpent": ScoreType.LEAST_CASH,
-            "Tiers": ScoreType.LEAST_TIERS,
-            "Time after event start": ScoreType.TIME_AFTER_EVENT_START,
-            "LeastCash": ScoreType.LEAST_CASH,
-            "LeastTiers": ScoreType.LEAST_TIERS,
-        }
-        if value in score_type_switch:
-            return score_type_switch[value]
-        value = value.replace(" ", "")
-        if value in score_type_switch:
-            return score_type_switch[value]
-        return None
-
-
-@dataclass
+        return score_type_resolver(value)
+
+
+score_type_resolver = EnumResolver(
+    ScoreType,
+    aliases={
+        "GameTime": ScoreType.GAME_TIME,
+        "CashSpent": ScoreType.LEAST_CASH,
+        "Tiers": ScoreType.LEAST_TIERS,
+        "Time after event start": ScoreType.TIME_AFTER_EVENT_START,
+        "LeastCash": ScoreType.LEAST_CASH,
+        "LeastTiers": ScoreType.LEAST_TIERS,
+    },
+    normalize=lambda value: value.replace(" ", ""),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Score:
     """
     An event score.
@@ -75,12 +78,10 @@ class Score:
 
     @staticmethod
     def from_json(data: Dict[str, Any]) -> "Score":
-        value = data["score"]
         if data["type"] == "time":
-            value = timedelta(microseconds=data["score"]*1000)
-        return Score(
-            ScoreType.from_string(data["name"]), value
-        )
+            return Score(ScoreType.from_string(data["name"]), timedelta(microseconds=data["score"]*1000))
+        # Cash and tiers scores repeat a lot across a leaderboard, times hardly ever do
+        return score_interner(ScoreType.from_string(data["name"]), data["score"])
 
     def __str__(self) -> str:
         if self.type == ScoreType.LEAST_CASH:
@@ -113,3 +114,6 @@ class Score:
         return isinstance(other, Score) and \
             other.type == self.type and \
             self.type <= other.type
+
+
+score_interner = Interner(Score)
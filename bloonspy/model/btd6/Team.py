@@ -2,8 +2,9 @@ from typing import Awaitable, Any
 from enum import Enum
 from ...exceptions import NotFound
 from ...utils.decorators import fetch_property
+from ...utils.EnumResolver import EnumResolver
 from ..Loadable import Loadable
-from ..Asset import Asset
+from ..Asset import Asset, asset_interner
 from .User import User
 
 
@@ -16,18 +17,21 @@ class TeamStatus(Enum):
 
     @staticmethod
     def from_string(value: str) -> "TeamStatus":
-        status_switch = {
-            "OPEN": TeamStatus.PUBLIC,
-            "CLOSED": TeamStatus.PRIVATE,
-            "FILTERED": TeamStatus.INVITE_ONLY,
-            "DISBANDED": TeamStatus.DISBANDED,
-        }
-        return status_switch[value] if value in status_switch else None
+        return status_resolver(value)
+
+
+status_resolver = EnumResolver(TeamStatus, aliases={
+    "OPEN": TeamStatus.PUBLIC,
+    "CLOSED": TeamStatus.PRIVATE,
+    "FILTERED": TeamStatus.INVITE_ONLY,
+    "DISBANDED": TeamStatus.DISBANDED,
+})
 
 
 class Team(Loadable):
     """A BTD6 Team."""
     endpoint = "/btd6/guild/{}"
+    _identity_mapped = True
 
     def _handle_exceptions(self, exception: Exception) -> None:
         error_msg = str(exception)
@@ -56,7 +60,7 @@ class Team(Loadable):
             ("banner", "bannerURL"), ("icon", "iconURL"), ("frame", "frameURL"),
         ]
         for asset_name, asset_url in assets:
-            self._data[asset_name] = Asset(raw_resource[asset_name], raw_resource[asset_url])
+            self._data[asset_name] = asset_interner(raw_resource[asset_name], raw_resource[asset_url])
         self._data["status"] = TeamStatus.from_string(raw_resource["status"])
         self._data["owner_id"] = raw_resource["owner"].split("/")[-1]
 
@@ -139,7 +143,7 @@ class Team(Loadable):
         async def async_owner() -> User | None:
             if self.owner_id is None:
                 return None
-            usr = User(self.owner_id, async_client=self._async_client)
+            usr = User(self.owner_id, async_client=self._async_client, transport=self._transport)
             await usr.load_resource()
             return usr
 
@@ -148,4 +152,4 @@ class Team(Loadable):
 
         if self.owner_id is None:
             return None
-        return User(self.owner_id, eager=True, async_client=self._async_client)
+        return User(self.owner_id, eager=True, async_client=self._async_client, transport=self._transport)
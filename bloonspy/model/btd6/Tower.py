@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from ...utils.EnumResolver import EnumResolver
 
 
 class Tower(Enum):
@@ -50,48 +51,7 @@ class Tower(Enum):
 
     @staticmethod
     def from_string(value: str) -> "Tower":
-        tower_switch = {
-            "Quincy": Tower.QUINCY,
-            "Gwendolin": Tower.GWENDOLIN,
-            "StrikerJones": Tower.STRIKER_JONES,
-            "ObynGreenfoot": Tower.OBYN,
-            "CaptainChurchill": Tower.CHURCHILL,
-            "Benjamin": Tower.BENJAMIN,
-            "Ezili": Tower.EZILI,
-            "PatFusty": Tower.PAT_FUSTY,
-            "Sauda": Tower.SAUDA,
-            "Psi": Tower.PSI,
-            "Geraldo": Tower.GERALDO,
-            "AdmiralBrickell": Tower.BRICKELL,
-            "Etienne": Tower.ETIENNE,
-            "Adora": Tower.ADORA,
-            "DartMonkey": Tower.DART_MONKEY,
-            "BoomerangMonkey": Tower.BOOMERANG_MONKEY,
-            "TackShooter": Tower.TACK_SHOOTER,
-            "BombShooter": Tower.BOMB_SHOOTER,
-            "GlueGunner": Tower.GLUE_GUNNER,
-            "IceMonkey": Tower.ICE_MONKEY,
-            "SniperMonkey": Tower.SNIPER_MONKEY,
-            "MonkeyBuccaneer": Tower.MONKEY_BUCCANEER,
-            "MonkeySub": Tower.MONKEY_SUB,
-            "DartlingGunner": Tower.DARTLING_GUNNER,
-            "MonkeyAce": Tower.MONKEY_ACE,
-            "HeliPilot": Tower.HELI_PILOT,
-            "MortarMonkey": Tower.MORTAR_MONKEY,
-            "WizardMonkey": Tower.WIZARD_MONKEY,
-            "NinjaMonkey": Tower.NINJA_MONKEY,
-            "SuperMonkey": Tower.SUPER_MONKEY,
-            "Druid": Tower.DRUID,
-            "Alchemist": Tower.ALCHEMIST,
-            "MonkeyVillage": Tower.MONKEY_VILLAGE,
-            "BananaFarm": Tower.BANANA_FARM,
-            "EngineerMonkey": Tower.ENGINEER_MONKEY,
-            "SpikeFactory": Tower.SPIKE_FACTORY,
-            "BeastHandler": Tower.BEAST_HANDLER,
-            "Mermonkey": Tower.MERMONKEY,
-            "Desperado": Tower.DESPERADO,
-        }
-        return tower_switch[value] if value in tower_switch else None
+        return tower_resolver(value)
 
     def is_hero(self):
         return self in [
@@ -101,6 +61,49 @@ class Tower(Enum):
         ]
 
 
+tower_resolver = EnumResolver(Tower, aliases={
+    "Quincy": Tower.QUINCY,
+    "Gwendolin": Tower.GWENDOLIN,
+    "StrikerJones": Tower.STRIKER_JONES,
+    "ObynGreenfoot": Tower.OBYN,
+    "CaptainChurchill": Tower.CHURCHILL,
+    "Benjamin": Tower.BENJAMIN,
+    "Ezili": Tower.EZILI,
+    "PatFusty": Tower.PAT_FUSTY,
+    "Sauda": Tower.SAUDA,
+    "Psi": Tower.PSI,
+    "Geraldo": Tower.GERALDO,
+    "AdmiralBrickell": Tower.BRICKELL,
+    "Etienne": Tower.ETIENNE,
+    "Adora": Tower.ADORA,
+    "DartMonkey": Tower.DART_MONKEY,
+    "BoomerangMonkey": Tower.BOOMERANG_MONKEY,
+    "TackShooter": Tower.TACK_SHOOTER,
+    "BombShooter": Tower.BOMB_SHOOTER,
+    "GlueGunner": Tower.GLUE_GUNNER,
+    "IceMonkey": Tower.ICE_MONKEY,
+    "SniperMonkey": Tower.SNIPER_MONKEY,
+    "MonkeyBuccaneer": Tower.MONKEY_BUCCANEER,
+    "MonkeySub": Tower.MONKEY_SUB,
+    "DartlingGunner": Tower.DARTLING_GUNNER,
+    "MonkeyAce": Tower.MONKEY_ACE,
+    "HeliPilot": Tower.HELI_PILOT,
+    "MortarMonkey": Tower.MORTAR_MONKEY,
+    "WizardMonkey": Tower.WIZARD_MONKEY,
+    "NinjaMonkey": Tower.NINJA_MONKEY,
+    "SuperMonkey": Tower.SUPER_MONKEY,
+    "Druid": Tower.DRUID,
+    "Alchemist": Tower.ALCHEMIST,
+    "MonkeyVillage": Tower.MONKEY_VILLAGE,
+    "BananaFarm": Tower.BANANA_FARM,
+    "EngineerMonkey": Tower.ENGINEER_MONKEY,
+    "SpikeFactory": Tower.SPIKE_FACTORY,
+    "BeastHandler": Tower.BEAST_HANDLER,
+    "Mermonkey": Tower.MERMONKEY,
+    "Desperado": Tower.DESPERADO,
+})
+
+
 class HeroSkin(Enum):
     """Alternative hero costumes in the game."""
     # Why are these 3 skins????
@@ -135,19 +138,17 @@ class HeroSkin(Enum):
 
     @staticmethod
     def from_string(value: str) -> "HeroSkin":
-        quirky_names = {
-            "ObynOceanGuardian": HeroSkin.OCEAN_GUARDIAN_OBYN,
-            "CircusGwendolin": HeroSkin.HARLEGWEN,
-            "ETnEtienne": HeroSkin.ETN,
-            "MoltenObyn": HeroSkin.MOUNTAIN_OBYN,
-        }
-        if value in quirky_names.keys():
-            return quirky_names[value]
-
-        value = re.sub(r"\s+", "", value)
-        return hero_skin_switch[value] if value in hero_skin_switch else None
-
-
-hero_skin_switch = {}
-for hero_skin in HeroSkin:
-    hero_skin_switch[re.sub(r"\s+", "", hero_skin.value)] = hero_skin
+        return hero_skin_resolver(value)
+
+
+hero_skin_resolver = EnumResolver(
+    HeroSkin,
+    key=lambda value: re.sub(r"\s+", "", value),
+    aliases={
+        "ObynOceanGuardian": HeroSkin.OCEAN_GUARDIAN_OBYN,
+        "CircusGwendolin": HeroSkin.HARLEGWEN,
+        "ETnEtienne": HeroSkin.ETN,
+        "MoltenObyn": HeroSkin.MOUNTAIN_OBYN,
+    },
+    normalize=lambda value: re.sub(r"\s+", "", value),
+)
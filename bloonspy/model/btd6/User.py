@@ -2,9 +2,9 @@ from dataclasses import dataclass, field
 from typing import Awaitable, Any
 from ...exceptions import NotFound, Forbidden
 from ...utils.decorators import fetch_property
-from ...utils.dictionaries import rename_keys
+from ...utils.dictionaries import compile_key_paths
 from ..Loadable import Loadable
-from ..Asset import Asset
+from ..Asset import Asset, asset_interner
 from .Tower import Tower
 from .UserSave import UserSave
 from .Medals import EventMedals, MapMedals, CtGlobalMedals, CtLocalMedals
@@ -57,9 +57,81 @@ class GameplayStats:
     # monkeys_placed: int = field(default=0)  #: Total monkeys placed.
 
 
+MAP_MEDAL_KEYS = [
+    ("CHIMPS-BLACK", "chimps_black"), ("Clicks", "chimps_red"), ("Easy", "easy"), ("Medium", "medium"),
+    ("Hard", "hard"), ("PrimaryOnly", "primary_only"), ("Deflation", "deflation"),
+    ("MilitaryOnly", "military_only"), ("Apopalypse", "apopalypse"), ("Reverse", "reverse"),
+    ("MagicOnly", "magic_only"), ("HalfCash", "half_cash"), ("DoubleMoabHealth", "double_hp_moabs"),
+    ("AlternateBloonsRounds", "alternate_bloons_rounds"), ("Impoppable", "impoppable")
+]
+
+EVENT_MEDAL_KEYS = [
+    ("BlackDiamond", "first"), ("RedDiamond", "second"), ("Diamond", "third"), ("GoldDiamond", "top_50"),
+    ("DoubleGold", "top_1_percent"), ("GoldSilver", "top_10_percent"), ("DoubleSilver", "top_25_percent"),
+    ("Silver", "top_50_percent"), ("Bronze", "top_75_percent")
+]
+
+CT_LOCAL_MEDAL_KEYS = [
+    ("BlackDiamond", "first"), ("RedDiamond", "second"), ("Diamond", "third"), ("GoldDiamond", "top_10"),
+    ("DoubleGold", "top_20"), ("Silver", "top_40"), ("Bronze", "top_60")
+]
+
+CT_GLOBAL_MEDAL_KEYS = [
+    ("Diamond", "top_25"), ("GoldDiamond", "top_100"), ("DoubleGold", "top_1_percent"),
+    ("GoldSilver", "top_10_percent"), ("DoubleSilver", "top_25_percent"), ("Silver", "top_50_percent"),
+    ("Bronze", "top_75_percent")
+]
+
+STATS_KEYS = [
+    ("gameplay.cashEarned", "cash_earned"),
+    ("gameplay.challengesCompleted", "challenges_completed"),
+    ("gameplay.collectionChestsOpened", "collection_chests_opened"),
+    ("gameplay.coopCashGiven", "coop_cash_given"),
+    ("gameplay.dailyRewards", "daily_rewards"),
+    ("gameplay.gameCount", "game_count"),
+    ("gameplay.gamesWon", "games_won"),
+    ("gameplay.highestRound", "highest_round"),
+    ("gameplay.highestRoundCHIMPS", "highest_round_chimps"),
+    ("gameplay.highestRoundDeflation", "highest_round_deflation"),
+    ("gameplay.instaMonkeyCollection", "insta_monkey_collection"),
+    ("gameplay.monkeyTeamsWins", "monkey_teams_wins"),
+    ("gameplay.powersUsed", "powers_used"),
+    ("gameplay.totalOdysseysCompleted", "total_odysseys_completed"),
+    ("gameplay.totalOdysseyStars", "total_odyssey_stars"),
+    ("gameplay.totalTrophiesEarned", "total_trophies_earned"),
+    ("gameplay.damageDoneToBosses", "damage_done_to_bosses"),
+    ("bloonsPopped.necroBloonsReanimated", "necro_bloons_reanimated"),
+    ("bloonsPopped.transformingTonicsUsed", "transforming_tonics_used"),
+    ("bloonsPopped.bloonsLeaked", "bloons_leaked"),
+]
+
+BLOONS_POPPED_KEYS = [
+    ("badsPopped", "bads"),
+    ("bfbsPopped", "bfbs"),
+    ("bloonsPopped", "total"),
+    ("camosPopped", "camos"),
+    ("ceramicsPopped", "ceramics"),
+    ("coopBloonsPopped", "total_coop"),
+    ("goldenBloonsPopped", "golden"),
+    ("leadsPopped", "leads"),
+    ("moabsPopped", "moabs"),
+    ("purplesPopped", "purples"),
+    ("regrowsPopped", "regrows"),
+    ("zomgsPopped", "zomgs"),
+]
+
+extract_map_medals = compile_key_paths(MAP_MEDAL_KEYS)
+extract_event_medals = compile_key_paths(EVENT_MEDAL_KEYS)
+extract_ct_local_medals = compile_key_paths(CT_LOCAL_MEDAL_KEYS)
+extract_ct_global_medals = compile_key_paths(CT_GLOBAL_MEDAL_KEYS)
+extract_stats = compile_key_paths(STATS_KEYS)
+extract_bloons_popped = compile_key_paths(BLOONS_POPPED_KEYS)
+
+
 class User(Loadable):
     """A BTD6 player. Inherits from :class:`~bloonspy.model.Loadable`."""
     endpoint = "/btd6/users/{}"
+    _identity_mapped = True
 
     def _handle_exceptions(self, exception: Exception) -> None:
         error_msg = str(exception)
@@ -73,103 +145,40 @@ class User(Loadable):
         for key in copy_keys:
             self._data[key] = raw_user[key]
 
-        self._data["avatar"] = Asset(raw_user["avatar"], raw_user["avatarURL"])
-        self._data["banner"] = Asset(raw_user["banner"], raw_user["bannerURL"])
-
-        map_medal_keys = [
-            ("CHIMPS-BLACK", "chimps_black"), ("Clicks", "chimps_red"), ("Easy", "easy"), ("Medium", "medium"),
-            ("Hard", "hard"), ("PrimaryOnly", "primary_only"), ("Deflation", "deflation"),
-            ("MilitaryOnly", "military_only"), ("Apopalypse", "apopalypse"), ("Reverse", "reverse"),
-            ("MagicOnly", "magic_only"), ("HalfCash", "half_cash"), ("DoubleMoabHealth", "double_hp_moabs"),
-            ("AlternateBloonsRounds", "alternate_bloons_rounds"), ("Impoppable", "impoppable")
-        ]
-        self._data["single_player_medals"] = MapMedals(
-            **rename_keys(raw_user["_medalsSinglePlayer"], map_medal_keys)
-        )
-        self._data["coop_medals"] = MapMedals(
-            **rename_keys(raw_user["_medalsMultiplayer"], map_medal_keys)
-        )
-
-        event_medal_keys = [
-            ("BlackDiamond", "first"), ("RedDiamond", "second"), ("Diamond", "third"), ("GoldDiamond", "top_50"),
-            ("DoubleGold", "top_1_percent"), ("GoldSilver", "top_10_percent"), ("DoubleSilver", "top_25_percent"),
-            ("Silver", "top_50_percent"), ("Bronze", "top_75_percent")
-        ]
-        self._data["boss_normal_medals"] = EventMedals(
-            **rename_keys(raw_user["_medalsBoss"], event_medal_keys)
-        )
-        self._data["boss_elite_medals"] = EventMedals(
-            **rename_keys(raw_user["_medalsBossElite"], event_medal_keys)
-        )
-        self._data["race_medals"] = EventMedals(
-            **rename_keys(raw_user["_medalsRace"], event_medal_keys)
-        )
-
-        ct_local_medal_keys = [
-            ("BlackDiamond", "first"), ("RedDiamond", "second"), ("Diamond", "third"), ("GoldDiamond", "top_10"),
-            ("DoubleGold", "top_20"), ("Silver", "top_40"), ("Bronze", "top_60")
-        ]
-        ct_global_medal_keys = [
-            ("Diamond", "top_25"), ("GoldDiamond", "top_100"), ("DoubleGold", "top_1_percent"),
-            ("GoldSilver", "top_10_percent"), ("DoubleSilver", "top_25_percent"), ("Silver", "top_50_percent"),
-            ("Bronze", "top_75_percent")
-        ]
-        self._data["ct_local_medals"] = CtLocalMedals(
-            **rename_keys(raw_user["_medalsCTLocal"], ct_local_medal_keys)
-        )
-        self._data["ct_global_medals"] = CtGlobalMedals(
-            **rename_keys(raw_user["_medalsCTLocal"], ct_global_medal_keys)
-        )
-
-        stats_keys = [
-            ("gameplay.cashEarned", "cash_earned"),
-            ("gameplay.challengesCompleted", "challenges_completed"),
-            ("gameplay.collectionChestsOpened", "collection_chests_opened"),
-            ("gameplay.coopCashGiven", "coop_cash_given"),
-            ("gameplay.dailyRewards", "daily_rewards"),
-            ("gameplay.gameCount", "game_count"),
-            ("gameplay.gamesWon", "games_won"),
-            ("gameplay.highestRound", "highest_round"),
-            ("gameplay.highestRoundCHIMPS", "highest_round_chimps"),
-            ("gameplay.highestRoundDeflation", "highest_round_deflation"),
-            ("gameplay.instaMonkeyCollection", "insta_monkey_collection"),
-            ("gameplay.monkeyTeamsWins", "monkey_teams_wins"),
-            ("gameplay.powersUsed", "powers_used"),
-            ("gameplay.totalOdysseysCompleted", "total_odysseys_completed"),
-            ("gameplay.totalOdysseyStars", "total_odyssey_stars"),
-            ("gameplay.totalTrophiesEarned", "total_trophies_earned"),
-            ("gameplay.damageDoneToBosses", "damage_done_to_bosses"),
-            ("bloonsPopped.necroBloonsReanimated", "necro_bloons_reanimated"),
-            ("bloonsPopped.transformingTonicsUsed", "transforming_tonics_used"),
-            ("bloonsPopped.bloonsLeaked", "bloons_leaked"),
-        ]
-        bloons_popped_keys = [
-            ("badsPopped", "bads"),
-            ("bfbsPopped", "bfbs"),
-            ("bloonsPopped", "total"),
-            ("camosPopped", "camos"),
-            ("ceramicsPopped", "ceramics"),
-            ("coopBloonsPopped", "total_coop"),
-            ("goldenBloonsPopped", "golden"),
-            ("leadsPopped", "leads"),
-            ("moabsPopped", "moabs"),
-            ("purplesPopped", "purples"),
-            ("regrowsPopped", "regrows"),
-            ("zomgsPopped", "zomgs"),
-        ]
-        self._data["stats"] = GameplayStats(
-            most_experienced_monkey=Tower.from_string(raw_user["mostExperiencedMonkey"]),
-            bloons_popped=BloonsPoppedStats(**rename_keys(raw_user["bloonsPopped"], bloons_popped_keys)),
-            **rename_keys(raw_user, stats_keys)
-        )
-
-        heroes_placed = {}
-        for hero in raw_user["heroesPlaced"].keys():
-            heroes_placed[Tower.from_string(hero)] = raw_user["heroesPlaced"][hero]
-        self._data["heroes_placed"] = heroes_placed
+        self._data["avatar"] = asset_interner(raw_user["avatar"], raw_user["avatarURL"])
+        self._data["banner"] = asset_interner(raw_user["banner"], raw_user["bannerURL"])
+
+        # Medals, stats and heroes are parsed the first time they're accessed
+        for section in self._sections:
+            self._data.pop(section, None)
+        self._data["raw"] = raw_user
 
         self._loaded = True
 
+    _sections = {
+        "single_player_medals": lambda raw: MapMedals(**extract_map_medals(raw["_medalsSinglePlayer"])),
+        "coop_medals": lambda raw: MapMedals(**extract_map_medals(raw["_medalsMultiplayer"])),
+        "boss_normal_medals": lambda raw: EventMedals(**extract_event_medals(raw["_medalsBoss"])),
+        "boss_elite_medals": lambda raw: EventMedals(**extract_event_medals(raw["_medalsBossElite"])),
+        "race_medals": lambda raw: EventMedals(**extract_event_medals(raw["_medalsRace"])),
+        "ct_local_medals": lambda raw: CtLocalMedals(**extract_ct_local_medals(raw["_medalsCTLocal"])),
+        "ct_global_medals": lambda raw: CtGlobalMedals(**extract_ct_global_medals(raw["_medalsCTLocal"])),
+        "stats": lambda raw: GameplayStats(
+            most_experienced_monkey=Tower.from_string(raw["mostExperiencedMonkey"]),
+            bloons_popped=BloonsPoppedStats(**extract_bloons_popped(raw["bloonsPopped"])),
+            **extract_stats(raw)
+        ),
+        "heroes_placed": lambda raw: {
+            Tower.from_string(hero): placed for hero, placed in raw["heroesPlaced"].items()
+        },
+    }
+
+    def _section(self, name: str) -> Any:
+        """Parse a section of the loaded data, if it hasn't been parsed yet."""
+        if name not in self._data:
+            self._data[name] = self._sections[name](self._data["raw"])
+        return self._data[name]
+
     @property
     @fetch_property(Loadable.load_resource)
     def name(self) -> str:
@@ -222,55 +231,55 @@ class User(Loadable):
     @fetch_property(Loadable.load_resource)
     def single_player_medals(self) -> MapMedals:
         """Medals earned in single player mode."""
-        return self._data["single_player_medals"]
+        return self._section("single_player_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def coop_medals(self) -> MapMedals:
         """Medals earned in coop mode."""
-        return self._data["coop_medals"]
+        return self._section("coop_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def boss_normal_medals(self) -> EventMedals:
         """Ranked normal boss mdeals."""
-        return self._data["boss_normal_medals"]
+        return self._section("boss_normal_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def boss_elite_medals(self) -> EventMedals:
         """Ranked elite boss medals."""
-        return self._data["boss_elite_medals"]
+        return self._section("boss_elite_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def race_medals(self) -> EventMedals:
         """Race event medals."""
-        return self._data["race_medals"]
+        return self._section("race_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def ct_local_medals(self) -> CtLocalMedals:
         """Contested Territory local medals."""
-        return self._data["ct_local_medals"]
+        return self._section("ct_local_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def ct_global_medals(self) -> CtGlobalMedals:
         """Contested Territory global medals."""
-        return self._data["ct_global_medals"]
+        return self._section("ct_global_medals")
 
     @property
     @fetch_property(Loadable.load_resource)
     def stats(self) -> GameplayStats:
         """Gameplay stats."""
-        return self._data["stats"]
+        return self._section("stats")
 
     @property
     @fetch_property(Loadable.load_resource)
     def heroes_placed(self) -> dict[Tower, int]:
         """Number of times each hero has been placed."""
-        return self._data["heroes_placed"]
+        return self._section("heroes_placed")
 
     def get_progress(self) -> Awaitable[UserSave] | UserSave:
         """
@@ -290,7 +299,7 @@ class User(Loadable):
         """
         if not self.has_oak():
             raise Forbidden()
-        return UserSave.fetch(self.id, self._async_client)
+        return UserSave.fetch(self.id, self._async_client, transport=self._transport)
 
     def has_oak(self) -> bool:
         """
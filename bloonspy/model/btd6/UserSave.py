@@ -1,70 +1,289 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 import aiohttp
 from ..GameVersion import GameVersion
 from .Tower import Tower, HeroSkin
-from .Power import Power, PowerAmount
+from .Power import Power, PowerAmount, power_amount_interner
 from .Gamemode import Gamemode
 from ...utils.dictionaries import enum_any_dict
-from .Rewards import InstaMonkey
+from .Rewards import InstaMonkey, insta_monkey_interner
 from .Progress import MonkeyKnowledge, Upgrade, Achievement
 from .Map import MapProgress, Map, GamemodeCompletionData
 from .Cosmetics import TrophyStoreItemStatus
-from typing import Any, Awaitable
-from ...utils.api import get
-from ...utils.asyncapi import aget
+from typing import Any, Awaitable, Callable
+from ...utils.api import Transport, default_transport
+from ...utils.asyncapi import AsyncTransport, session_transport
 from ...exceptions import NotFound
 from ...utils.decorators import exception_handler
 
 
-@dataclass(frozen=True, eq=True)
 class UserSave:
     """
     *New in 0.5.0*
 
-    A dataclass detailing an user's save state.
+    Details an user's save state.
+
+    *Changed in 0.12.0:* The save is parsed one section at a time, the first time each is accessed,
+    so reading a few fields doesn't parse the whole save. It's still immutable.
     """
-    latest_game_version: GameVersion  #: The latest version of the game that this player has played.
-    tower_xp: dict[Tower, int]  #: XP accumulated for each tower.
-    unlocked_upgrades: dict[Upgrade, bool]  #: Upgrades unlocked.
-    unlocked_knowledge: dict[MonkeyKnowledge, bool]  #: Monkey Knowledge unlocked.
-    unlocked_towers: dict[Tower, bool]  #: Towers unlocked.
-    unlocked_heros: dict[Tower, bool]  #: Heroes unlocked.
-    unlocked_hero_skins: dict[HeroSkin, bool]  #: Hero skins unlocked.
-    games_played: int  #: Total games played.
-    powers: dict[Power, PowerAmount]  #: *New in 0.5.1*. Amount of powers obtained.
-    insta_monkeys: dict[Tower, dict[InstaMonkey, int]]  #: Insta monkeys collected.
-    monkey_money: int  #: Current Monkey Money.
-    xp: int  #: Current XP.
-    rank: int  #: Current Rank.
-    veteran_xp: int  #: Current Veteran XP.
-    veteran_rank: int  #: Current Veteran Rank.
-    trophies: int  #: Current trophies.
-    total_trophies_earned: int  #: Lifetime trophies earned through events.
-    total_team_trophies_earned: int  #: Lifetime team trophies earned through events.
-    knowledge_points: int  #: Current Monkey Knowledge points.
-    primary_hero: Tower  #: Current Selected Hero.
-    achievements_claimed: list[Achievement]  #: Achievements claimed.
-    highest_round: int  #: Highest seen round.
-    daily_reward_count: int  #: Daily rewards claimed.
-    total_daily_challenges_completed: int  #: Total Daily Challenges completed.
-    consecutive_daily_challenges_completed: int  #: Current number of consecutive days a Daily Challenge has been completed.
-    total_races_entered: int  #: Total eaces entered.
-    challenges_played: int  #: Total challenges played.
-    challenges_shared: int  #: Total challenges shared.
-    total_completed_odysseys: int  #: Total Odysseys completed.
-    unlocked_big_bloons: bool  #: Whether Big Bloons has been unlocked.
-    big_bloons_active: bool  #: Whether Big Bloons is active.
-    unlocked_small_bloons: bool  #: Whether Small Bloons has been unlocked.
-    small_bloons_active: bool  #: Whether Small Bloons is active.
-    unlocked_big_towers: bool  #: Whether Big Towers has been unlocked.
-    big_towers_active: bool  #: Whether Big Towers is active.
-    unlocked_small_towers: bool  #: Whether Small Towers has been unlocked.
-    small_towers_active: bool  #: Whether Small Towers is active.
-    named_monkeys: dict[Tower, str]  #: Named monkey names.
-    collection_event_crates_opened: int  #: Number of ollect event crates opened.
-    continues_used: int  #: Continues used.
-    trophy_store_items: TrophyStoreItemStatus  #: Trophy Store items purchased.
-    map_progress: dict[Map, MapProgress]  #: The player's map completions.
+    __slots__ = ("_data", "_sections")
+
+    def __init__(self, data: dict[str, Any]):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_sections", {})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: "UserSave") -> bool:
+        return isinstance(other, UserSave) and self._data == other._data
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"UserSave(latest_game_version={self.latest_game_version}, rank={self.rank})"
+
+    def _section(self, name: str, parse: Callable[[dict[str, Any]], Any]) -> Any:
+        """Parse a section of the save, if it hasn't been parsed yet."""
+        if name not in self._sections:
+            self._sections[name] = parse(self._data)
+        return self._sections[name]
+
+    @property
+    def latest_game_version(self) -> GameVersion:
+        """The latest version of the game that this player has played."""
+        return self._section("latest_game_version", lambda data: GameVersion.from_string(data["latestGameVersion"]))
+
+    @property
+    def tower_xp(self) -> dict[Tower, int]:
+        """XP accumulated for each tower."""
+        return self._section("tower_xp", lambda data: enum_any_dict(Tower, data["towerXP"]))
+
+    @property
+    def unlocked_upgrades(self) -> dict[Upgrade, bool]:
+        """Upgrades unlocked."""
+        return self._section("unlocked_upgrades", lambda data: enum_any_dict(Upgrade, data["acquiredUpgrades"]))
+
+    @property
+    def unlocked_knowledge(self) -> dict[MonkeyKnowledge, bool]:
+        """Monkey Knowledge unlocked."""
+        return self._section("unlocked_knowledge", lambda data: enum_any_dict(MonkeyKnowledge, data["acquiredKnowledge"]))
+
+    @property
+    def unlocked_towers(self) -> dict[Tower, bool]:
+        """Towers unlocked."""
+        return self._section("unlocked_towers", lambda data: enum_any_dict(Tower, data["unlockedTowers"]))
+
+    @property
+    def unlocked_heros(self) -> dict[Tower, bool]:
+        """Heroes unlocked."""
+        return self._section("unlocked_heros", lambda data: enum_any_dict(Tower, data["unlockedHeros"]))
+
+    @property
+    def unlocked_hero_skins(self) -> dict[HeroSkin, bool]:
+        """Hero skins unlocked."""
+        return self._section("unlocked_hero_skins", lambda data: enum_any_dict(HeroSkin, data["unlockedSkins"]))
+
+    @property
+    def games_played(self) -> int:
+        """Total games played."""
+        return self._data["gamesPlayed"]
+
+    @property
+    def powers(self) -> dict[Power, PowerAmount]:
+        """*New in 0.5.1*. Amount of powers obtained."""
+        return self._section("powers", lambda data: enum_any_dict(Power, data["powers"], parse_raw=parse_power_amount))
+
+    @property
+    def insta_monkeys(self) -> dict[Tower, dict[InstaMonkey, int]]:
+        """Insta monkeys collected."""
+        return self._section("insta_monkeys", lambda data: parse_insta_monkeys(data["instaTowers"]))
+
+    @property
+    def monkey_money(self) -> int:
+        """Current Monkey Money."""
+        return self._data["monkeyMoney"]
+
+    @property
+    def xp(self) -> int:
+        """Current XP."""
+        return self._data["xp"]
+
+    @property
+    def rank(self) -> int:
+        """Current Rank."""
+        return self._data["rank"]
+
+    @property
+    def veteran_xp(self) -> int:
+        """Current Veteran XP."""
+        return self._data["veteranXp"]
+
+    @property
+    def veteran_rank(self) -> int:
+        """Current Veteran Rank."""
+        return self._data["veteranRank"]
+
+    @property
+    def trophies(self) -> int:
+        """Current trophies."""
+        return self._data["trophies"]
+
+    @property
+    def total_trophies_earned(self) -> int:
+        """Lifetime trophies earned through events."""
+        return self._data["lifetimeTrophies"]
+
+    @property
+    def total_team_trophies_earned(self) -> int:
+        """Lifetime team trophies earned through events."""
+        return self._data["lifetimeTeamTrophies"]
+
+    @property
+    def knowledge_points(self) -> int:
+        """Current Monkey Knowledge points."""
+        return self._data["knowledgePoints"]
+
+    @property
+    def primary_hero(self) -> Tower:
+        """Current Selected Hero."""
+        return self._section("primary_hero", lambda data: Tower.from_string(data["primaryHero"]))
+
+    @property
+    def achievements_claimed(self) -> list[Achievement]:
+        """Achievements claimed."""
+        return self._section("achievements_claimed", lambda data: [Achievement.from_string(a) for a in data["achievementsClaimed"]])
+
+    @property
+    def highest_round(self) -> int:
+        """Highest seen round."""
+        return self._data["highestSeenRound"]
+
+    @property
+    def daily_reward_count(self) -> int:
+        """Daily rewards claimed."""
+        return self._data["dailyRewardCount"]
+
+    @property
+    def total_daily_challenges_completed(self) -> int:
+        """Total Daily Challenges completed."""
+        return self._data["totalDailyChallengesCompleted"]
+
+    @property
+    def consecutive_daily_challenges_completed(self) -> int:
+        """Current number of consecutive days a Daily Challenge has been completed."""
+        return self._data["consecutiveDailyChallengesCompleted"]
+
+    @property
+    def total_races_entered(self) -> int:
+        """Total eaces entered."""
+        return self._data["totalRacesEntered"]
+
+    @property
+    def challenges_played(self) -> int:
+        """Total challenges played."""
+        return self._data["challengesPlayed"]
+
+    @property
+    def challenges_shared(self) -> int:
+        """Total challenges shared."""
+        return self._data["challengesShared"]
+
+    @property
+    def total_completed_odysseys(self) -> int:
+        """Total Odysseys completed."""
+        return self._data["totalCompletedOdysseys"]
+
+    @property
+    def unlocked_big_bloons(self) -> bool:
+        """Whether Big Bloons has been unlocked."""
+        return self._data["unlockedBigBloons"]
+
+    @property
+    def big_bloons_active(self) -> bool:
+        """Whether Big Bloons is active."""
+        return self._data["bigBloonsActive"]
+
+    @property
+    def unlocked_small_bloons(self) -> bool:
+        """Whether Small Bloons has been unlocked."""
+        return self._data["unlockedSmallBloons"]
+
+    @property
+    def small_bloons_active(self) -> bool:
+        """Whether Small Bloons is active."""
+        return self._data["smallBloonsActive"]
+
+    @property
+    def unlocked_big_towers(self) -> bool:
+        """Whether Big Towers has been unlocked."""
+        return self._data["seenBigTowers"]
+
+    @property
+    def big_towers_active(self) -> bool:
+        """Whether Big Towers is active."""
+        return self._data["bigTowersActive"]
+
+    @property
+    def unlocked_small_towers(self) -> bool:
+        """Whether Small Towers has been unlocked."""
+        return self._data["unlockedSmallTowers"]
+
+    @property
+    def small_towers_active(self) -> bool:
+        """Whether Small Towers is active."""
+        return self._data["smallTowersActive"]
+
+    @property
+    def named_monkeys(self) -> dict[Tower, str]:
+        """Named monkey names."""
+        return self._section("named_monkeys", lambda data: enum_any_dict(Tower, data["namedMonkeys"]))
+
+    @property
+    def collection_event_crates_opened(self) -> int:
+        """Number of ollect event crates opened."""
+        return self._data["collectionEventCratesOpened"]
+
+    @property
+    def continues_used(self) -> int:
+        """Continues used."""
+        return self._data["continuesUsed"]
+
+    @property
+    def trophy_store_items(self) -> TrophyStoreItemStatus:
+        """Trophy Store items purchased."""
+        return self._section("trophy_store_items", lambda data: TrophyStoreItemStatus.from_json(data["trophyStoreItems"]))
+
+    @property
+    def map_progress(self) -> dict[Map, MapProgress]:
+        """The player's map completions."""
+        return self._section("map_progress", lambda data: {
+            game_map: self.get_map_progress(game_map) for game_map in self._map_keys()
+        })
+
+    def get_map_progress(self, game_map: Map) -> MapProgress | None:
+        """
+        *New in 0.12.0*
+
+        Get the player's completions of a single map, without parsing the others.
+
+        :param game_map: The map to get the completions of.
+        :type game_map: ~bloonspy.model.btd6.Map
+
+        :return: The player's completions, or `None` if the map isn't in the save.
+        :rtype: ~bloonspy.model.btd6.MapProgress | None
+        """
+        raw_key = self._map_keys().get(game_map)
+        if raw_key is None:
+            return None
+        return self._section(
+            ("map_progress", game_map), lambda data: parse_map_completion(data["mapProgress"][raw_key])
+        )
+
+    def _map_keys(self) -> dict[Map, str]:
+        return self._section("map_keys", lambda data: {Map.from_string(key): key for key in data["mapProgress"]})
 
     def _handle_exception(self, exception: Exception) -> None:
         error_msg = str(exception)
@@ -75,7 +294,11 @@ class UserSave:
 
     @staticmethod
     @exception_handler(_handle_exception)
-    def fetch(oak: str, client: aiohttp.ClientSession | None = None) -> Awaitable["UserSave"] | "UserSave":
+    def fetch(
+            oak: str,
+            client: aiohttp.ClientSession | None = None,
+            transport: Transport | AsyncTransport | None = None,
+    ) -> Awaitable["UserSave"] | "UserSave":
         """
         Get an UserSave object through an OAK.
 
@@ -83,103 +306,70 @@ class UserSave:
         :type oak: str
         :param client: An aiohttp client session, if working in an asynchronous environment.
         :type client: aiohttp.ClientSession
+        :param transport: *New in 0.12.0*. The transport to make the request with.
+        :type transport: ~bloonspy.utils.api.Transport | ~bloonspy.utils.asyncapi.AsyncTransport
         :return: The UserSave belonging to the User who owns the OAK.
         :rtype: ~bloonspy.model.btd6.UserSave
 
         :raises bloonspy.exceptions.NotFound: If the player is not found.
         """
+        if transport is None:
+            transport = session_transport(client) if client else default_transport()
+
         async def async_fetch():
             return UserSave._parse_json(
-                await aget(client, "/btd6/save/{}".format(oak))
+                await transport.get("/btd6/save/{}".format(oak))
             )
         if client:
             return async_fetch()
-        return UserSave._parse_json(get("/btd6/save/{}".format(oak)))
+        return UserSave._parse_json(transport.get("/btd6/save/{}".format(oak)))
 
     @staticmethod
     def _parse_json(data: dict[str, Any]) -> "UserSave":
-        insta_monkeys = {}
-        for twr_name in data["instaTowers"]:
-            tower = Tower.from_string(twr_name)
-            insta_monkeys[tower] = {}
-            collection = data["instaTowers"][twr_name]
-            for path_key in collection:
-                path = path_key.replace("NaN", "0")
-                tp, mp, bp = int(path[0]), int(path[1]), int(path[2])
-                insta_monkey = InstaMonkey(tower, tp, mp, bp)
-                insta_monkeys[tower][insta_monkey] = collection[path_key]
-
-        def parse_map_completion(map_completion) -> MapProgress:
-            single_player = {}
-            coop = {}
-            for diff in map_completion["difficulty"]:
-                for mode in map_completion["difficulty"][diff]["single"]:
-                    gamemode = Gamemode.from_strings(diff, mode)
-                    if gamemode is None:
-                        continue
-                    single_player[gamemode] = GamemodeCompletionData(
-                        map_completion["difficulty"][diff]["single"][mode]["completed"],
-                        map_completion["difficulty"][diff]["single"][mode]["completedWithoutLoadingSave"],
-                        map_completion["difficulty"][diff]["single"][mode]["bestRound"],
-                        map_completion["difficulty"][diff]["single"][mode]["timesCompleted"],
-                    )
-
-                for mode in map_completion["difficulty"][diff]["coop"]:
-                    gamemode = Gamemode.from_strings(diff, mode)
-                    if gamemode is None:
-                        continue
-                    coop[gamemode] = GamemodeCompletionData(
-                        map_completion["difficulty"][diff]["coop"][mode]["completed"],
-                        map_completion["difficulty"][diff]["coop"][mode]["completedWithoutLoadingSave"],
-                        map_completion["difficulty"][diff]["coop"][mode]["bestRound"],
-                        map_completion["difficulty"][diff]["coop"][mode]["timesCompleted"],
-                    )
-            return MapProgress(map_completion["complete"], single_player, coop)
-
-        def parse_power_amount(pow_amt) -> PowerAmount:
-            return PowerAmount(pow_amt["quantity"], pow_amt["isNew"])
-
-        return UserSave(
-            GameVersion(*[int(ver) for ver in data["latestGameVersion"].split(".")]),
-            enum_any_dict(Tower, data["towerXP"]),
-            enum_any_dict(Upgrade, data["acquiredUpgrades"]),
-            enum_any_dict(MonkeyKnowledge, data["acquiredKnowledge"]),
-            enum_any_dict(Tower, data["unlockedTowers"]),
-            enum_any_dict(Tower, data["unlockedHeros"]),
-            enum_any_dict(HeroSkin, data["unlockedSkins"]),
-            data["gamesPlayed"],
-            enum_any_dict(Power, data["powers"], parse_raw=parse_power_amount),
-            insta_monkeys,
-            data["monkeyMoney"],
-            data["xp"],
-            data["rank"],
-            data["veteranXp"],
-            data["veteranRank"],
-            data["trophies"],
-            data["lifetimeTrophies"],
-            data["lifetimeTeamTrophies"],
-            data["knowledgePoints"],
-            Tower.from_string(data["primaryHero"]),
-            [Achievement.from_string(a) for a in data["achievementsClaimed"]],
-            data["highestSeenRound"],
-            data["dailyRewardCount"],
-            data["totalDailyChallengesCompleted"],
-            data["consecutiveDailyChallengesCompleted"],
-            data["totalRacesEntered"],
-            data["challengesPlayed"],
-            data["challengesShared"],
-            data["totalCompletedOdysseys"],
-            data["unlockedBigBloons"],
-            data["bigBloonsActive"],
-            data["unlockedSmallBloons"],
-            data["smallBloonsActive"],
-            data["seenBigTowers"],
-            data["bigTowersActive"],
-            data["unlockedSmallTowers"],
-            data["smallTowersActive"],
-            enum_any_dict(Tower, data["namedMonkeys"]),
-            data["collectionEventCratesOpened"],
-            data["continuesUsed"],
-            TrophyStoreItemStatus.from_json(data["trophyStoreItems"]),
-            enum_any_dict(Map, data["mapProgress"], parse_raw=parse_map_completion),
-        )
+        return UserSave(data)
+
+
+def parse_insta_monkeys(insta_towers: dict[str, dict[str, int]]) -> dict[Tower, dict[InstaMonkey, int]]:
+    insta_monkeys = {}
+    for twr_name in insta_towers:
+        tower = Tower.from_string(twr_name)
+        insta_monkeys[tower] = {}
+        collection = insta_towers[twr_name]
+        for path_key in collection:
+            path = path_key.replace("NaN", "0")
+            tp, mp, bp = int(path[0]), int(path[1]), int(path[2])
+            insta_monkey = insta_monkey_interner(tower, tp, mp, bp)
+            insta_monkeys[tower][insta_monkey] = collection[path_key]
+    return insta_monkeys
+
+
+def parse_map_completion(map_completion: dict[str, Any]) -> MapProgress:
+    single_player = {}
+    coop = {}
+    for diff in map_completion["difficulty"]:
+        for mode in map_completion["difficulty"][diff]["single"]:
+            gamemode = Gamemode.from_strings(diff, mode)
+            if gamemode is None:
+                continue
+            single_player[gamemode] = GamemodeCompletionData(
+                map_completion["difficulty"][diff]["single"][mode]["completed"],
+                map_completion["difficulty"][diff]["single"][mode]["completedWithoutLoadingSave"],
+                map_completion["difficulty"][diff]["single"][mode]["bestRound"],
+                map_completion["difficulty"][diff]["single"][mode]["timesCompleted"],
+            )
+
+        for mode in map_completion["difficulty"][diff]["coop"]:
+            gamemode = Gamemode.from_strings(diff, mode)
+            if gamemode is None:
+                continue
+            coop[gamemode] = GamemodeCompletionData(
+                map_completion["difficulty"][diff]["coop"][mode]["completed"],
+                map_completion["difficulty"][diff]["coop"][mode]["completedWithoutLoadingSave"],
+                map_completion["difficulty"][diff]["coop"][mode]["bestRound"],
+                map_completion["difficulty"][diff]["coop"][mode]["timesCompleted"],
+            )
+    return MapProgress(map_completion["complete"], single_player, coop)
+
+
+def parse_power_amount(pow_amt: dict[str, Any]) -> PowerAmount:
+    return power_amount_interner(pow_amt["quantity"], pow_amt["isNew"])
@@ -7,6 +7,7 @@ from .Medals import MapMedals, EventMedals, CtGlobalMedals, CtLocalMedals, \
 from .Odyssey import Odyssey, OdysseyDifficulty, OdysseyEvent
 from .Power import Power, PowerAmount
 from .Race import Race, RacePlayer
+from .Leaderboard import Leaderboard
 from .Restriction import Restriction, TowerRestriction
 from .Team import Team, TeamStatus
 from .Tower import Tower, HeroSkin
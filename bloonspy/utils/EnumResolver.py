@@ -0,0 +1,59 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Type
+
+
+class EnumResolver:
+    """
+    *New in 0.12.0*
+
+    Turns the strings the API uses into enum members with a single dictionary lookup.
+
+    The lookup table is built once, from the enum's values and from a dictionary of aliases.
+    Strings that aren't in the table are normalized and looked up again, and the result is
+    remembered, so every string seen more than once is resolved in a single lookup, even
+    unknown ones.
+
+    :param enum_cls: The enum whose members are resolved.
+    :type enum_cls: Type[Enum]
+    :param key: If given, every member is added to the table with `key(member.value)` as its key.
+    :type key: Callable[[Any], Any] | None
+    :param aliases: Strings mapped to members. They take precedence over the members' keys.
+    :type aliases: dict[str, Enum] | None
+    :param normalize: Applied to strings that aren't in the table before looking them up again.
+    :type normalize: Callable[[str], str] | None
+    :param max_memoized: How many strings missing from the table are remembered, at most.
+    :type max_memoized: int
+    """
+    def __init__(self,
+                 enum_cls: Type[Enum],
+                 key: Optional[Callable[[Any], Any]] = None,
+                 aliases: Optional[Dict[str, Enum]] = None,
+                 normalize: Optional[Callable[[str], str]] = None,
+                 max_memoized: int = 1024):
+        self._enum_cls = enum_cls
+        self._table = {}
+        if key is not None:
+            for member in enum_cls:
+                self._table[key(member.value)] = member
+        if aliases is not None:
+            self._table.update(aliases)
+        self._normalize = normalize
+        self._memoized = 0
+        self._max_memoized = max_memoized
+
+    def __call__(self, value: str) -> Optional[Enum]:
+        try:
+            return self._table[value]
+        except KeyError:
+            pass
+
+        member = None
+        if self._normalize is not None:
+            member = self._table.get(self._normalize(value))
+        if self._memoized < self._max_memoized:
+            self._memoized += 1
+            self._table[value] = member
+        return member
+
+    def __repr__(self) -> str:
+        return f"EnumResolver({self._enum_cls.__name__})"
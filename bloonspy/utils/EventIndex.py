@@ -0,0 +1,41 @@
+import threading
+import time
+from typing import Any
+
+
+class EventIndex:
+    """
+    *New in 0.12.0*
+
+    The latest fetched list of each event type, indexed by event ID, so events can be
+    looked up without fetching and scanning the whole list every time.
+
+    :param ttl: How long an event list is used for before being fetched again, in seconds.
+    :type ttl: float
+    """
+    def __init__(self, ttl: float = 60):
+        self._ttl = ttl
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """How long an event list is used for before being fetched again, in seconds."""
+        return self._ttl
+
+    def is_fresh(self, endpoint: str) -> bool:
+        """`True` if the list of events of an endpoint was fetched less than `ttl` seconds ago."""
+        snapshot = self._snapshots.get(endpoint)
+        return snapshot is not None and time.monotonic() - snapshot[0] < self._ttl
+
+    def update(self, endpoint: str, events: list[dict[str, Any]]) -> None:
+        """Replace the list of events of an endpoint."""
+        with self._lock:
+            self._snapshots[endpoint] = (time.monotonic(), {event["id"]: event for event in events})
+
+    def get(self, endpoint: str, event_id: str) -> dict[str, Any] | None:
+        """Get an event by its ID, or `None` if it's not in the list."""
+        snapshot = self._snapshots.get(endpoint)
+        if snapshot is None:
+            return None
+        return snapshot[1].get(event_id)
@@ -0,0 +1,48 @@
+import threading
+import weakref
+from typing import Any, Dict
+from .SharedLoad import SharedLoad
+
+
+class ResourceState:
+    """The loaded data of a resource, which can be shared by every object representing it.
+    Its lock is held while the resource is being loaded, so it's only loaded once at a time,
+    and asynchronous loads in flight are shared through `shared_load`.
+    """
+    __slots__ = ("data", "loaded", "lock", "shared_load", "__weakref__")
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.loaded: bool = False
+        self.lock = threading.RLock()
+        self.shared_load = SharedLoad()
+
+
+class IdentityMap:
+    """
+    *New in 0.12.0*
+
+    Makes every object representing the same resource share its loaded data, so a resource
+    loaded through one object is loaded for all of them. For example, a user who appears on several
+    leaderboards only needs their profile loaded once.
+
+    The data of a resource is only kept for as long as an object representing it exists.
+    """
+    def __init__(self):
+        self._states = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def state(self, key: str) -> ResourceState:
+        """Get the state shared by the objects representing a resource, creating it if needed.
+
+        :param key: The resource's endpoint.
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = ResourceState()
+                self._states[key] = state
+            return state
@@ -10,7 +10,16 @@ class Infinity:
        infinity = Infinity()
        print(infinity == Infinity)  # True
 
+
+    *Changed in 0.12.0:* There's only one instance, which every ``Infinity()`` returns.
     """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __str__(self):
         return "Inf"
 
@@ -19,3 +28,6 @@ class Infinity:
 
     def __eq__(self, other):
         return isinstance(other, Infinity) or other == Infinity
+
+    def __hash__(self):
+        return hash(Infinity)
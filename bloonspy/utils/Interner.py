@@ -0,0 +1,43 @@
+from typing import Any, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Interner(Generic[T]):
+    """
+    *New in 0.12.0*
+
+    Creates immutable value objects, returning the same instance every time it's called with
+    the same arguments. Objects built from repeated API values, like the gamemodes of every
+    map in a user's save, share a single instance this way instead of creating one each.
+
+    Objects that fail to be created aren't remembered, so an exception is raised every time.
+
+    :param factory: Creates the object from the arguments.
+    :type factory: Callable[..., T]
+    :param max_size: How many objects are remembered, at most. Once reached, new objects are
+        still created but no longer interned.
+    :type max_size: int
+    """
+    def __init__(self, factory: Callable[..., T], max_size: int = 4096):
+        self._factory = factory
+        self._instances: Dict[Tuple[Hashable, ...], T] = {}
+        self._max_size = max_size
+
+    def __call__(self, *args: Any) -> T:
+        try:
+            return self._instances[args]
+        except KeyError:
+            pass
+
+        instance = self._factory(*args)
+        if len(self._instances) < self._max_size:
+            instance = self._instances.setdefault(args, instance)
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __repr__(self) -> str:
+        return f"Interner({getattr(self._factory, '__name__', self._factory)})"
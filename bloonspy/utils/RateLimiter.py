@@ -0,0 +1,324 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Dict
+from .cache import endpoint_family
+
+
+class RateLimiter:
+    """
+    *New in 0.12.0*
+
+    Limits how many requests can be made per second and how many can be running at the same time.
+    When the API says it's being rate limited, it can also be paused so no request is made until
+    the rate limit expires.
+
+    A rate limiter is thread safe and can be shared between a :class:`~bloonspy.Client` and an
+    :class:`~bloonspy.AsyncClient`, so threads and tasks draw from the same budget. ::
+
+       limiter = RateLimiter(requests_per_second=10, max_concurrent=10)
+       client = Client(rate_limiter=limiter)
+       async_client = AsyncClient(session, rate_limiter=limiter)
+
+    Requests to each endpoint family (see :func:`~bloonspy.utils.cache.endpoint_family`) can also be limited
+    on their own, so that one kind of request can't take up every slot. For example, to keep a bot paging
+    through leaderboards from holding up user lookups: ::
+
+       limiter = RateLimiter(max_concurrent=20, family_limits={"leaderboards": 12})
+
+    :param requests_per_second: How many requests can be started every second. If `None`, there is no limit.
+    :type requests_per_second: float
+    :param max_concurrent: How many requests can be running at the same time.
+    :type max_concurrent: int
+    :param burst: How many requests can be started at once after a period of inactivity.
+        Defaults to `requests_per_second`.
+    :type burst: int
+    :param family_limits: How many requests to each endpoint family can be running at the same time,
+        by family name. They count towards `max_concurrent` too. Families not in it are only limited
+        by `max_concurrent`.
+    :type family_limits: dict[str, int]
+    """
+    def __init__(
+            self,
+            requests_per_second: float | None = None,
+            max_concurrent: int = 20,
+            burst: int | None = None,
+            family_limits: Dict[str, int] | None = None,
+    ):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if family_limits and min(family_limits.values()) < 1:
+            raise ValueError("family_limits must be at least 1")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self._rate = requests_per_second
+        self._capacity = burst if burst is not None else max(1.0, requests_per_second or 1.0)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._max_concurrent = max_concurrent
+        self._in_flight = 0
+        self._family_limits = dict(family_limits or {})
+        self._family_in_flight = dict.fromkeys(self._family_limits, 0)
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        self._waiters = deque()
+
+    @property
+    def requests_per_second(self) -> float | None:
+        """How many requests can be started every second."""
+        return self._rate
+
+    @property
+    def max_concurrent(self) -> int:
+        """How many requests can be running at the same time."""
+        return self._max_concurrent
+
+    @property
+    def family_limits(self) -> Dict[str, int]:
+        """How many requests to each endpoint family can be running at the same time."""
+        return dict(self._family_limits)
+
+    @property
+    def in_flight(self) -> int:
+        """How many requests are currently running."""
+        return self._in_flight
+
+    def family_in_flight(self, family: str) -> int:
+        """How many requests to an endpoint family with a limit are currently running.
+
+        :param family: The name of the family.
+        :type family: str
+        """
+        return self._family_in_flight.get(family, 0)
+
+    @property
+    def is_paused(self) -> bool:
+        """`True` if requests can't be made because the rate limiter was paused."""
+        return time.monotonic() < self._paused_until
+
+    def pause(self, seconds: float) -> None:
+        """Stop any request from starting for the given amount of time. Requests already
+        waiting for a slot resume once the pause is over.
+
+        If the rate limiter is already paused for longer, this does nothing.
+
+        :param seconds: How long to pause for.
+        :type seconds: float
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _limited_family(self, endpoint: str | None) -> str | None:
+        """The family of the endpoint, if it has a limit of its own."""
+        if not self._family_limits or endpoint is None:
+            return None
+        family = endpoint_family(endpoint)
+        return family if family in self._family_limits else None
+
+    def _try_acquire(self, family: str | None = None) -> float | None:
+        """Take a slot if one is available. Must be called while holding the condition's lock.
+
+        :return: `0` if a slot was taken, how long to wait before trying again if paused or
+            out of requests for this second, or `None` if a slot has to be released first.
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        if self._in_flight >= self._max_concurrent:
+            return None
+        if family is not None and self._family_in_flight[family] >= self._family_limits[family]:
+            return None
+
+        if self._rate is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+
+        self._in_flight += 1
+        if family is not None:
+            self._family_in_flight[family] += 1
+        return 0
+
+    def acquire(self, endpoint: str | None = None) -> None:
+        """Block until a request can be made.
+
+        :param endpoint: *New in 0.12.0*. The endpoint the request is made to, so its family's limit applies.
+        :type endpoint: str
+        """
+        family = self._limited_family(endpoint)
+        with self._condition:
+            while (wait := self._try_acquire(family)) != 0:
+                self._condition.wait(wait)
+
+    async def aacquire(self, endpoint: str | None = None) -> None:
+        """Wait until a request can be made without blocking the event loop.
+
+        :param endpoint: *New in 0.12.0*. The endpoint the request is made to, so its family's limit applies.
+        :type endpoint: str
+        """
+        family = self._limited_family(endpoint)
+        while True:
+            waiter = None
+            with self._condition:
+                wait = self._try_acquire(family)
+                if wait == 0:
+                    # Slots freed while paused are handed out once a request gets through
+                    if self._waiters:
+                        self._wake_waiters()
+                    return
+                if wait is None:
+                    waiter = _Waiter(asyncio.get_running_loop(), endpoint, family)
+                    self._waiters.append(waiter)
+            if waiter is None:
+                await asyncio.sleep(wait)
+                continue
+
+            try:
+                granted = await waiter.future
+            except asyncio.CancelledError:
+                # The slot might have been handed over right before being cancelled
+                if waiter.future.done() and not waiter.future.cancelled() and waiter.future.result():
+                    self.release(endpoint)
+                raise
+            if granted:
+                return
+
+    def release(self, endpoint: str | None = None) -> None:
+        """Free the slot taken by a finished request.
+
+        :param endpoint: *New in 0.12.0*. The endpoint given when the slot was taken.
+        :type endpoint: str
+        """
+        family = self._limited_family(endpoint)
+        with self._condition:
+            self._in_flight -= 1
+            if family is not None:
+                self._family_in_flight[family] -= 1
+            if self._waiters:
+                self._wake_waiters()
+            # Waiters might be held by different limits, so they're all woken up
+            self._condition.notify_all()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to the tasks waiting for one, in the order they started waiting.
+        Must be called while holding the condition's lock.
+        """
+        waiters = self._waiters
+        skipped = []
+        while waiters:
+            waiter = waiters[0]
+            if waiter.future.done() or waiter.loop.is_closed():
+                waiters.popleft()
+                continue
+            wait = self._try_acquire(waiter.family)
+            if wait is None:
+                if self._in_flight >= self._max_concurrent:
+                    break
+                # Only its family is full, so the tasks after it can still get a slot
+                skipped.append(waiters.popleft())
+                continue
+            waiters.popleft()
+            waiter.loop.call_soon_threadsafe(self._resolve, waiter, wait == 0)
+            if wait > 0:
+                # Paused or out of requests for this second: the task waits it out and tries again
+                break
+        waiters.extendleft(reversed(skipped))
+
+    def _resolve(self, waiter: "_Waiter", granted: bool) -> None:
+        if waiter.future.done():
+            # Cancelled before it could take the slot it was given
+            if granted:
+                self.release(waiter.endpoint)
+        else:
+            waiter.future.set_result(granted)
+
+    def slot(self, endpoint: str | None = None) -> "RateLimiterSlot":
+        """
+        *New in 0.12.0*
+
+        A slot for a request to an endpoint, to be taken with either ``with`` or ``async with``.
+        Unlike using the rate limiter itself, the limit of the endpoint's family applies.
+
+        :param endpoint: The endpoint the request is made to.
+        :type endpoint: str
+        """
+        return RateLimiterSlot(self, endpoint)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+
+class _Waiter:
+    """A task waiting for a slot of a :class:`RateLimiter` to be released."""
+    __slots__ = ("loop", "future", "endpoint", "family")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, endpoint: str | None, family: str | None):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.endpoint = endpoint
+        self.family = family
+
+
+class RateLimiterSlot:
+    """A slot of a :class:`RateLimiter` for a request to an endpoint."""
+    __slots__ = ("_limiter", "_endpoint")
+
+    def __init__(self, limiter: RateLimiter, endpoint: str | None):
+        self._limiter = limiter
+        self._endpoint = endpoint
+
+    def __enter__(self) -> "RateLimiterSlot":
+        self._limiter.acquire(self._endpoint)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._limiter.release(self._endpoint)
+
+    async def __aenter__(self) -> "RateLimiterSlot":
+        await self._limiter.aacquire(self._endpoint)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._limiter.release(self._endpoint)
+
+
+_default_rate_limiter = RateLimiter()
+_loop_rate_limiters = weakref.WeakKeyDictionary()
+_loop_rate_limiters_lock = threading.Lock()
+
+
+def default_rate_limiter() -> RateLimiter:
+    """The rate limiter shared by all clients that weren't given one."""
+    return _default_rate_limiter
+
+
+def loop_rate_limiter() -> RateLimiter:
+    """The rate limiter shared by the asynchronous clients that weren't given one and run on the
+    current event loop. Outside of an event loop, it's :func:`default_rate_limiter`.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _default_rate_limiter
+    with _loop_rate_limiters_lock:
+        limiter = _loop_rate_limiters.get(loop)
+        if limiter is None:
+            limiter = _loop_rate_limiters[loop] = RateLimiter()
+    return limiter
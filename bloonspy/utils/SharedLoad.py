@@ -0,0 +1,34 @@
+import asyncio
+from typing import Awaitable, Callable
+
+
+class SharedLoad:
+    """Runs an asynchronous load once at a time, sharing it with every task that
+    awaits it while it's in flight.
+
+    A task being cancelled while waiting doesn't cancel the load for the others.
+    Once the load is done, successfully or not, the next call starts a new one.
+    """
+    __slots__ = ("_task",)
+
+    def __init__(self):
+        self._task: asyncio.Future | None = None
+
+    async def run(self, load: Callable[[], Awaitable[None]]) -> None:
+        """Wait for the load in flight, or start one if there isn't any.
+
+        :param load: Starts the load, if needed.
+        """
+        task = self._task
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(load())
+            self._task = task
+            task.add_done_callback(self._on_done)
+        await asyncio.shield(task)
+
+    def _on_done(self, task: asyncio.Future) -> None:
+        if self._task is task:
+            self._task = None
+        if not task.cancelled():
+            # Retrieves the exception, in case every task waiting for it was cancelled
+            task.exception()
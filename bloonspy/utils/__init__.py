@@ -1 +1,5 @@
 from .Infinity import Infinity
+from .RateLimiter import RateLimiter
+from .IdentityMap import IdentityMap
+from .EnumResolver import EnumResolver
+from .Interner import Interner
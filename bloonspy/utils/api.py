@@ -1,33 +1,155 @@
 import requests
+import requests.adapters
 import threading
-import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import random
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Iterator, Iterable
 from ..exceptions import BloonsException, UnderMaintenance
+from .RateLimiter import RateLimiter, default_rate_limiter
+from .cache import ResponseCache
+from .EventIndex import EventIndex
+from .IdentityMap import IdentityMap
 import sys
 import http
 
 
 API_URL = "https://data.ninjakiwi.com"
+USER_AGENT = "bloonspy Python Library"
+LB_PAGE_SIZE = 50
 
-requests_semaphore = threading.Semaphore(20)
 
+class Transport:
+    """Makes requests to the Ninja Kiwi Open Data API over a persistent HTTP session,
+    so connections to the API are kept alive and reused between requests.
 
-def get(
-        endpoint: str,
-        params: Dict[str, Any] = None,
-        user_agent: str = "bloonspy Python Library",
-) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-    if "unittest" in sys.modules.keys():
-        print(f"GET {endpoint}, {params=}")
+    If a thread requests something another thread is already waiting for, it waits for the
+    same response instead of making another request.
+
+    :param pool_size: Maximum number of connections to keep open at the same time. Should match
+        the number of requests you expect to make concurrently.
+    :type pool_size: int
+    :param user_agent: The User Agent to send with every request.
+    :type user_agent: str
+    :param rate_limiter: Limits the requests made through this transport. If `None`, the
+        rate limiter shared by the whole library is used.
+    :type rate_limiter: ~bloonspy.utils.RateLimiter
+    :param cache: Where to cache responses. If `None`, responses aren't cached.
+    :type cache: ~bloonspy.utils.cache.ResponseCache
+    :param event_ttl: How long a list of events is used to look up events for, in seconds,
+        before being fetched again.
+    :type event_ttl: float
+    :param identity_map: Shares loaded data between the objects created through this transport
+        that represent the same user, team, challenge, or custom map. If `None`, data isn't shared.
+    :type identity_map: ~bloonspy.utils.IdentityMap
+    :param max_workers: How many threads can make requests in the background at the same time,
+        such as when fetching several pages at once. Defaults to `pool_size`.
+    :type max_workers: int
+    """
+    def __init__(
+            self,
+            pool_size: int = 10,
+            user_agent: str = USER_AGENT,
+            rate_limiter: RateLimiter | None = None,
+            cache: ResponseCache | None = None,
+            event_ttl: float = 60,
+            identity_map: IdentityMap | None = None,
+            max_workers: int | None = None,
+    ):
+        self._pool_size = pool_size
+        self._max_workers = max_workers if max_workers is not None else pool_size
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter()
+        self._cache = cache
+        self._event_index = EventIndex(event_ttl)
+        self._identity_map = identity_map
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = user_agent
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+
+    @property
+    def pool_size(self) -> int:
+        """Maximum number of connections kept open at the same time."""
+        return self._pool_size
+
+    @property
+    def max_workers(self) -> int:
+        """How many threads can make requests in the background at the same time."""
+        return self._max_workers
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool requests are made on when they're made in the background.
+        It's created the first time it's needed, and shut down by :func:`close`."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="bloonspy")
+            return self._executor
+
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        """Shares loaded data between objects representing the same resource, if set."""
+        return self._identity_map
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Limits the requests made through this transport."""
+        return self._rate_limiter
 
-    if params is None:
-        params = {}
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Where responses are cached, if anywhere."""
+        return self._cache
 
-    retries = 3
-    while retries > 0:
-        with requests_semaphore:
-            resp = requests.get(API_URL + endpoint, params=params, headers={"User-Agent": "bloonspy Python Library"})
+    def get(
+            self,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        if "unittest" in sys.modules.keys():
+            print(f"GET {endpoint}, {params=}")
+
+        if params is None:
+            params = {}
+
+        if self._cache is not None:
+            body = self._cache.get(endpoint, params)
+            if body is not None:
+                return body
+
+        key = ResponseCache.make_key(endpoint, params)
+        with self._pending_lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = Future()
+        if pending is not None:
+            return pending.result()
+
+        pending = self._pending[key]
+        try:
+            body = self._request(endpoint, params)
+            pending.set_result(body)
+            return body
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise exc
+        finally:
+            with self._pending_lock:
+                del self._pending[key]
+
+    def _request(
+            self,
+            endpoint: str,
+            params: Dict[str, Any],
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        retries = 3
+        while retries > 0:
+            with self._rate_limiter.slot(endpoint):
+                resp = self._session.get(API_URL + endpoint, params=params)
             check_response(resp.status_code, resp.headers.get("content-type").lower())
 
             if resp.status_code == 403 and "Retry-After" in resp.headers:
@@ -35,29 +157,164 @@ def get(
                 retries -= 1
                 if retries:
                     print(f"[bloonspy] Hit rate limit on {endpoint}. Retry after {retry_after}s")
-                time.sleep(retry_after)
+                # Pauses every request sharing the rate limiter, not just this one.
+                # The slot is released while waiting.
+                self._rate_limiter.pause(retry_after)
                 continue
 
             data = resp.json()
             if not data["success"]:
                 raise BloonsException(data.get("error", data.get("reason", "Unknown exception occurred")))
 
+            if self._cache is not None:
+                self._cache.set(endpoint, params, data["body"])
             return data["body"]
 
-    raise BloonsException(f"Request to {endpoint} failed")
+        raise BloonsException(f"Request to {endpoint} failed")
+
+    def get_lb_page(self, endpoint: str, page_num: int) -> List[Dict[str, Any]]:
+        try:
+            return self.get(endpoint, params={"page": page_num})
+        except BloonsException as exc:
+            if str(exc) == "No Scores Available":
+                return []
+            raise exc
+
+    def iter_lb_pages(
+            self,
+            endpoint: str,
+            start_from_page: int = 1,
+            pages: int | None = None,
+            read_ahead: int = 4,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch the pages of a leaderboard one after the other, in order, while fetching up
+        to `read_ahead` of the following pages in the background. Stops at the first empty page.
+
+        If the iteration is stopped early, pages that haven't started being fetched yet are
+        not fetched at all.
+
+        :param pages: How many pages to fetch at most. If `None`, fetches until the end of the leaderboard.
+        :param read_ahead: How many pages can be fetched at the same time.
+        """
+        end = None if pages is None else start_from_page + pages
+        next_page = start_from_page
+        queue = deque()
+        try:
+            while True:
+                while len(queue) < read_ahead and (end is None or next_page < end):
+                    queue.append(self.executor.submit(self.get_lb_page, endpoint, next_page))
+                    next_page += 1
+                if not queue:
+                    return
+                page = queue.popleft().result()
+                if not page:
+                    return
+                yield page
+        finally:
+            for future in queue:
+                future.cancel()
+
+    def get_all_lb_pages(
+            self,
+            endpoint: str,
+            total_scores: int,
+            start_from_page: int = 1,
+            max_concurrent: int = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Fetch every page of a leaderboard from `start_from_page` onwards.
+
+        The number of pages is worked out from `total_scores`. Since it can be out of date,
+        fetching stops at the first empty page, and carries on one page at a time
+        if the last expected page is full. `max_concurrent` defaults to the number of workers.
+        """
+        if max_concurrent is None:
+            max_concurrent = self.max_workers
+        expected = max(0, -(-total_scores // LB_PAGE_SIZE) - start_from_page + 1)
+        pages = []
+        if expected > 0:
+            pages = list(self.iter_lb_pages(endpoint, start_from_page, expected, read_ahead=max_concurrent))
+        if len(pages) == expected and (expected == 0 or len(pages[-1]) >= LB_PAGE_SIZE):
+            pages.extend(self.iter_lb_pages(endpoint, start_from_page + expected, read_ahead=1))
+        return pages
+
+    def get_events(self, endpoint: str) -> List[Dict[str, Any]]:
+        """Fetch a list of events, such as ``/btd6/races``, and index them by ID."""
+        events = self.get(endpoint)
+        self._event_index.update(endpoint, events)
+        return events
+
+    def get_event(self, endpoint: str, event_id: str, refresh: bool = False) -> Dict[str, Any] | None:
+        """Look up an event in the list of events of an endpoint. The list is only fetched
+        if it's older than `event_ttl`, if the event isn't in it, or if `refresh` is `True`.
+
+        :return: The event, or `None` if it isn't in the list.
+        """
+        if not refresh and self._event_index.is_fresh(endpoint):
+            event = self._event_index.get(endpoint, event_id)
+            if event is not None:
+                return event
+        self.get_events(endpoint)
+        return self._event_index.get(endpoint, event_id)
+
+    def get_lb_pages(self, endpoint: str, page_nums: Iterable[int]) -> List[List[Dict[str, Any]]]:
+        """Fetch several pages of a leaderboard at the same time."""
+        futures = [self.executor.submit(self.get_lb_page, endpoint, page_num) for page_num in page_nums]
+        return [page.result() for page in futures]
+
+    def close(self) -> None:
+        """Shut down the background threads and close all connections kept open by the transport."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+_default_transport = None
+_user_agent_transports: Dict[str, Transport] = {}
+_default_transport_lock = threading.Lock()
+
+
+def default_transport() -> Transport:
+    """The transport used by models that weren't created through a client."""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Transport()
+        return _default_transport
+
+
+def user_agent_transport(user_agent: str) -> Transport:
+    """The transport used by :func:`get` and :func:`get_lb_page` to send requests with a User Agent.
+    It's :func:`default_transport` for the library's own User Agent."""
+    if user_agent == USER_AGENT:
+        return default_transport()
+    with _default_transport_lock:
+        if user_agent not in _user_agent_transports:
+            _user_agent_transports[user_agent] = Transport(user_agent=user_agent)
+        return _user_agent_transports[user_agent]
+
+
+def get(
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        user_agent: str = USER_AGENT,
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    return user_agent_transport(user_agent).get(endpoint, params)
 
 
 def get_lb_page(
         endpoint: str,
         page_num: int,
-        user_agent: str = "bloonspy Python Library",
+        user_agent: str = USER_AGENT,
 ):
-    try:
-        return get(endpoint, params={"page": page_num}, user_agent=user_agent)
-    except BloonsException as exc:
-        if str(exc) == "No Scores Available":
-            return []
-        raise exc
+    return user_agent_transport(user_agent).get_lb_page(endpoint, page_num)
 
 
 def check_response(status: int, content_type: str) -> None:
@@ -1,54 +1,371 @@
 import asyncio
+import itertools
+import weakref
 import aiohttp
 import http
 import random
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator
 from ..exceptions import BloonsException
-from .api import API_URL, check_response
+from .api import API_URL, USER_AGENT, LB_PAGE_SIZE, check_response
+from .RateLimiter import RateLimiter, loop_rate_limiter
+from .cache import ResponseCache
+from .EventIndex import EventIndex
+from .IdentityMap import IdentityMap
 
 
-requests_semaphore = asyncio.Semaphore(20)
+def create_session(
+        pool_size: int = 20,
+        timeout: float = 30,
+        connect_timeout: float = 10,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30,
+) -> aiohttp.ClientSession:
+    """
+    *New in 0.12.0*
+
+    Create an aiohttp session tuned for the Ninja Kiwi Open Data API. Must be called
+    from a coroutine.
+
+    Every request goes to the same host, so the session keeps up to `pool_size` connections
+    to it alive between requests and caches its DNS lookups.
+
+    :param pool_size: Maximum number of connections to the API open at the same time. Should
+        match how many requests can be running at once.
+    :type pool_size: int
+    :param timeout: How long a request can take in total, in seconds.
+    :type timeout: float
+    :param connect_timeout: How long connecting to the API can take, in seconds.
+    :type connect_timeout: float
+    :param dns_ttl: How long DNS lookups are cached for, in seconds.
+    :type dns_ttl: int
+    :param keepalive_timeout: How long unused connections are kept open for, in seconds.
+    :type keepalive_timeout: float
+    """
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=pool_size,
+        ttl_dns_cache=dns_ttl,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout, connect=connect_timeout),
+    )
+
+
+class AsyncTransport:
+    """Makes requests to the Ninja Kiwi Open Data API through an aiohttp session.
+
+    If a task requests something another task is already waiting for, it waits for the
+    same response instead of making another request. A request is only cancelled once
+    every task waiting for it is.
+
+    :param client: The aiohttp session to make requests with. If `None`, the transport creates its own
+        with :func:`create_session` the first time it's needed, and closes it when
+        :func:`~bloonspy.utils.asyncapi.AsyncTransport.close` is called. A session passed to the transport
+        is only weakly referenced, so it must be kept alive by whoever created it.
+    :type client: aiohttp.ClientSession | None
+    :param user_agent: The User Agent to send with every request.
+    :type user_agent: str
+    :param rate_limiter: Limits the requests made through this transport. If `None`, the rate limiter
+        of the event loop it's used on is, which is shared by the transports on that loop without one.
+    :type rate_limiter: ~bloonspy.utils.RateLimiter
+    :param cache: Where to cache responses. If `None`, responses aren't cached.
+    :type cache: ~bloonspy.utils.cache.ResponseCache
+    :param event_ttl: How long a list of events is used to look up events for, in seconds,
+        before being fetched again.
+    :type event_ttl: float
+    :param identity_map: Shares loaded data between the objects created through this transport
+        that represent the same user, team, challenge, or custom map. If `None`, data isn't shared.
+    :type identity_map: ~bloonspy.utils.IdentityMap
+    :param pool_size: Maximum number of connections the transport's own session keeps open.
+        Defaults to the rate limiter's `max_concurrent`. Ignored if `client` is given.
+    :type pool_size: int
+    :param timeout: How long a request made through the transport's own session can take, in seconds.
+        Ignored if `client` is given.
+    :type timeout: float
+    """
+    def __init__(
+            self,
+            client: aiohttp.ClientSession | None,
+            user_agent: str = USER_AGENT,
+            rate_limiter: RateLimiter | None = None,
+            cache: ResponseCache | None = None,
+            event_ttl: float = 60,
+            identity_map: IdentityMap | None = None,
+            pool_size: int | None = None,
+            timeout: float = 30,
+    ):
+        # Sessions passed in are held weakly, so a transport cached for a session doesn't keep it alive
+        self._client = None
+        self._client_ref = weakref.ref(client) if client is not None else None
+        self._owns_client = client is None
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._user_agent = user_agent
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._event_index = EventIndex(event_ttl)
+        self._identity_map = identity_map
+        self._pending = {}
+        self._waiters = {}
+
+    @property
+    def client(self) -> aiohttp.ClientSession:
+        """The aiohttp session requests are made with. If the transport creates its own,
+        it's created the first time this is accessed."""
+        if not self._owns_client:
+            client = self._client_ref()
+            if client is None:
+                raise RuntimeError("The aiohttp session passed to the transport was garbage collected")
+            return client
+        if self._client is None or self._client.closed:
+            pool_size = self._pool_size if self._pool_size is not None else self.rate_limiter.max_concurrent
+            self._client = create_session(pool_size=pool_size, timeout=self._timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """
+        *New in 0.12.0*
+
+        Close the transport's session, if it created it. Sessions passed to it are left open.
+        """
+        if self._owns_client and self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        """Shares loaded data between objects representing the same resource, if set."""
+        return self._identity_map
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Limits the requests made through this transport. If it wasn't given one, it's the rate
+        limiter of the event loop it's used on."""
+        return self._rate_limiter if self._rate_limiter is not None else loop_rate_limiter()
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Where responses are cached, if anywhere."""
+        return self._cache
+
+    async def get(
+            self,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        if params is None:
+            params = {}
+
+        if self._cache is not None:
+            body = self._cache.get(endpoint, params)
+            if body is not None:
+                return body
+
+        key = ResponseCache.make_key(endpoint, params)
+        request = self._pending.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._request(endpoint, params))
+            self._pending[key] = request
+            request.add_done_callback(lambda _: self._pending.pop(key, None))
+            request.add_done_callback(lambda _: self._waiters.pop(request, None))
+            # Marks the exception as retrieved, in case every waiter was cancelled
+            request.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._waiters[request] = self._waiters.get(request, 0) + 1
+        try:
+            # Shielded so a cancelled waiter doesn't cancel the request for everyone else
+            return await asyncio.shield(request)
+        except asyncio.CancelledError:
+            if self._waiters.get(request) == 1:
+                request.cancel()
+            raise
+        finally:
+            if request in self._waiters:
+                self._waiters[request] -= 1
+
+    async def _request(
+            self,
+            endpoint: str,
+            params: Dict[str, Any],
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        rate_limiter = self.rate_limiter
+        retries = 3
+        while retries > 0:
+            retries -= 1
+            retry_after = None
+            async with rate_limiter.slot(endpoint):
+                async with self.client.get(
+                        API_URL + endpoint,
+                        params=params,
+                        headers={"User-Agent": self._user_agent},
+                ) as resp:
+                    check_response(resp.status, resp.headers.get("content-type").lower())
+                    if resp.status == http.HTTPStatus.FORBIDDEN and "Retry-After" in resp.headers:
+                        retry_after = max(1, int(resp.headers["Retry-After"])) + random.random()*3
+                    else:
+                        data = await resp.json()
+
+            if retry_after is not None:
+                if retries:
+                    print(f"[bloonspy] Hit rate limit on {endpoint}. Retry after {retry_after}s")
+                # Pauses every request sharing the rate limiter, not just this one.
+                # The slot is released while waiting.
+                rate_limiter.pause(retry_after)
+                continue
+
+            if not data["success"]:
+                raise BloonsException(data.get("error", data.get("reason", "Unknown exception occurred")))
+            if self._cache is not None:
+                self._cache.set(endpoint, params, data["body"])
+            return data["body"]
+
+        raise BloonsException(f"Request to {endpoint} failed")
+
+    async def get_lb_page(self, endpoint: str, page_num: int) -> list[dict[str, Any]]:
+        try:
+            return await self.get(endpoint, params={"page": page_num})
+        except BloonsException as exc:
+            if str(exc) == "No Scores Available":
+                return []
+            raise exc
+
+    def aiter_lb_pages(
+            self,
+            endpoint: str,
+            start_from_page: int = 1,
+            pages: int | None = None,
+            read_ahead: int = 4,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch the pages of a leaderboard one after the other, in order, while fetching up
+        to `read_ahead` of the following pages in the background. Stops at the first empty page.
+
+        If the iteration is stopped early, pages that haven't been fetched yet are cancelled.
+
+        :param pages: How many pages to fetch at most. If `None`, fetches until the end of the leaderboard.
+        :param read_ahead: How many pages can be fetched at the same time.
+        """
+        if pages is None:
+            page_nums = itertools.count(start_from_page)
+        else:
+            page_nums = iter(range(start_from_page, start_from_page + pages))
+        return self._aiter_pages(endpoint, page_nums, read_ahead)
+
+    async def _aiter_pages(
+            self,
+            endpoint: str,
+            page_nums: Iterator[int],
+            read_ahead: int,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        queue = deque()
+        try:
+            while True:
+                while len(queue) < read_ahead:
+                    page_num = next(page_nums, None)
+                    if page_num is None:
+                        break
+                    queue.append(asyncio.ensure_future(self.get_lb_page(endpoint, page_num)))
+                if not queue:
+                    return
+                page = await queue.popleft()
+                if not page:
+                    return
+                yield page
+        finally:
+            for task in queue:
+                if task.done() and not task.cancelled():
+                    task.exception()
+                task.cancel()
+
+    async def get_lb_pages(
+            self,
+            endpoint: str,
+            page_nums: Iterable[int],
+            max_concurrent: int = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch several pages of a leaderboard, in order, with at most `max_concurrent` being
+        fetched at the same time. Stops at the first empty page, cancelling the pages after it.
+        `max_concurrent` defaults to the rate limiter's.
+        """
+        if max_concurrent is None:
+            max_concurrent = self.rate_limiter.max_concurrent
+        return [page async for page in self._aiter_pages(endpoint, iter(page_nums), max_concurrent)]
+
+    async def get_all_lb_pages(
+            self,
+            endpoint: str,
+            total_scores: int,
+            start_from_page: int = 1,
+            max_concurrent: int = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch every page of a leaderboard from `start_from_page` onwards.
+
+        The number of pages is worked out from `total_scores`. Since it can be out of date,
+        fetching stops at the first empty page, and carries on one page at a time
+        if the last expected page is full. `max_concurrent` defaults to the rate limiter's.
+        """
+        if max_concurrent is None:
+            max_concurrent = self.rate_limiter.max_concurrent
+        expected = max(0, -(-total_scores // LB_PAGE_SIZE) - start_from_page + 1)
+        pages = []
+        if expected > 0:
+            pages = [
+                page async for page in
+                self.aiter_lb_pages(endpoint, start_from_page, expected, read_ahead=max_concurrent)
+            ]
+        if len(pages) == expected and (expected == 0 or len(pages[-1]) >= LB_PAGE_SIZE):
+            pages.extend([
+                page async for page in
+                self.aiter_lb_pages(endpoint, start_from_page + expected, read_ahead=1)
+            ])
+        return pages
+
+    async def get_events(self, endpoint: str) -> list[dict[str, Any]]:
+        """Fetch a list of events, such as ``/btd6/races``, and index them by ID."""
+        events = await self.get(endpoint)
+        self._event_index.update(endpoint, events)
+        return events
+
+    async def get_event(self, endpoint: str, event_id: str, refresh: bool = False) -> dict[str, Any] | None:
+        """Look up an event in the list of events of an endpoint. The list is only fetched
+        if it's older than `event_ttl`, if the event isn't in it, or if `refresh` is `True`.
+
+        :return: The event, or `None` if it isn't in the list.
+        """
+        if not refresh and self._event_index.is_fresh(endpoint):
+            event = self._event_index.get(endpoint, event_id)
+            if event is not None:
+                return event
+        await self.get_events(endpoint)
+        return self._event_index.get(endpoint, event_id)
+
+
+_session_transports = weakref.WeakKeyDictionary()
+
+
+def session_transport(client: aiohttp.ClientSession, user_agent: str = USER_AGENT) -> AsyncTransport:
+    """The transport used by models that weren't created through an
+    :class:`~bloonspy.AsyncClient` but were given an aiohttp session, and by :func:`aget`."""
+    transports = _session_transports.setdefault(client, {})
+    if user_agent not in transports:
+        transports[user_agent] = AsyncTransport(client, user_agent=user_agent)
+    return transports[user_agent]
 
 
 async def aget(
         client: aiohttp.ClientSession,
         endpoint: str,
         params: Dict[str, Any] = None,
-        user_agent: str = "bloonspy Python Library",
+        user_agent: str = USER_AGENT,
 ) -> list[dict[str, Any]] | dict[str, Any]:
-    if params is None:
-        params = {}
-
-    retries = 3
-    while retries > 0:
-        retries -= 1
-        async with requests_semaphore:
-            async with client.get(API_URL + endpoint, params=params, headers={"User-Agent": user_agent}) as resp:
-                check_response(resp.status, resp.headers.get("content-type").lower())
-                if resp.status == http.HTTPStatus.FORBIDDEN and "Retry-After" in resp.headers:
-                    retry_after = max(1, int(resp.headers["Retry-After"])) + random.random()*3
-                    if retries:
-                        print(f"[bloonspy] Hit rate limit on {endpoint}. Retry after {retry_after}s")
-                    await asyncio.sleep(retry_after)
-                    continue
-
-                data = await resp.json()
-                if not data["success"]:
-                    raise BloonsException(data.get("error", data.get("reason", "Unknown exception occurred")))
-                return data["body"]
-
-    raise BloonsException(f"Request to {endpoint} failed")
+    return await session_transport(client, user_agent).get(endpoint, params)
 
 
 async def aget_lb_page(
         client: aiohttp.ClientSession,
         endpoint: str,
         page_num: int,
-        user_agent: str = "bloonspy Python Library",
+        user_agent: str = USER_AGENT,
 ):
-    try:
-        return await aget(client, endpoint, params={"page": page_num}, user_agent=user_agent)
-    except BloonsException as exc:
-        if str(exc) == "No Scores Available":
-            return []
-        raise exc
+    return await session_transport(client, user_agent).get_lb_page(endpoint, page_num)
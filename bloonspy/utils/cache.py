@@ -0,0 +1,306 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+
+#: Default time-to-live, in seconds, of the cached responses of each endpoint family.
+DEFAULT_TTLS: Dict[str, float] = {
+    "events": 120,
+    "leaderboards": 60,
+    "users": 300,
+    "challenges": 600,
+    "guilds": 300,
+    "saves": 60,
+}
+
+endpoint_families = [
+    (re.compile(r"^/btd6/[^/]+/[^/]+/leaderboard"), "leaderboards"),
+    (re.compile(r"^/btd6/(races|bosses|ct|odyssey)(/|$)"), "events"),
+    (re.compile(r"^/btd6/users/"), "users"),
+    (re.compile(r"^/btd6/(challenges|maps)/"), "challenges"),
+    (re.compile(r"^/btd6/guild/"), "guilds"),
+    (re.compile(r"^/btd6/save/"), "saves"),
+]
+
+
+def endpoint_family(endpoint: str) -> str | None:
+    """The family an endpoint belongs to, or `None` if it doesn't belong to any.
+
+    - ``events``: Event lists and their details, such as ``/btd6/races`` or ``/btd6/bosses/{id}/metadata/standard``.
+    - ``leaderboards``: Leaderboard pages.
+    - ``users``: User profiles.
+    - ``challenges``: Challenges, custom maps, and their browsers.
+    - ``guilds``: Teams.
+    - ``saves``: User saves.
+    """
+    for pattern, family in endpoint_families:
+        if pattern.match(endpoint):
+            return family
+    return None
+
+
+class ResponseCache(ABC):
+    """
+    *New in 0.12.0*
+
+    Base class for caches of API responses. A cache can be passed to a :class:`~bloonspy.Client`
+    or an :class:`~bloonspy.AsyncClient`, and every response it gets will be cached for
+    as long as the endpoint's family allows it.
+
+    .. warning::
+       Cached responses are shared by everything that requests them, and shouldn't be modified.
+
+    :param ttls: How long responses of each endpoint family are cached for, in seconds.
+        Families that aren't specified use :data:`~bloonspy.utils.cache.DEFAULT_TTLS`. A TTL of `0`
+        disables caching for that family. For the families, see :func:`~bloonspy.utils.cache.endpoint_family`.
+    :type ttls: dict[str, float]
+    :param default_ttl: How long responses of endpoints that don't belong to any family are cached for.
+    :type default_ttl: float
+    """
+    def __init__(self, ttls: Dict[str, float] | None = None, default_ttl: float = 60):
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._default_ttl = default_ttl
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Number of requests answered by the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of requests the cache didn't have a response for."""
+        return self._misses
+
+    def ttl(self, endpoint: str) -> float:
+        """How long responses of an endpoint are cached for, in seconds."""
+        family = endpoint_family(endpoint)
+        if family is None:
+            return self._default_ttl
+        return self._ttls.get(family, self._default_ttl)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any] | None = None) -> str:
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def get(self, endpoint: str, params: Dict[str, Any] | None = None) -> Any | None:
+        """Get a cached response.
+
+        :return: The response's body, or `None` if it isn't cached or has expired.
+        """
+        if self.ttl(endpoint) <= 0:
+            return None
+        body = self._get(self.make_key(endpoint, params))
+        with self._stats_lock:
+            if body is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return body
+
+    def set(self, endpoint: str, params: Dict[str, Any] | None, body: Any) -> None:
+        """Cache a response."""
+        ttl = self.ttl(endpoint)
+        if ttl <= 0:
+            return
+        self._set(self.make_key(endpoint, params), body, time.time() + ttl)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response."""
+
+    @abstractmethod
+    def _get(self, key: str) -> Any | None:
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, body: Any, expires_at: float) -> None:
+        ...
+
+
+class MemoryCache(ResponseCache):
+    """
+    *New in 0.12.0*
+
+    Caches API responses in memory. Inherits from :class:`~bloonspy.utils.cache.ResponseCache`.
+
+    When full, the least recently used response is evicted.
+
+    :param max_entries: How many responses can be cached at the same time.
+    :type max_entries: int
+    """
+    def __init__(self, max_entries: int = 1024, **kwargs):
+        super().__init__(**kwargs)
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str) -> Any | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            body, expires_at = self._entries[key]
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def _set(self, key: str, body: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (body, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class SqliteCache(ResponseCache):
+    """
+    *New in 0.12.0*
+
+    Caches API responses in a SQLite database, so they survive restarts and can be shared by
+    several processes. Inherits from :class:`~bloonspy.utils.cache.ResponseCache`.
+
+    Responses are stored compressed. When the cache grows bigger than `max_size`, expired
+    responses are removed first, then the ones closest to expiring.
+
+    Responses are stored under a SHA-256 hash of their endpoint, so the OAKs in endpoints like
+    ``/btd6/users/{oak}`` aren't written to the file.
+
+    .. warning::
+       User saves aren't cached unless a TTL is given for the ``saves`` family. If one is, the
+       file contains the saves of every player whose OAK was used, and should be kept private.
+
+    .. note::
+       Reads and writes are quick, but they do block. In an asynchronous environment, they
+       run on the event loop.
+
+    :param path: The path of the database file. It's created if it doesn't exist.
+    :type path: str
+    :param max_size: Approximately how many bytes of compressed responses can be stored.
+    :type max_size: int
+    :param ttls: How long responses of each endpoint family are cached for, in seconds. Unlike the other
+        caches, the ``saves`` family isn't cached by default.
+    :type ttls: dict[str, float]
+    """
+    prune_interval: int = 64  #: How many responses are cached between checks on the cache's size.
+
+    def __init__(
+            self,
+            path: str,
+            max_size: int = 64 * 1024 * 1024,
+            ttls: Dict[str, float] | None = None,
+            **kwargs,
+    ):
+        super().__init__(ttls={"saves": 0, **(ttls or {})}, **kwargs)
+        self._path = path
+        self._max_size = max_size
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._writes = 0
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "  key TEXT PRIMARY KEY,"
+            "  body BLOB NOT NULL,"
+            "  size INTEGER NOT NULL,"
+            "  expires_at REAL NOT NULL"
+            ")"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses(expires_at)")
+        self.prune()
+
+    @property
+    def path(self) -> str:
+        """The path of the database file."""
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        # SQLite connections can't be shared between threads, nor survive a fork
+        pid, connection = getattr(self._local, "connection", (None, None))
+        if pid != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = (os.getpid(), connection)
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get(self, key: str) -> Any | None:
+        row = self._connection().execute(
+            "SELECT body FROM responses WHERE key = ? AND expires_at > ?",
+            (self._hash_key(key), time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def _set(self, key: str, body: Any, expires_at: float) -> None:
+        compressed = zlib.compress(json.dumps(body, separators=(",", ":")).encode())
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses (key, body, size, expires_at) VALUES (?, ?, ?, ?)",
+            (self._hash_key(key), compressed, len(compressed), expires_at),
+        )
+        self._writes += 1
+        if self._writes % self.prune_interval == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """Remove expired responses, and the ones closest to expiring if the cache is too big."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "  SELECT key FROM ("
+                "    SELECT key, SUM(size) OVER (ORDER BY expires_at DESC, key) AS kept FROM responses"
+                "  ) WHERE kept > ?"
+                ")",
+                (self._max_size,),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close every connection to the database."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
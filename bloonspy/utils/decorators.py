@@ -1,4 +1,5 @@
-from functools import wraps
+from functools import wraps, update_wrapper
+from types import MethodType
 from ..exceptions import NotLoaded
 
 
@@ -7,9 +8,12 @@ def fetch_property(loading_func: callable, should_load: callable = None):
         @wraps(wrapped)
         def wrapper(self, *args, **kwargs):
             if should_load is None or should_load(self):
-                if not self.loaded and self._async_client:
-                    raise NotLoaded()
-                loading_func(self)
+                if self._async_client:
+                    # Async resources must be awaited to load, so they can't be loaded here
+                    if not self.loaded:
+                        raise NotLoaded()
+                else:
+                    loading_func(self)
             return wrapped(self, *args, **kwargs)
         return wrapper
     return _decorator
@@ -25,3 +29,17 @@ def exception_handler(handler: callable) -> callable:
                 handler(self, exc)
         return wrapper
     return _decorator
+
+
+class client_method:
+    """Makes a method callable both on a client instance and on the client class itself.
+    When called on the class, the method is bound to the class' default instance.
+    """
+    def __init__(self, wrapped: callable):
+        self.__func__ = wrapped
+        update_wrapper(self, wrapped)
+
+    def __get__(self, instance, owner=None) -> callable:
+        if instance is None:
+            instance = owner.default()
+        return MethodType(self.__func__, instance)
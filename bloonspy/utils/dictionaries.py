@@ -1,21 +1,40 @@
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Tuple
+
+
+def compile_key_paths(keys: List[Tuple[str, str]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Make a function that copies values out of a dictionary under new keys.
+
+    Each key is a pair of a dotted path to a value, like ``"gameplay.cashEarned"``, and the key
+    to copy it to. Paths are split once here, so the returned function only indexes dictionaries.
+    Values that are missing or `None` are left out.
+    """
+    paths = [(new_key, tuple(old_key.split("."))) for old_key, new_key in keys]
+
+    def extract(dictionary: Dict[str, Any]) -> Dict[str, Any]:
+        new_dict = {}
+        for new_key, path in paths:
+            item = dictionary
+            for key in path:
+                item = item.get(key)
+                if item is None:
+                    break
+            if item is not None:
+                new_dict[new_key] = item
+        return new_dict
+
+    return extract
+
+
+@lru_cache(maxsize=64)
+def _compiled_key_paths(keys: Tuple[Tuple[str, str], ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    return compile_key_paths(list(keys))
 
 
 def rename_keys(dictionary: Dict[str, Any], keys: List[Tuple[str, str]]) -> Dict[str, Any]:
-    new_dict = {}
-    for old_key, new_key in keys:
-        item = dictionary
-        current_keys = old_key.split(".")
-        while len(current_keys) > 0:
-            key = current_keys.pop(0)
-            if key not in item:
-                item = None
-                break
-            item = item[key]
-        if item is not None:
-            new_dict[new_key] = item
-
-    return new_dict
+    """Copy values out of a dictionary under new keys. The compiled paths of each key list are
+    reused, but :func:`compile_key_paths` is faster for tables used often."""
+    return _compiled_key_paths(tuple(keys))(dictionary)
 
 
 def has_all_keys(dictionary: Dict[str, Any], key_list: List[str]):
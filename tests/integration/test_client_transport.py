@@ -0,0 +1,36 @@
+import unittest
+from bloonspy import btd6, Client
+
+
+class TestClientTransport(unittest.TestCase):
+    def test_client_instance(self) -> None:
+        """
+        Test that a client instance makes requests through its own transport.
+        """
+        with Client(pool_size=5) as client:
+            races = client.races()
+            self.assertGreater(len(races), 0)
+            race = races[0]
+            self.assertIs(race._transport, client._transport,
+                          msg="Assert if models use the transport of the client that created them")
+
+            race_leaderboard = race.leaderboard(pages=2)
+            self.assertGreater(len(race_leaderboard), 0)
+            for player in race_leaderboard:
+                self.assertIsInstance(player, btd6.RacePlayer,
+                                      msg="Assert if result is RacePlayer")
+                self.assertIs(player._transport, client._transport,
+                              msg="Assert if leaderboard players use the transport of the race")
+
+    def test_client_static(self) -> None:
+        """
+        Test that methods called on the class use the default client.
+        """
+        bosses = Client.bosses()
+        self.assertGreater(len(bosses), 0)
+        self.assertIs(bosses[0]._transport, Client.default()._transport,
+                      msg="Assert if static calls use the default client's transport")
+
+
+if __name__ == '__main__':
+    unittest.main()
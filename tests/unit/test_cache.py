@@ -0,0 +1,111 @@
+import unittest
+import os
+import tempfile
+import time
+from bloonspy.utils.cache import ResponseCache, MemoryCache, SqliteCache, endpoint_family
+
+
+class TestCache(unittest.TestCase):
+    def test_endpoint_family(self) -> None:
+        """
+        Test that endpoints are sorted in the correct family.
+        """
+        families = [
+            ("/btd6/bosses", "events"),
+            ("/btd6/races/Race_id/metadata", "events"),
+            ("/btd6/bosses/Boss_id/leaderboard/standard/1", "leaderboards"),
+            ("/btd6/ct/ct_id/leaderboard/team", "leaderboards"),
+            ("/btd6/users/user_id", "users"),
+            ("/btd6/challenges/filter/newest", "challenges"),
+            ("/btd6/maps/map/ABCDEFG", "challenges"),
+            ("/btd6/guild/guild_id", "guilds"),
+            ("/btd6/save/oak_id", "saves"),
+            ("/btd6/unknown", None),
+        ]
+        for endpoint, family in families:
+            self.assertEqual(endpoint_family(endpoint), family, msg=f"Assert if {endpoint} is in {family}")
+
+    def test_incomplete_cache(self) -> None:
+        """
+        Test that caches missing one of the methods to implement can't be created.
+        """
+        class IncompleteCache(ResponseCache):
+            def clear(self) -> None:
+                pass
+
+            def _get(self, key: str) -> None:
+                return None
+
+        with self.assertRaises(TypeError):
+            IncompleteCache()
+
+    def test_memory_cache(self) -> None:
+        """
+        Test that responses expire, are evicted when the cache is full, and are counted.
+        """
+        cache = MemoryCache(max_entries=2, ttls={"users": 0.1, "guilds": 0})
+        cache.set("/btd6/users/a", None, {"name": "a"})
+        cache.set("/btd6/guild/a", None, {"name": "a"})
+        self.assertEqual(cache.get("/btd6/users/a"), {"name": "a"})
+        self.assertIsNone(cache.get("/btd6/guild/a"), msg="Assert if a TTL of 0 disables caching")
+
+        cache.set("/btd6/races/a/leaderboard", {"page": 1}, [1])
+        cache.set("/btd6/races/a/leaderboard", {"page": 2}, [2])
+        self.assertIsNone(cache.get("/btd6/users/a"), msg="Assert if the least recently used response is evicted")
+        self.assertEqual(cache.get("/btd6/races/a/leaderboard", {"page": 1}), [1])
+        self.assertEqual(len(cache), 2)
+
+        cache.set("/btd6/users/b", None, {"name": "b"})
+        time.sleep(0.15)
+        self.assertIsNone(cache.get("/btd6/users/b"), msg="Assert if responses expire")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_sqlite_cache(self) -> None:
+        """
+        Test that responses are persisted, expire, and are evicted when the cache is too big.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = SqliteCache(path, ttls={"users": 0.1})
+            cache.set("/btd6/races", None, [{"id": "race"}])
+            cache.set("/btd6/users/a", None, {"name": "a"})
+            cache.close()
+
+            cache = SqliteCache(path, max_size=2000, ttls={"users": 0.1})
+            self.assertEqual(cache.get("/btd6/races"), [{"id": "race"}],
+                             msg="Assert if responses are kept between instances")
+            time.sleep(0.15)
+            self.assertIsNone(cache.get("/btd6/users/a"), msg="Assert if responses expire")
+
+            for page in range(50):
+                cache.set("/btd6/races/a/leaderboard", {"page": page}, [str(os.urandom(32))])
+            cache.prune()
+            self.assertLess(len(cache), 51, msg="Assert if responses are evicted when the cache is too big")
+            self.assertIsNotNone(cache.get("/btd6/races/a/leaderboard", {"page": 49}),
+                                 msg="Assert if the responses that expire last are kept")
+            cache.close()
+
+    def test_sqlite_cache_credentials(self) -> None:
+        """
+        Test that OAKs aren't written to the database, and saves are only cached if asked for.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = SqliteCache(path)
+            cache.set("/btd6/users/oak_secret", None, {"name": "a"})
+            cache.set("/btd6/save/oak_secret", None, {"xp": 1})
+            self.assertEqual(cache.get("/btd6/users/oak_secret"), {"name": "a"})
+            self.assertIsNone(cache.get("/btd6/save/oak_secret"), msg="Assert if saves are cached by default")
+            keys = [row[0] for row in cache._connection().execute("SELECT key FROM responses")]
+            self.assertEqual(len(keys), 1)
+            self.assertNotIn("oak_secret", keys[0], msg="Assert if keys are stored in plain text")
+            cache.close()
+
+            cache = SqliteCache(path, ttls={"saves": 60})
+            cache.set("/btd6/save/oak_secret", None, {"xp": 1})
+            self.assertEqual(cache.get("/btd6/save/oak_secret"), {"xp": 1})
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from bloonspy.utils.dictionaries import compile_key_paths, rename_keys, _compiled_key_paths
+
+
+class TestDictionaries(unittest.TestCase):
+    def test_compile_key_paths(self) -> None:
+        """
+        Test copying values out of nested dictionaries under new keys.
+        """
+        extract = compile_key_paths([
+            ("speed", "bloon_speed"),
+            ("health.moabs", "moab_health"),
+            ("health.boss", "boss_health"),
+            ("missing.key", "missing"),
+            ("empty", "empty"),
+        ])
+        raw = {"speed": 1.5, "health": {"moabs": 2.0}, "empty": None}
+        self.assertEqual(extract(raw), {"bloon_speed": 1.5, "moab_health": 2.0})
+        self.assertEqual(extract({}), {})
+        self.assertEqual(extract({"health": None}), {}, msg="Assert if None values are traversed")
+
+    def test_rename_keys(self) -> None:
+        """
+        Test that renaming keys with the same list of keys only compiles it once.
+        """
+        keys = [("speed", "bloon_speed"), ("health.moabs", "moab_health")]
+        _compiled_key_paths.cache_clear()
+        for _ in range(3):
+            self.assertEqual(rename_keys({"speed": 1.5, "health": {"moabs": 2.0}}, keys),
+                             {"bloon_speed": 1.5, "moab_health": 2.0})
+        self.assertEqual(_compiled_key_paths.cache_info().misses, 1, msg="Assert if keys are compiled every call")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from enum import Enum
+from bloonspy.utils import EnumResolver
+
+
+class Color(Enum):
+    LIGHT_BLUE = "Light Blue"
+    DARK_RED = "Dark Red"
+
+
+class TestEnumResolver(unittest.TestCase):
+    def test_resolve(self) -> None:
+        """
+        Test resolving values, aliases and normalized strings.
+        """
+        resolve = EnumResolver(
+            Color,
+            key=lambda value: value.replace(" ", ""),
+            aliases={"Cyan": Color.LIGHT_BLUE, "DarkRed": Color.LIGHT_BLUE},
+            normalize=lambda value: value.replace(" ", ""),
+        )
+        self.assertEqual(resolve("LightBlue"), Color.LIGHT_BLUE)
+        self.assertEqual(resolve("Light Blue"), Color.LIGHT_BLUE)
+        self.assertEqual(resolve("Cyan"), Color.LIGHT_BLUE)
+        self.assertEqual(resolve("Dark Red"), Color.LIGHT_BLUE, msg="Assert if aliases don't take precedence")
+        self.assertIsNone(resolve("Green"))
+
+        unkeyed = EnumResolver(Color, aliases={"Cyan": Color.LIGHT_BLUE})
+        self.assertIsNone(unkeyed("Light Blue"), msg="Assert if members are added without a key")
+
+    def test_memoization(self) -> None:
+        """
+        Test that strings missing from the table are remembered, up to a limit.
+        """
+        calls = []
+
+        def normalize(value: str) -> str:
+            calls.append(value)
+            return value.replace(" ", "")
+
+        resolve = EnumResolver(Color, key=lambda value: value.replace(" ", ""), normalize=normalize, max_memoized=2)
+        for _ in range(3):
+            self.assertEqual(resolve("Dark Red"), Color.DARK_RED)
+            self.assertIsNone(resolve("Green"))
+            self.assertIsNone(resolve("Blue"))
+        self.assertEqual(calls, ["Dark Red", "Green", "Blue", "Blue", "Blue"])
+
+
+if __name__ == '__main__':
+    unittest.main()
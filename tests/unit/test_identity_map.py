@@ -0,0 +1,64 @@
+import unittest
+import gc
+from typing import Any
+from bloonspy.model import Loadable
+from bloonspy.model.btd6 import User
+from bloonspy.utils import IdentityMap
+from bloonspy.utils.api import Transport
+
+
+class Resource(Loadable):
+    endpoint = "/resources/{}"
+    _identity_mapped = True
+
+    def _parse_json(self, raw_resource: dict[str, Any]) -> None:
+        self._data["value"] = raw_resource["value"]
+        self._loaded = True
+
+
+class ResourceTransport(Transport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = 0
+
+    def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests += 1
+        return {"value": endpoint}
+
+
+class TestIdentityMap(unittest.TestCase):
+    def test_shared_data(self) -> None:
+        """
+        Test that objects representing the same resource share their loaded data.
+        """
+        transport = ResourceTransport(identity_map=IdentityMap())
+        first = Resource("r0", transport=transport)
+        second = Resource("r0", transport=transport)
+        other = Resource("r1", transport=transport)
+
+        first.load_resource()
+        self.assertTrue(second.loaded, msg="Assert if data isn't shared between the same resources")
+        self.assertEqual(second._data["value"], "/resources/r0")
+        self.assertFalse(other.loaded, msg="Assert if data is shared between different resources")
+        second.load_resource()
+        self.assertEqual(transport.requests, 1)
+
+        unmapped = Resource("r0", transport=ResourceTransport())
+        self.assertFalse(unmapped.loaded, msg="Assert if data is shared without an identity map")
+
+    def test_no_leaks(self) -> None:
+        """
+        Test that the data of a resource is dropped once no object represents it anymore.
+        """
+        identity_map = IdentityMap()
+        transport = ResourceTransport(identity_map=identity_map)
+        users = [User(f"u{i}", transport=transport) for i in range(10)]
+        self.assertFalse(any(user.loaded for user in users))
+        self.assertEqual(len(identity_map), 10)
+        del users
+        gc.collect()
+        self.assertEqual(len(identity_map), 0, msg="Assert if the identity map keeps resources alive")
+
+
+if __name__ == '__main__':
+    unittest.main()
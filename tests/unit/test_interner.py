@@ -0,0 +1,45 @@
+import unittest
+import pickle
+from bloonspy.model.btd6 import Gamemode, Difficulty, Mode, InstaMonkey, Tower
+from bloonspy.model.btd6.Rewards import insta_monkey_interner
+from bloonspy.exceptions import InvalidTowerPath
+from bloonspy.utils import Interner, Infinity
+
+
+class TestInterner(unittest.TestCase):
+    def test_interning(self) -> None:
+        """
+        Test that the same arguments return the same instance, up to a limit.
+        """
+        intern = Interner(lambda *args: list(args), max_size=2)
+        self.assertIs(intern(1, 2), intern(1, 2))
+        self.assertIsNot(intern(1, 2), intern(2, 1))
+        self.assertEqual(len(intern), 2)
+        self.assertIsNot(intern(3), intern(3), msg="Assert if more objects than the limit are interned")
+        self.assertEqual(len(intern), 2)
+
+        self.assertRaises(InvalidTowerPath, insta_monkey_interner, Tower.DART_MONKEY, 3, 3, 3)
+        self.assertRaises(InvalidTowerPath, insta_monkey_interner, Tower.DART_MONKEY, 3, 3, 3)
+
+    def test_value_objects(self) -> None:
+        """
+        Test that shared value objects still behave like values.
+        """
+        chimps = Gamemode.from_strings("Hard", "Clicks")
+        self.assertIs(chimps, Gamemode.hard_modes()[-1])
+        self.assertEqual(chimps, Gamemode(Difficulty.HARD, Mode.CHIMPS))
+        self.assertEqual(hash(chimps), hash(Gamemode(Difficulty.HARD, Mode.CHIMPS)))
+        self.assertIsNone(Gamemode.from_strings("Hard", "Unknown"))
+
+        insta = insta_monkey_interner(Tower.DART_MONKEY, 0, 2, 5)
+        self.assertIs(insta, insta_monkey_interner(Tower.DART_MONKEY, 0, 2, 5))
+        self.assertEqual({InstaMonkey(Tower.DART_MONKEY, 0, 2, 5): 1}[insta], 1)
+        self.assertEqual(pickle.loads(pickle.dumps(insta)), insta)
+
+        self.assertIs(Infinity(), Infinity())
+        self.assertEqual(Infinity(), Infinity)
+        self.assertEqual({Infinity(): 1}[Infinity()], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
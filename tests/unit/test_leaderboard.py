@@ -0,0 +1,89 @@
+import unittest
+from bloonspy.model import Loadable
+from bloonspy.model.btd6 import Leaderboard, RacePlayer, CtTeam, User, Team
+from bloonspy.utils.api import Transport
+
+
+def make_page(page_num: int, size: int = 50) -> list[dict]:
+    first = (page_num-1) * 50
+    return [
+        {
+            "displayName": f"player{i}",
+            "score": 1000 + (i * 7) % 100,
+            "submissionTime": 1_700_000_000_000 + i,
+            "profile": f"https://data.ninjakiwi.com/btd6/users/u{i}",
+            "scoreParts": [
+                {"score": 1000 + (i * 7) % 100, "type": "time", "name": "Game Time"},
+                {"score": i, "type": "number", "name": "Tiers"},
+            ],
+        }
+        for i in range(first, first+size)
+    ]
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self) -> None:
+        transport = Transport()
+        self.leaderboard = Leaderboard(lambda *entry: RacePlayer(*entry, transport=transport))
+        for page_num in range(2, 5):
+            self.leaderboard.append_page(make_page(page_num, 50 if page_num < 4 else 20), page_num)
+
+    def test_entries(self) -> None:
+        """
+        Test that entries are built correctly from the columns.
+        """
+        self.assertEqual(len(self.leaderboard), 120)
+        self.assertEqual(list(self.leaderboard.ranks[:2]), [51, 52])
+        self.assertEqual(self.leaderboard.ranks[-1], 170)
+        player = self.leaderboard[-1]
+        self.assertIsInstance(player, RacePlayer)
+        self.assertEqual(player.id, "u169")
+        self.assertEqual(player.name, "player169")
+        self.assertEqual(len(player.score_parts), 2)
+        self.assertEqual(player.score_parts[1].value, 169)
+        self.assertRaises(IndexError, lambda: self.leaderboard[120])
+
+    def test_lazy_entries(self) -> None:
+        """
+        Test that entries don't set up their loaded data until it's needed, and resources still take attributes.
+        """
+        transport = Transport()
+        entries = [self.leaderboard[0], CtTeam("Team0", "Team 0 (disbanded)", 100, transport=transport)]
+        self.assertEqual(entries[1].name, "TEAM 0")
+        self.assertEqual(entries[1].full_name, "Team 0 (disbanded)")
+        for entry in entries:
+            self.assertRaises(AttributeError, Loadable._state.__get__, entry)
+
+        for resource in [User("User0", transport=transport), Team("Team0", transport=transport)]:
+            resource.note = "Custom attribute"
+            self.assertEqual(resource.note, "Custom attribute")
+
+    def test_slicing(self) -> None:
+        """
+        Test that slices keep their entries' data.
+        """
+        for index in [slice(10, 20), slice(None, None, -3), slice(100, None)]:
+            sliced = self.leaderboard[index]
+            expected = list(range(120))[index]
+            self.assertEqual(len(sliced), len(expected))
+            self.assertEqual(list(sliced.ranks), [51 + i for i in expected])
+            self.assertEqual([player.score_parts[1].value for player in sliced], [50 + i for i in expected])
+
+    def test_sort_and_percentile(self) -> None:
+        """
+        Test sorting by a column and getting percentiles of the scores.
+        """
+        scores = list(self.leaderboard.scores)
+        ranked = self.leaderboard.sort()
+        self.assertEqual(list(ranked.scores), sorted(scores))
+        self.assertEqual(list(self.leaderboard.sort(reverse=True).scores), sorted(scores, reverse=True))
+        self.assertEqual(ranked[0].score_parts[0].value.microseconds // 1000, ranked.scores[0] - 1000)
+        self.assertRaises(ValueError, self.leaderboard.sort, "name")
+
+        self.assertEqual(self.leaderboard.percentile(0), min(scores))
+        self.assertEqual(self.leaderboard.percentile(100), max(scores))
+        self.assertTrue(min(scores) <= self.leaderboard.percentile(50) <= max(scores))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import asyncio
+from typing import Any
+from bloonspy import Client, AsyncClient
+from bloonspy.exceptions import BloonsException
+from bloonspy.model import Loadable
+from bloonspy.model.btd6 import ChallengeFilter
+from bloonspy.utils import RateLimiter
+from bloonspy.utils.api import Transport
+from bloonspy.utils.asyncapi import AsyncTransport
+
+
+class Resource(Loadable):
+    endpoint = "/resources/{}"
+
+    def _parse_json(self, raw_resource: dict[str, Any]) -> None:
+        self._data["value"] = raw_resource["value"]
+        self._loaded = True
+
+
+class ResourceTransport(Transport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+
+    def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests.append(endpoint)
+        if endpoint.endswith("missing"):
+            raise BloonsException("No resource with that ID exists")
+        return {"value": endpoint}
+
+
+def challenge_json(challenge_id: str) -> dict[str, Any]:
+    return {
+        "name": challenge_id, "createdAt": 0, "creator": "/btd6/users/User0", "gameVersion": "40.0",
+        "map": "Logs", "mapURL": "", "difficulty": "Easy", "mode": "Standard", "seed": 0, "roundSets": ["default"],
+        "disableDoubleCash": False, "disableInstas": False, "disableMK": False, "disablePowers": False,
+        "disableSelling": False, "noContinues": False, "startingCash": 650, "lives": 200, "maxLives": 200,
+        "startRound": 1, "endRound": 40, "maxTowers": 9999, "maxParagons": 10, "leastCashUsed": -1,
+        "leastTiersUsed": -1, "plays": 0, "wins": 0, "losses": 0, "upvotes": 0, "playsUnique": 0,
+        "winsUnique": 0, "lossesUnique": 0, "restarts": 0, "_powers": [], "_towers": [],
+    }
+
+
+class AsyncResourceTransport(AsyncTransport):
+    def __init__(self, **kwargs):
+        super().__init__(None, **kwargs)
+        self.requests = []
+        self.running = 0
+        self.most_running = 0
+
+    async def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests.append(endpoint)
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if endpoint.startswith("/btd6/challenges/filter/"):
+            challenge_ids = ["Challenge0", "Challenge1", "Challenge2"]
+            if endpoint.endswith("trending"):
+                challenge_ids = ["missing", "Challenge1", "Challenge2"]
+            return [
+                {"id": challenge_id, "name": challenge_id, "createdAt": 0, "creator": "/btd6/users/User0"}
+                for challenge_id in challenge_ids
+            ]
+        if endpoint.endswith("missing"):
+            raise BloonsException("No resource with that ID exists")
+        if endpoint.startswith("/btd6/challenges/challenge/"):
+            return challenge_json(endpoint.split("/")[-1])
+        return {"value": endpoint}
+
+
+class TestLoadMany(unittest.TestCase):
+    def test_load_many(self) -> None:
+        """
+        Test that resources are loaded once each, and failures don't stop the other resources from loading.
+        """
+        transport = ResourceTransport()
+        client = Client(transport=transport)
+        resources = [Resource(f"r{i % 5}", transport=transport) for i in range(10)]
+        results = client.load_many(resources + [Resource("missing", transport=transport)], max_concurrent=2)
+
+        self.assertEqual(len(transport.requests), 6, msg="Assert if duplicates are loaded more than once")
+        self.assertEqual(results[:5], resources[:5])
+        self.assertIsInstance(results[5], BloonsException, msg="Assert if failures aren't reported")
+        for resource in resources:
+            self.assertTrue(resource.loaded, msg="Assert if duplicates aren't loaded")
+            self.assertEqual(resource._data["value"], f"/resources/{resource.id}")
+
+    def test_load_many_async(self) -> None:
+        """
+        Test that resources are loaded once each, and failures don't stop the other resources from loading.
+        """
+        async def main() -> None:
+            transport = AsyncResourceTransport()
+            client = AsyncClient(transport=transport)
+            trending = await client.challenges(ChallengeFilter.TRENDING)
+            newest = await client.challenges(ChallengeFilter.NEWEST)
+            transport.requests.clear()
+            results = await client.load_many(trending + newest)
+
+            self.assertEqual(len(transport.requests), 4, msg="Assert if duplicates are loaded more than once")
+            self.assertIsInstance(results[0], BloonsException, msg="Assert if failures aren't reported")
+            self.assertEqual(results[1:], [trending[1], trending[2], newest[0]])
+            self.assertTrue(all(challenge.loaded for challenge in trending[1:] + newest),
+                            msg="Assert if duplicates aren't loaded")
+            self.assertEqual(newest[1].starting_cash, 650)
+            await transport.close()
+
+        asyncio.run(main())
+
+    def test_load_many_async_concurrency(self) -> None:
+        """
+        Test that by default, as many resources load at the same time as the rate limiter allows.
+        """
+        async def main() -> None:
+            transport = AsyncResourceTransport(rate_limiter=RateLimiter(max_concurrent=3))
+            client = AsyncClient(transport=transport)
+            await client.load_many([Resource(f"r{i}", async_client=True, transport=transport) for i in range(10)])
+            self.assertEqual(transport.most_running, 3)
+            await transport.close()
+
+        asyncio.run(main())
+
+    def test_challenges_async(self) -> None:
+        """
+        Test that challenges returned by the async client are loaded through the client's transport.
+        """
+        async def main() -> None:
+            transport = AsyncResourceTransport()
+            client = AsyncClient(transport=transport)
+            challenges = await client.challenges(ChallengeFilter.NEWEST)
+            for challenge in challenges:
+                self.assertIs(challenge._transport, client._transport,
+                              msg="Assert if challenges don't use the client's transport")
+            transport.requests.clear()
+            await client.load_many(challenges)
+            self.assertEqual(transport.requests, [f"/btd6/challenges/challenge/Challenge{i}" for i in range(3)])
+            await transport.close()
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import asyncio
+import threading
+import time
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from bloonspy.model import Loadable
+from bloonspy.model.btd6 import Race
+from bloonspy.utils.api import Transport
+from bloonspy.utils.asyncapi import AsyncTransport
+
+
+class Resource(Loadable):
+    endpoint = "/resources/{}"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parses = 0
+
+    __slots__ = ("parses",)
+
+    def _parse_json(self, raw_resource: dict[str, Any]) -> None:
+        self.parses += 1
+        self._data["value"] = raw_resource["value"]
+        self._loaded = True
+
+
+class SlowTransport(Transport):
+    def __init__(self, failures: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        with self._lock:
+            self.requests += 1
+            failing = self.requests <= self.failures
+        time.sleep(0.05)
+        if failing:
+            raise ConnectionError("Request failed")
+        return {"value": endpoint}
+
+
+class SlowAsyncTransport(AsyncTransport):
+    def __init__(self, **kwargs):
+        super().__init__(None, **kwargs)
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        if endpoint == Race.event_endpoint:
+            return [{"id": "race0", "name": "Race", "start": 0, "end": 1000, "totalScores": 10}]
+        return {"value": endpoint}
+
+
+class CountingRace(Race):
+    def _parse_json(self, raw_challenge: dict[str, Any]) -> None:
+        self._data["value"] = raw_challenge["value"]
+        self._loaded = True
+
+
+class TestLoadOnce(unittest.TestCase):
+    def test_concurrent_loads(self) -> None:
+        """
+        Test that a resource accessed by many threads at once is only loaded once.
+        """
+        transport = SlowTransport()
+        resource = Resource("r0", transport=transport)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(8):
+                executor.submit(resource.load_resource)
+        self.assertTrue(resource.loaded)
+        self.assertEqual(transport.requests, 1)
+        self.assertEqual(resource.parses, 1, msg="Assert if threads waiting for the load load it again")
+
+    def test_retry_after_failure(self) -> None:
+        """
+        Test that a failed load isn't remembered, and the resource can be loaded again.
+        """
+        transport = SlowTransport(failures=1)
+        resource = Resource("r0", transport=transport)
+        self.assertRaises(ConnectionError, resource.load_resource)
+        self.assertFalse(resource.loaded)
+        resource.load_resource()
+        self.assertTrue(resource.loaded)
+        self.assertEqual(transport.requests, 2)
+
+    def test_concurrent_loads_async(self) -> None:
+        """
+        Test that tasks awaiting the same resource at once share a single load.
+        """
+        async def main() -> None:
+            transport = SlowAsyncTransport()
+            resource = Resource("r0", async_client=True, transport=transport)
+            await asyncio.gather(*[resource.load_resource() for _ in range(8)])
+            self.assertTrue(resource.loaded)
+            self.assertEqual(transport.requests, 1)
+            self.assertEqual(resource.parses, 1, msg="Assert if every task waiting for the load parses it")
+            await resource.load_resource()
+            self.assertEqual(transport.requests, 1, msg="Assert if loaded resources are loaded again")
+
+        asyncio.run(main())
+
+    def test_race_loads_concurrently(self) -> None:
+        """
+        Test that a race's metadata and its entry in the list of races are fetched at the same time.
+        """
+        async def main() -> None:
+            transport = SlowAsyncTransport()
+            race = CountingRace("race0", async_client=True, transport=transport)
+            await race.load_resource()
+            self.assertTrue(race.loaded)
+            self.assertEqual(race.name, "Race")
+            self.assertEqual(transport.requests, 2)
+            self.assertEqual(transport.max_in_flight, 2, msg="Assert if the requests are made one after the other")
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import copy
+import pickle
+from bloonspy.model import Event
+from bloonspy.model.btd6 import User, Race, RacePlayer
+from bloonspy.utils import IdentityMap
+from bloonspy.utils.api import Transport, default_transport
+from bloonspy.utils.asyncapi import AsyncTransport
+
+
+class TestPickle(unittest.TestCase):
+    def test_pickle_resources(self) -> None:
+        """
+        Test that resources keep their data when pickled or copied, and make requests through the default transport.
+        """
+        transport = Transport(identity_map=IdentityMap())
+        user = User("User0", transport=transport)
+        user._data["name"] = "User 0"
+        user._loaded = True
+        race = Race("Race0", race_json={"name": "Race 0", "start": 0, "end": 1000, "totalScores": 5},
+                    transport=transport)
+        player = RacePlayer("User1", "User 1", 1000, [{"type": "time", "name": "Game Time", "score": 1000}], 0,
+                            transport=transport)
+
+        for copied in [pickle.loads(pickle.dumps(user)), copy.deepcopy(user)]:
+            self.assertEqual(copied.id, "User0")
+            self.assertTrue(copied.loaded)
+            self.assertEqual(copied._data["name"], "User 0")
+            self.assertIs(copied._transport, default_transport())
+        copied = pickle.loads(pickle.dumps(race))
+        self.assertEqual(copied.name, "Race 0")
+        self.assertEqual(copied.total_scores, 5, msg="Assert if the race's event data isn't kept")
+        copied = pickle.loads(pickle.dumps(player))
+        self.assertEqual(copied.name, "User 1")
+        self.assertEqual(copied.score, player.score)
+        self.assertFalse(copied.loaded)
+        transport.close()
+
+    def test_pickle_event(self) -> None:
+        """
+        Test that events keep their data when pickled, and unpickled async events become non-async.
+        """
+        event = Event("Event0", event_json={"name": "Event 0", "start": 0, "end": 1000},
+                      async_client=True, transport=AsyncTransport(None))
+        for copied in [pickle.loads(pickle.dumps(event)), copy.deepcopy(event)]:
+            self.assertTrue(copied.loaded)
+            self.assertEqual(copied.name, "Event 0")
+            self.assertIsNone(copied._async_client)
+            self.assertIs(copied._transport, default_transport())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+import asyncio
+import threading
+import time
+from bloonspy.utils import RateLimiter
+from bloonspy.utils.RateLimiter import loop_rate_limiter, default_rate_limiter
+from bloonspy.utils.asyncapi import AsyncTransport
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_max_concurrent(self) -> None:
+        """
+        Test that no more than max_concurrent requests run at the same time.
+        """
+        limiter = RateLimiter(max_concurrent=3)
+        peak = 0
+        lock = threading.Lock()
+
+        def request() -> None:
+            nonlocal peak
+            with limiter:
+                with lock:
+                    peak = max(peak, limiter.in_flight)
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=request) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(peak, 3, msg="Assert if concurrent requests are capped")
+        self.assertEqual(limiter.in_flight, 0, msg="Assert if all slots are released")
+
+    def test_requests_per_second(self) -> None:
+        """
+        Test that requests are spread out according to the rate, and that threads and tasks share it.
+        """
+        limiter = RateLimiter(requests_per_second=50, burst=1)
+
+        async def async_requests() -> None:
+            for _ in range(5):
+                async with limiter:
+                    pass
+
+        start = time.monotonic()
+        thread = threading.Thread(target=lambda: asyncio.run(async_requests()))
+        thread.start()
+        for _ in range(5):
+            with limiter:
+                pass
+        thread.join()
+        # 10 requests at 50/s with a burst of 1 take at least 9/50 seconds
+        self.assertGreaterEqual(time.monotonic() - start, 0.17, msg="Assert if the rate is respected")
+
+    def test_pause(self) -> None:
+        """
+        Test that pausing the rate limiter stops every request until the pause is over.
+        """
+        limiter = RateLimiter(max_concurrent=2)
+        with limiter:
+            limiter.pause(0.2)
+        self.assertTrue(limiter.is_paused, msg="Assert if the limiter is paused")
+        self.assertEqual(limiter.in_flight, 0, msg="Assert if slots are free while paused")
+
+        start = time.monotonic()
+        waited = []
+
+        def request() -> None:
+            with limiter:
+                waited.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=request) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(waited), 4)
+        self.assertGreaterEqual(min(waited), 0.19, msg="Assert if requests wait for the pause to end")
+        self.assertFalse(limiter.is_paused)
+
+    def test_async_waiters(self) -> None:
+        """
+        Test that tasks waiting for a slot get it as soon as it's released, in the order they started waiting.
+        """
+        async def main() -> None:
+            limiter = RateLimiter(max_concurrent=10)
+            order = []
+
+            async def request(i: int) -> None:
+                async with limiter:
+                    order.append(i)
+                    await asyncio.sleep(0.005)
+
+            start = time.monotonic()
+            await asyncio.gather(*[request(i) for i in range(200)])
+            # 200 requests of 5ms, 10 at a time, take about 0.1 seconds without polling
+            self.assertLess(time.monotonic() - start, 0.5, msg="Assert if waiting tasks poll for slots")
+            self.assertEqual(order, list(range(200)), msg="Assert if slots aren't handed out in order")
+            self.assertEqual(limiter.in_flight, 0)
+
+        asyncio.run(main())
+
+    def test_cancel_async_waiter(self) -> None:
+        """
+        Test that a task cancelled while waiting for a slot doesn't keep it.
+        """
+        async def main() -> None:
+            limiter = RateLimiter(max_concurrent=1)
+            await limiter.aacquire()
+            waiter = asyncio.ensure_future(limiter.aacquire())
+            await asyncio.sleep(0.01)
+            limiter.release()
+            waiter.cancel()
+            await asyncio.sleep(0.01)
+            self.assertEqual(limiter.in_flight, 0, msg="Assert if a cancelled task keeps the slot it was given")
+            await asyncio.wait_for(limiter.aacquire(), 1)
+
+        asyncio.run(main())
+
+    def test_family_limits(self) -> None:
+        """
+        Test that requests to an endpoint family are capped on their own, without holding up other families.
+        """
+        limiter = RateLimiter(max_concurrent=4, family_limits={"leaderboards": 2})
+        peaks = {"leaderboards": 0, "total": 0}
+        lock = threading.Lock()
+
+        def request(endpoint: str) -> None:
+            with limiter.slot(endpoint):
+                with lock:
+                    peaks["leaderboards"] = max(peaks["leaderboards"], limiter.family_in_flight("leaderboards"))
+                    peaks["total"] = max(peaks["total"], limiter.in_flight)
+                time.sleep(0.02)
+
+        endpoints = ["/btd6/races/Race0/leaderboard"] * 8 + ["/btd6/users/u0"] * 4
+        threads = [threading.Thread(target=request, args=(endpoint,)) for endpoint in endpoints]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(peaks["leaderboards"], 2, msg="Assert if the family's requests are capped")
+        self.assertLessEqual(peaks["total"], 4, msg="Assert if the family's requests go over the total")
+        self.assertGreater(peaks["total"], 2, msg="Assert if other families are held up by a full family")
+        self.assertEqual(limiter.family_in_flight("leaderboards"), 0, msg="Assert if all slots are released")
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_loop_rate_limiter(self) -> None:
+        """
+        Test that async transports without a rate limiter share one per event loop.
+        """
+        async def get_limiters() -> tuple[RateLimiter, RateLimiter]:
+            return AsyncTransport(None).rate_limiter, AsyncTransport(None).rate_limiter
+
+        first, second = asyncio.run(get_limiters())
+        self.assertIs(first, second, msg="Assert if transports on the same loop don't share a rate limiter")
+        other, _ = asyncio.run(get_limiters())
+        self.assertIsNot(first, other, msg="Assert if transports on different loops share a rate limiter")
+        self.assertIsNot(first, default_rate_limiter())
+        self.assertIs(loop_rate_limiter(), default_rate_limiter(), msg="Assert if there's a loop limiter without a loop")
+
+
+if __name__ == '__main__':
+    unittest.main()
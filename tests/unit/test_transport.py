@@ -0,0 +1,248 @@
+import unittest
+import asyncio
+import gc
+import threading
+import weakref
+import time
+import aiohttp
+from typing import Any
+from bloonspy import AsyncClient
+from bloonspy.utils import RateLimiter
+from bloonspy.utils.api import Transport, USER_AGENT, default_transport, user_agent_transport
+from bloonspy.utils.asyncapi import AsyncTransport, session_transport, _session_transports
+
+
+class CountingTransport(Transport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = 0
+
+    def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests += 1
+        time.sleep(0.05)
+        if endpoint == "/btd6/races":
+            return [{"id": f"Race{i}", "name": f"Race {i}"} for i in range(5)]
+        if endpoint.endswith("/leaderboard"):
+            return [params["page"]] * 50 if params["page"] <= 10 else []
+        return {"endpoint": endpoint, **params}
+
+
+class CountingAsyncTransport(AsyncTransport):
+    def __init__(self, **kwargs):
+        super().__init__(None, **kwargs)
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, endpoint: str, params: dict[str, Any]) -> Any:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+        if endpoint.endswith("/leaderboard"):
+            return [params["page"]] * 50 if params["page"] <= 10 else []
+        return {"endpoint": endpoint, **params}
+
+
+class TestTransport(unittest.TestCase):
+    def test_coalesce_requests(self) -> None:
+        """
+        Test that identical requests made at the same time by different threads are made once.
+        """
+        transport = CountingTransport()
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(transport.get("/btd6/bosses", {"page": i % 2})))
+            for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(transport.requests, 2, msg="Assert if identical requests are made once")
+        self.assertEqual(len(results), 10)
+
+        transport.get("/btd6/bosses", {"page": 0})
+        self.assertEqual(transport.requests, 3, msg="Assert if finished requests aren't reused")
+
+    def test_coalesce_requests_async(self) -> None:
+        """
+        Test that identical requests made at the same time by different tasks are made once.
+        """
+        async def main() -> None:
+            transport = CountingAsyncTransport()
+            results = await asyncio.gather(*[transport.get("/btd6/races") for _ in range(10)])
+            self.assertEqual(transport.requests, 1, msg="Assert if identical requests are made once")
+            self.assertTrue(all(result is results[0] for result in results))
+
+        asyncio.run(main())
+
+    def test_cancel_request_async(self) -> None:
+        """
+        Test that a request is only cancelled once every task waiting for it is cancelled.
+        """
+        async def main() -> None:
+            transport = CountingAsyncTransport()
+            first = asyncio.ensure_future(transport.get("/btd6/races"))
+            second = asyncio.ensure_future(transport.get("/btd6/races"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            self.assertEqual(await second, {"endpoint": "/btd6/races"})
+
+            waiters = [asyncio.ensure_future(transport.get("/btd6/bosses")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.sleep(0.01)
+            self.assertEqual(transport.in_flight, 0, msg="Assert if requests nobody waits for keep running")
+
+        asyncio.run(main())
+
+    def test_event_index(self) -> None:
+        """
+        Test that events are looked up in the same list until it expires.
+        """
+        transport = CountingTransport(event_ttl=0.2)
+        for i in range(5):
+            self.assertEqual(transport.get_event("/btd6/races", f"Race{i}")["name"], f"Race {i}")
+        self.assertEqual(transport.requests, 1, msg="Assert if the event list is fetched once")
+
+        self.assertIsNone(transport.get_event("/btd6/races", "NotARace"))
+        self.assertEqual(transport.requests, 2, msg="Assert if missing events refresh the event list")
+
+        time.sleep(0.2)
+        transport.get_event("/btd6/races", "Race0")
+        self.assertEqual(transport.requests, 3, msg="Assert if expired event lists are fetched again")
+
+    def test_iter_lb_pages(self) -> None:
+        """
+        Test that leaderboard pages are iterated in order, fetching at most a few pages ahead.
+        """
+        transport = CountingTransport()
+        pages = transport.iter_lb_pages("/btd6/races/Race0/leaderboard", read_ahead=3)
+        self.assertEqual(next(pages)[0], 1)
+        self.assertEqual(next(pages)[0], 2)
+        pages.close()
+        self.assertLessEqual(transport.requests, 4, msg="Assert if pages are read ahead by at most read_ahead")
+
+        pages = list(transport.iter_lb_pages("/btd6/races/Race1/leaderboard", start_from_page=3))
+        self.assertEqual([page[0] for page in pages], list(range(3, 11)),
+                         msg="Assert if iteration doesn't stop at the first empty page")
+
+    def test_get_all_lb_pages(self) -> None:
+        """
+        Test that every page of a leaderboard is fetched, even if the total scores are out of date.
+        """
+        transport = CountingTransport()
+        for total_scores in [500, 100, 0, 5000]:
+            pages = transport.get_all_lb_pages(f"/btd6/races/Race{total_scores}/leaderboard", total_scores)
+            self.assertEqual([page[0] for page in pages], list(range(1, 11)),
+                             msg=f"Assert if pages are missing when total_scores is {total_scores}")
+
+        transport.requests = 0
+        transport.get_all_lb_pages("/btd6/races/Race/leaderboard", 10000, max_concurrent=5)
+        self.assertLessEqual(transport.requests, 15, msg="Assert if fetching doesn't stop at the first empty page")
+
+    def test_executor(self) -> None:
+        """
+        Test that pages are fetched on the transport's own thread pool, which is shut down on close.
+        """
+        transport = CountingTransport(max_workers=2)
+        pages = transport.get_lb_pages("/btd6/races/Race0/leaderboard", range(1, 6))
+        self.assertEqual([page[0] for page in pages], list(range(1, 6)))
+        executor = transport.executor
+        transport.get_lb_pages("/btd6/races/Race1/leaderboard", range(1, 6))
+        self.assertIs(transport.executor, executor, msg="Assert if the thread pool isn't reused")
+
+        transport.close()
+        self.assertRaises(RuntimeError, executor.submit, print)
+
+    def test_iter_lb_pages_async(self) -> None:
+        """
+        Test that leaderboard pages are iterated in order, fetching at most a few pages ahead.
+        """
+        async def main() -> None:
+            transport = CountingAsyncTransport()
+            pages = [page[0] async for page in transport.aiter_lb_pages("/btd6/races/Race0/leaderboard")]
+            self.assertEqual(pages, list(range(1, 11)))
+
+            transport.requests = 0
+            async for _ in transport.aiter_lb_pages("/btd6/races/Race1/leaderboard", read_ahead=2):
+                break
+            self.assertLessEqual(transport.requests, 2, msg="Assert if pages are read ahead by at most read_ahead")
+
+        asyncio.run(main())
+
+    def test_get_lb_pages_async(self) -> None:
+        """
+        Test that several pages are fetched in order, a few at a time, stopping at the first empty page.
+        """
+        async def main() -> None:
+            transport = CountingAsyncTransport()
+            pages = await transport.get_lb_pages("/btd6/races/Race0/leaderboard", range(1, 2001), max_concurrent=3)
+            self.assertEqual([page[0] for page in pages], list(range(1, 11)))
+            self.assertLessEqual(transport.max_in_flight, 3, msg="Assert if more than max_concurrent pages are fetched")
+            self.assertLessEqual(transport.requests, 13, msg="Assert if pages after the first empty one are fetched")
+            await asyncio.sleep(0.01)
+            self.assertEqual(transport.in_flight, 0, msg="Assert if pages after the first empty one aren't cancelled")
+
+        asyncio.run(main())
+
+    def test_user_agent(self) -> None:
+        """
+        Test that the request functions send requests with the User Agent they're given.
+        """
+        self.assertIs(user_agent_transport(USER_AGENT), default_transport())
+        transport = user_agent_transport("Test Agent")
+        self.assertEqual(transport._session.headers["User-Agent"], "Test Agent")
+        self.assertIs(user_agent_transport("Test Agent"), transport, msg="Assert if transports aren't reused")
+
+        async def main() -> None:
+            async with aiohttp.ClientSession() as session:
+                self.assertEqual(session_transport(session, "Test Agent")._user_agent, "Test Agent")
+                self.assertEqual(session_transport(session)._user_agent, USER_AGENT)
+
+        asyncio.run(main())
+
+    def test_session_collected(self) -> None:
+        """
+        Test that the transports made for a session don't keep it alive once it's closed.
+        """
+        async def main() -> None:
+            session = aiohttp.ClientSession()
+            session_transport(session)
+            session_transport(session, "Test Agent")
+            await session.close()
+            session_ref = weakref.ref(session)
+            del session
+            gc.collect()
+            self.assertIsNone(session_ref(), msg="Assert if closed sessions stay in memory")
+            self.assertEqual(len(_session_transports), 0)
+
+        asyncio.run(main())
+
+    def test_owned_session(self) -> None:
+        """
+        Test that an async client without a session creates its own, and only closes the sessions it created.
+        """
+        async def main() -> None:
+            async with AsyncClient(rate_limiter=RateLimiter(max_concurrent=7)) as client:
+                session = client.session
+                self.assertIs(client.session, session, msg="Assert if a session is created on every access")
+                self.assertEqual(session.connector.limit_per_host, 7,
+                                 msg="Assert if the connections don't match the concurrency budget")
+            self.assertTrue(session.closed)
+
+            async with aiohttp.ClientSession() as session:
+                async with AsyncClient(session) as client:
+                    self.assertIs(client.session, session)
+                self.assertFalse(session.closed, msg="Assert if sessions passed to the client are closed")
+
+        asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
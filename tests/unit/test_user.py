@@ -143,6 +143,33 @@ class TestUser(unittest.TestCase):
             correct_exception = True
         self.assertTrue(correct_exception, msg="Wrong user IDs should raise bloonspy.exceptions.NotFound")
 
+    def test_lazy_sections(self) -> None:
+        """
+        Test that medals, stats and heroes are only parsed when they're accessed, and only once.
+        """
+        raw_user = {
+            "displayName": "Player", "rank": 1, "veteranRank": 0, "achievements": 2, "followers": 3,
+            "avatar": "ProfileAvatar01", "avatarURL": "avatar", "banner": "TeamsBannerDeafult", "bannerURL": "banner",
+            "_medalsSinglePlayer": {"Easy": 4}, "_medalsMultiplayer": {}, "_medalsBoss": {}, "_medalsBossElite": {},
+            "_medalsRace": {"Bronze": 5}, "_medalsCTLocal": {}, "mostExperiencedMonkey": "DartMonkey",
+            "bloonsPopped": {"bloonsPopped": 6}, "gameplay": {"gameCount": 7}, "heroesPlaced": {"Quincy": 8},
+        }
+        user = btd6.User("user")
+        user._parse_json(raw_user)
+        self.assertEqual(user.name, "Player")
+        self.assertNotIn("stats", user._data, msg="Assert if sections are parsed before they're accessed")
+
+        self.assertEqual(user.single_player_medals.easy, 4)
+        self.assertEqual(user.race_medals.top_75_percent, 5)
+        self.assertEqual(user.stats.game_count, 7)
+        self.assertEqual(user.stats.bloons_popped.total, 6)
+        self.assertEqual(user.heroes_placed, {btd6.Tower.QUINCY: 8})
+        self.assertIs(user.stats, user.stats, msg="Assert if sections are parsed more than once")
+
+        raw_user["gameplay"] = {"gameCount": 9}
+        user._parse_json(raw_user)
+        self.assertEqual(user.stats.game_count, 9, msg="Assert if reloading keeps outdated sections")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from dataclasses import FrozenInstanceError
 from bloonspy import btd6
 from bloonspy.exceptions import NotFound
 
@@ -140,6 +141,42 @@ class TestUserSave(unittest.TestCase):
             correct_exception = True
         self.assertTrue(correct_exception, msg="Wrong OAKs should raise bloonspy.exceptions.NotFound")
 
+    def test_lazy_sections(self) -> None:
+        """
+        Test that a save is parsed one section at a time, and stays immutable.
+        """
+        completion = {"completed": True, "completedWithoutLoadingSave": False, "bestRound": 40, "timesCompleted": 1}
+        map_completion = {
+            "complete": True,
+            "difficulty": {"Easy": {"single": {"Standard": completion}, "coop": {}}},
+        }
+        raw_save = {
+            "monkeyMoney": 1000,
+            "rank": 155,
+            "instaTowers": {"DartMonkey": {"502": 1}},
+            "mapProgress": {"MonkeyMeadow": map_completion, "Logs": map_completion},
+        }
+        user_save = btd6.UserSave._parse_json(raw_save)
+        self.assertEqual(user_save.monkey_money, 1000)
+        self.assertEqual(user_save.rank, 155)
+
+        mm_progress = user_save.get_map_progress(btd6.Map.MONKEY_MEADOW)
+        easy = btd6.Gamemode(btd6.Difficulty.EASY, btd6.Mode.STANDARD)
+        self.assertEqual(mm_progress.single_player[easy].highest_round, 40)
+        self.assertIsNone(user_save.get_map_progress(btd6.Map.RAVINE))
+        self.assertNotIn(("map_progress", btd6.Map.LOGS), user_save._sections,
+                         msg="Assert if maps are parsed before they're accessed")
+        self.assertNotIn("insta_monkeys", user_save._sections,
+                         msg="Assert if sections are parsed before they're accessed")
+
+        self.assertEqual(set(user_save.map_progress), {btd6.Map.MONKEY_MEADOW, btd6.Map.LOGS})
+        self.assertIs(user_save.map_progress[btd6.Map.MONKEY_MEADOW], mm_progress)
+        self.assertEqual(user_save.insta_monkeys[btd6.Tower.DART_MONKEY],
+                         {btd6.InstaMonkey(btd6.Tower.DART_MONKEY, 5, 0, 2): 1})
+
+        with self.assertRaises(FrozenInstanceError):
+            user_save.rank = 1
+
 
 if __name__ == '__main__':
     unittest.main()